@@ -0,0 +1,29 @@
+"""Tooling for the skill catalog kept in README.md."""
+
+from catalog.parser import (
+    DEFAULT_README,
+    LINK_AUTHOR,
+    LINK_EXTERNAL,
+    LINK_KINDS,
+    LINK_SKILL,
+    REPO_ROOT,
+    Catalog,
+    Entry,
+    Section,
+    load,
+    parse,
+)
+
+__all__ = [
+    "DEFAULT_README",
+    "LINK_AUTHOR",
+    "LINK_EXTERNAL",
+    "LINK_KINDS",
+    "LINK_SKILL",
+    "REPO_ROOT",
+    "Catalog",
+    "Entry",
+    "Section",
+    "load",
+    "parse",
+]
@@ -0,0 +1,47 @@
+"""Command-line entry point: ``python -m catalog <command> [args...]``."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+COMMANDS = {
+    "parse": ("catalog.parser", "Parse README.md and print per-category counts"),
+    "snapshot": ("catalog.snapshot", "Build or query the memory-mapped catalog.bin snapshot"),
+    "search": ("catalog.search", "Full-text BM25 search over names and descriptions"),
+    "suggest": ("catalog.fuzzy", "Did-you-mean suggestions for a mistyped skill slug"),
+    "links": ("catalog.links", "Check every README link concurrently with pooled connections"),
+    "dupes": ("catalog.dedupe", "Find near-duplicate entries with MinHash and LSH"),
+    "render": ("catalog.render", "Render both READMEs from the canonical data/ catalog"),
+    "lint": ("catalog.lint", "Lint README entries against the CONTRIBUTING rules"),
+    "reconcile": ("catalog.reconcile", "Fix stale skill counts in the header, badge and ToC in place"),
+    "sqlite": ("catalog.sqlite", "Export the catalog to SQLite with an FTS5 index"),
+    "columns": ("catalog.columnar", "Build or query the columnar export (group-by counts)"),
+    "expand": ("catalog.expand", "List the skills inside author-folder entries from a local openclaw/skills clone"),
+    "harvest": ("catalog.harvest", "Propose full descriptions from SKILL.md frontmatter in a local clone"),
+    "server": ("catalog.server", "Serve name/category/search queries on a Unix socket (run, query)"),
+    "api": ("catalog.api", "Serve the catalog as an HTTP JSON API with ETags and cursor pagination"),
+    "pages": ("catalog.pages", "Write one markdown page per category into categories/"),
+    "site": ("catalog.site", "Build the static HTML site with a sharded search index"),
+    "sync": ("catalog.sync", "Apply README.md entry additions/removals to README_zh.md"),
+    "install": ("catalog.install", "Install the skills in a manifest concurrently from a mirror or registry"),
+    "store": ("catalog.store", "Inspect or garbage-collect the content-addressed skill store"),
+    "resolve": ("catalog.resolve", "Resolve installed skill names with Workspace > Local > Bundled priority"),
+    "skills": ("catalog.loader", "List installed skills from a persisted frontmatter-only index"),
+    "lock": ("catalog.lock", "Pin installed skills to tree hashes in skills.lock, or verify them"),
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help") or argv[0] not in COMMANDS:
+        print("usage: python -m catalog <command> [args...]\n\ncommands:")
+        for name, (_, help_text) in COMMANDS.items():
+            print(f"  {name:<12} {help_text}")
+        return 0 if argv and argv[0] in ("-h", "--help") else 2
+    module = importlib.import_module(COMMANDS[argv[0]][0])
+    return module.main(argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
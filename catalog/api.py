@@ -0,0 +1,264 @@
+"""Read-only HTTP JSON API over the parsed catalog.
+
+Endpoints (all ``GET``/``HEAD``)::
+
+    /categories                      every category with its entry count
+    /categories/<anchor>             skills of one category    (paginated)
+    /skills                          every skill               (paginated)
+    /skills/<author>                 skills of one author
+    /skills/<author>/<slug>          skills with that author and slug
+    /search?q=<query>&limit=<n>      BM25 full-text search
+
+Paginated endpoints take ``limit`` (default :data:`PAGE_SIZE`) and the opaque
+``cursor`` from the previous page's ``next``; a cursor issued for another
+version of the README is rejected with 410 so clients restart from page one.
+
+Every skill is encoded to JSON once when the README is loaded and pages are
+joined from those fragments. All responses carry a strong ``ETag`` derived
+from the README's sha256, and a request whose ``If-None-Match`` holds it is
+answered with ``304`` without a body once the path resolves. The README is
+re-parsed when it changes on disk into a new snapshot with its own search
+index (sharing unchanged segments), so a request always sees one version.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from catalog.parser import DEFAULT_README, Catalog, load
+from catalog.search import SearchIndex
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8377
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+RELOAD_INTERVAL = 1.0
+
+
+class ApiError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _json(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class _Snapshot:
+    """Everything derived from one version of the README."""
+
+    __slots__ = ("catalog", "etag", "search", "skills", "categories", "by_anchor", "by_author", "by_slug")
+
+    def __init__(self, catalog: Catalog, previous: _Snapshot | None = None) -> None:
+        self.catalog = catalog
+        self.etag = f'"{catalog.digest[:32]}"'
+        self.search = previous.search.updated(catalog) if previous else SearchIndex.build(catalog)
+        self.skills = [_json(entry.as_dict()) for entry in catalog]
+        self.categories = _json(
+            [
+                {"title": s.title, "anchor": s.anchor, "count": len(s), "href": f"/categories/{s.anchor}"}
+                for s in catalog.sections
+            ]
+        )
+        self.by_anchor = {s.anchor: s for s in catalog.sections}
+        self.by_author: dict[str, list[int]] = {}
+        self.by_slug: dict[tuple[str, str], list[int]] = {}
+        for entry in catalog:
+            author = entry.author
+            if author:
+                self.by_author.setdefault(author, []).append(entry.index)
+                self.by_slug.setdefault((author, entry.slug), []).append(entry.index)
+
+    def _cursor(self, position: int) -> str:
+        raw = f"{self.etag[1:9]}:{position}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def _position(self, cursor: str) -> int:
+        try:
+            version, _, position = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().partition(":")
+            position = int(position)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "malformed cursor") from None
+        if version != self.etag[1:9]:
+            raise ApiError(HTTPStatus.GONE, "cursor is from an older catalog; start again without it")
+        return position
+
+    def page(self, first: int, stop: int, query: dict[str, list[str]]) -> bytes:
+        """One page of the skills ``first:stop`` as ``{"items": [...], "next": cursor|null}``."""
+        limit = _int(query, "limit", PAGE_SIZE, MAX_PAGE_SIZE)
+        cursor = query.get("cursor", [""])[0]
+        start = self._position(cursor) if cursor else first
+        if not first <= start <= stop:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "cursor out of range")
+        end = min(start + limit, stop)
+        next_cursor = _json(self._cursor(end)) if end < stop else b"null"
+        total = str(stop - first).encode()
+        items = b",".join(self.skills[start:end])
+        return b'{"total":' + total + b',"items":[' + items + b'],"next":' + next_cursor + b"}"
+
+    def pick(self, indices: list[int]) -> bytes:
+        items = b",".join(self.skills[i] for i in indices)
+        return b'{"total":' + str(len(indices)).encode() + b',"items":[' + items + b"]}"
+
+
+def _int(query: dict[str, list[str]], name: str, default: int, maximum: int) -> int:
+    try:
+        value = int(query.get(name, [default])[0])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer") from None
+    if not 1 <= value <= maximum:
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{name} must be between 1 and {maximum}")
+    return value
+
+
+class Api:
+    """Routes requests against the current :class:`_Snapshot`, reloading it when the README changes."""
+
+    def __init__(self, readme: str | Path = DEFAULT_README) -> None:
+        self.readme = Path(readme)
+        self._lock = threading.Lock()
+        self._key: tuple[int, int] | None = None
+        self._checked = 0.0
+        self.snapshot = self._load(None)
+
+    def _load(self, previous: _Snapshot | None) -> _Snapshot:
+        stat = self.readme.stat()
+        self._key = (stat.st_mtime_ns, stat.st_size)
+        return _Snapshot(load(self.readme), previous)
+
+    def current(self) -> _Snapshot:
+        """The snapshot to answer from; :class:`ApiError` (503) while the README cannot be read."""
+        now = time.monotonic()
+        if now - self._checked >= RELOAD_INTERVAL:
+            with self._lock:
+                if now - self._checked >= RELOAD_INTERVAL:
+                    try:
+                        stat = self.readme.stat()
+                        if (stat.st_mtime_ns, stat.st_size) != self._key:
+                            self.snapshot = self._load(self.snapshot)
+                    except OSError as exc:
+                        # checked again on the next request, so the API recovers once the README is back
+                        raise ApiError(
+                            HTTPStatus.SERVICE_UNAVAILABLE, f"cannot read {self.readme.name}: {exc.strerror or exc}"
+                        ) from None
+                    self._checked = now
+        return self.snapshot
+
+    def route(self, snapshot: _Snapshot, path: str, query: dict[str, list[str]]) -> bytes:
+        parts = [unquote(part) for part in path.strip("/").split("/") if part]
+        if parts == ["categories"]:
+            return snapshot.categories
+        if len(parts) == 2 and parts[0] == "categories":
+            section = snapshot.by_anchor.get(parts[1])
+            if section is None:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"unknown category {parts[1]!r}")
+            return snapshot.page(section.first, section.stop, query)
+        if parts == ["skills"]:
+            return snapshot.page(0, len(snapshot.skills), query)
+        if len(parts) == 2 and parts[0] == "skills":
+            indices = snapshot.by_author.get(parts[1])
+            if indices is None:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"unknown author {parts[1]!r}")
+            return snapshot.pick(indices)
+        if len(parts) == 3 and parts[0] == "skills":
+            indices = snapshot.by_slug.get((parts[1], parts[2]))
+            if indices is None:
+                raise ApiError(HTTPStatus.NOT_FOUND, f"unknown skill {parts[1]}/{parts[2]}")
+            return snapshot.pick(indices)
+        if parts == ["search"]:
+            q = query.get("q", [""])[0]
+            if not q.strip():
+                raise ApiError(HTTPStatus.BAD_REQUEST, "missing q")
+            hits = snapshot.search.search(q, _int(query, "limit", 10, MAX_PAGE_SIZE))
+            return _json({"total": len(hits), "items": [hit.as_dict() for hit in hits]})
+        raise ApiError(HTTPStatus.NOT_FOUND, f"no route for {path}")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "catalog-api"
+    protocol_version = "HTTP/1.1"
+    api: Api
+
+    def _respond(self, send_body: bool) -> None:
+        url = urlsplit(self.path)
+        try:
+            snapshot = self.api.current()
+            headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+            body = self.api.route(snapshot, url.path, parse_qs(url.query))
+            status = HTTPStatus.OK
+            if snapshot.etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+                self._send(HTTPStatus.NOT_MODIFIED, headers, b"", False)
+                return
+        except ApiError as exc:
+            body = _json({"error": str(exc)})
+            status = exc.status
+            headers = {}
+        headers["Content-Type"] = "application/json; charset=utf-8"
+        self._send(status, headers, body, send_body)
+
+    def _send(self, status: HTTPStatus, headers: dict[str, str], body: bytes, send_body: bool) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._respond(True)
+
+    def do_HEAD(self) -> None:
+        self._respond(False)
+
+    def log_message(self, format: str, *args: object) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(
+    api: Api, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, verbose: bool = False
+) -> ThreadingHTTPServer:
+    handler = type("Handler", (_Handler,), {"api": api})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog api", description="Serve the catalog as a JSON API.")
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    api = Api(args.readme)
+    server = make_server(api, args.host, args.port, args.verbose)
+    elapsed = (time.perf_counter() - t0) * 1000
+    host, port = server.server_address[:2]
+    print(f"serving {len(api.snapshot.skills)} skills on http://{host}:{port}/ (ready in {elapsed:.0f} ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""Columnar export of the catalog for analytics (``catalog.columns``).
+
+Each field is stored as one contiguous column instead of one record per
+entry, Arrow-style:
+
+``name``, ``slug``, ``url``, ``description``
+    offset-encoded strings: ``rows + 1`` uint32 offsets into a UTF-8 blob
+``category``, ``author``, ``kind``
+    dictionary-encoded: one small integer code per row plus the dictionary
+    of distinct values (itself offset-encoded)
+``line``
+    plain uint32
+
+Layout (all integers little-endian, every buffer 8-byte aligned)::
+
+    header      magic, version, column count, row count, README sha256
+    directory   one record per column: name, encoding, typecode and the
+                (offset, length) of its data and auxiliary buffers
+    buffers     codes/values, offsets, string blobs
+
+:class:`Columns` maps the buffers as ``memoryview`` casts without copying.
+When NumPy is installed, :meth:`Columns.numpy` exposes them as arrays and
+:meth:`Columns.group_count` runs group-bys vectorized with ``bincount`` over
+the combined codes; without it the same queries fall back to ``Counter``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from catalog.parser import DEFAULT_README, LINK_KINDS, REPO_ROOT, Catalog, load
+
+try:
+    import numpy
+except ImportError:  # optional: only speeds up group_count and enables numpy()
+    numpy = None
+
+DEFAULT_COLUMNS = REPO_ROOT / "catalog.columns"
+
+MAGIC = b"CLAWCOL\0"
+VERSION = 1
+
+PLAIN = 0
+DICTIONARY = 1
+STRING = 2
+
+# magic, version, columns, rows, README digest
+_HEADER = struct.Struct("<8sHHI32s")
+# name, encoding, typecode, data (off, len), aux (off, len)
+_COLUMN = struct.Struct("<16sBc2xIIII")
+
+_DTYPES = {"B": "<u1", "H": "<u2", "I": "<u4"}
+_STRING_COLUMNS = ("name", "slug", "url", "description")
+
+
+class ColumnsError(ValueError):
+    """The file is not a readable columnar export."""
+
+
+def _little(values: array) -> bytes:
+    if sys.byteorder != "little" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _encode_strings(values: list[str]) -> tuple[bytes, bytes]:
+    """Return ``(blob, offsets)`` for an offset-encoded string column."""
+    blob = bytearray()
+    offsets = array("I", [0])
+    for value in values:
+        blob += value.encode()
+        offsets.append(len(blob))
+    return bytes(blob), _little(offsets)
+
+
+def _encode_dictionary(values: list[str], dictionary: list[str] | None = None) -> tuple[bytes, bytes, str]:
+    """Return ``(codes, encoded dictionary, typecode)``; the dictionary keeps first-seen order."""
+    index: dict[str, int] = {}
+    if dictionary is not None:
+        index = {value: i for i, value in enumerate(dictionary)}
+    codes = []
+    for value in values:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(index)
+        codes.append(code)
+    typecode = "B" if len(index) <= 0xFF else "H" if len(index) <= 0xFFFF else "I"
+    blob, offsets = _encode_strings(list(index))
+    encoded = struct.pack("<I", len(index)) + offsets + blob
+    return _little(array(typecode, codes)), encoded, typecode
+
+
+def build(catalog: Catalog) -> bytes:
+    """Serialize a parsed catalog into columnar bytes."""
+    rows = len(catalog)
+    entries = list(catalog)
+    # (name, encoding, typecode, data, aux)
+    columns: list[tuple[str, int, str, bytes, bytes]] = []
+    for field in _STRING_COLUMNS:
+        blob, offsets = _encode_strings([getattr(entry, field) for entry in entries])
+        columns.append((field, STRING, "I", blob, offsets))
+    titles = [section.title for section in catalog.sections]
+    codes, dictionary, typecode = _encode_dictionary([titles[catalog.category_of(i)] for i in range(rows)], titles)
+    columns.append(("category", DICTIONARY, typecode, codes, dictionary))
+    authors = catalog.authors
+    codes, dictionary, typecode = _encode_dictionary([authors[catalog.author_of(i)] for i in range(rows)], authors)
+    columns.append(("author", DICTIONARY, typecode, codes, dictionary))
+    kinds = [LINK_KINDS[catalog.kind_of(i)] for i in range(rows)]
+    codes, dictionary, typecode = _encode_dictionary(kinds, list(LINK_KINDS))
+    columns.append(("kind", DICTIONARY, typecode, codes, dictionary))
+    columns.append(("line", PLAIN, "I", _little(array("I", (catalog.line_of(i) for i in range(rows)))), b""))
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(columns), rows, bytes.fromhex(catalog.digest)))
+    directory_off = len(out)
+    out += bytes(_COLUMN.size * len(columns))
+    for n, (name, encoding, typecode, data, aux) in enumerate(columns):
+        refs = []
+        for buffer in (data, aux):
+            out += bytes(-len(out) % 8)
+            refs.extend((len(out), len(buffer)))
+            out += buffer
+        _COLUMN.pack_into(out, directory_off + n * _COLUMN.size, name.encode(), encoding, typecode.encode(), *refs)
+    return bytes(out)
+
+
+def write(catalog: Catalog, path: str | Path = DEFAULT_COLUMNS) -> Path:
+    """Write the export atomically (temp file + rename) and return its path."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(build(catalog))
+    os.replace(tmp, path)
+    return path
+
+
+class _Column:
+    __slots__ = ("name", "encoding", "typecode", "data", "aux")
+
+    def __init__(self, name: str, encoding: int, typecode: str, data: memoryview, aux: memoryview) -> None:
+        self.name = name
+        self.encoding = encoding
+        self.typecode = typecode
+        self.data = data
+        self.aux = aux
+
+
+def _cast(view: memoryview, typecode: str) -> memoryview | array:
+    if sys.byteorder == "little" or typecode == "B":
+        return view.cast(typecode)
+    values = array(typecode, view)
+    values.byteswap()
+    return values
+
+
+def _decode_strings(blob: memoryview, offsets) -> list[str]:
+    data = bytes(blob)
+    return [data[offsets[i] : offsets[i + 1]].decode() for i in range(len(offsets) - 1)]
+
+
+class Columns:
+    """Read-only columnar catalog; every column is a zero-copy view of the file."""
+
+    __slots__ = ("path", "digest", "rows", "_columns", "_dictionaries")
+
+    def __init__(self, path: str | Path = DEFAULT_COLUMNS) -> None:
+        self.path = Path(path)
+        raw = memoryview(self.path.read_bytes())
+        if len(raw) < _HEADER.size:
+            raise ColumnsError(f"{self.path}: truncated header")
+        magic, version, count, self.rows, self.digest = _HEADER.unpack_from(raw, 0)
+        if magic != MAGIC:
+            raise ColumnsError(f"{self.path}: not a columnar catalog export")
+        if version != VERSION:
+            raise ColumnsError(f"{self.path}: unsupported columns version {version}")
+        self._columns: dict[str, _Column] = {}
+        self._dictionaries: dict[str, list[str]] = {}
+        for n in range(count):
+            name, encoding, typecode, data_off, data_len, aux_off, aux_len = _COLUMN.unpack_from(
+                raw, _HEADER.size + n * _COLUMN.size
+            )
+            name = name.rstrip(b"\0").decode()
+            if max(data_off + data_len, aux_off + aux_len) > len(raw):
+                raise ColumnsError(f"{self.path}: truncated column {name!r}")
+            self._columns[name] = _Column(
+                name,
+                encoding,
+                typecode.decode(),
+                raw[data_off : data_off + data_len],
+                raw[aux_off : aux_off + aux_len],
+            )
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._columns)
+
+    def _column(self, name: str) -> _Column:
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"no column {name!r}; have {', '.join(self._columns)}") from None
+
+    def codes(self, name: str) -> memoryview | array:
+        """Dictionary codes of a dictionary column, or the values of a plain column."""
+        column = self._column(name)
+        if column.encoding == STRING:
+            raise TypeError(f"{name} is a string column; use values() or offsets()")
+        return _cast(column.data, column.typecode)
+
+    def dictionary(self, name: str) -> list[str]:
+        """Distinct values of a dictionary column, indexed by code."""
+        cached = self._dictionaries.get(name)
+        if cached is None:
+            column = self._column(name)
+            if column.encoding != DICTIONARY:
+                raise TypeError(f"{name} is not dictionary-encoded")
+            (count,) = struct.unpack_from("<I", column.aux, 0)
+            end = 4 + (count + 1) * 4
+            cached = self._dictionaries[name] = _decode_strings(column.aux[end:], _cast(column.aux[4:end], "I"))
+        return cached
+
+    def offsets(self, name: str) -> memoryview | array:
+        """The ``rows + 1`` offsets of a string column into its blob."""
+        column = self._column(name)
+        if column.encoding != STRING:
+            raise TypeError(f"{name} is not a string column")
+        return _cast(column.aux, "I")
+
+    def values(self, name: str) -> list:
+        """Decode a whole column into Python values."""
+        column = self._column(name)
+        if column.encoding == STRING:
+            return _decode_strings(column.data, self.offsets(name))
+        if column.encoding == DICTIONARY:
+            dictionary = self.dictionary(name)
+            return [dictionary[code] for code in self.codes(name)]
+        return list(self.codes(name))
+
+    def numpy(self, name: str):
+        """The codes (or plain values) of a column as a read-only NumPy array; needs NumPy."""
+        if numpy is None:
+            raise ImportError("numpy is required for Columns.numpy()")
+        column = self._column(name)
+        if column.encoding == STRING:
+            return numpy.frombuffer(column.aux, dtype="<u4")
+        return numpy.frombuffer(column.data, dtype=_DTYPES[column.typecode])
+
+    def group_count(self, *keys: str) -> dict[tuple[str, ...], int]:
+        """Rows per distinct combination of the dictionary columns ``keys``, largest first."""
+        if not keys:
+            raise ValueError("group_count needs at least one column")
+        dictionaries = [self.dictionary(key) for key in keys]
+        if numpy is not None:
+            combined = numpy.zeros(self.rows, dtype=numpy.int64)
+            for key, dictionary in zip(keys, dictionaries):
+                combined *= len(dictionary)
+                combined += self.numpy(key)
+            counts = numpy.bincount(combined)
+            groups = numpy.flatnonzero(counts)
+            order = groups[numpy.argsort(-counts[groups], kind="stable")]
+            sizes = [len(d) for d in dictionaries]
+            result = {}
+            for group, count in zip(order.tolist(), counts[order].tolist()):
+                parts = []
+                for size in reversed(sizes):
+                    group, code = divmod(group, size)
+                    parts.append(code)
+                result[tuple(d[c] for d, c in zip(dictionaries, reversed(parts)))] = count
+            return result
+        counter = Counter(zip(*(self.codes(key) for key in keys)))
+        return {
+            tuple(d[c] for d, c in zip(dictionaries, codes)): count for codes, count in counter.most_common()
+        }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog columns", description="Build or query the columnar catalog export."
+    )
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--columns", default=str(DEFAULT_COLUMNS))
+    sub = parser.add_subparsers(dest="action", required=True)
+    sub.add_parser("build", help="write catalog.columns from the README")
+    group = sub.add_parser("count", help="count skills per combination of columns")
+    group.add_argument("keys", nargs="+", choices=("category", "author", "kind"))
+    group.add_argument("-n", "--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.action == "build":
+        t0 = time.perf_counter()
+        path = write(load(args.readme), args.columns)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"wrote {path} ({path.stat().st_size / 1024:.0f} KiB) in {elapsed:.1f} ms")
+        return 0
+
+    try:
+        columns = Columns(args.columns)
+    except (OSError, ColumnsError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    t0 = time.perf_counter()
+    groups = columns.group_count(*args.keys)
+    elapsed = (time.perf_counter() - t0) * 1e6
+    for key, count in list(groups.items())[: args.limit]:
+        print(f"{count:>5}  " + "  ".join(part or "-" for part in key))
+    engine = "numpy" if numpy is not None else "python"
+    print(f"{len(groups)} groups over {len(columns)} rows in {elapsed:.0f} µs ({engine})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
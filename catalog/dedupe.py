@@ -0,0 +1,167 @@
+"""Near-duplicate detection with MinHash and locality-sensitive hashing.
+
+Each entry becomes a set of shingles: character trigrams of its name with
+punctuation removed (so ``codex-monitor`` and ``codexmonitor`` agree) plus
+the words and word pairs of its description. A MinHash signature of
+:data:`PERMUTATIONS` values summarizes each set; signatures are cut into
+:data:`BANDS` bands and entries that collide in any band become candidate
+pairs. Only candidates are compared exactly (Jaccard similarity of the
+shingle sets), so the pass stays near-linear in the number of entries
+instead of comparing every pair.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import struct
+import sys
+import time
+
+from catalog.parser import DEFAULT_README, Catalog, load
+from catalog.search import tokenize
+
+PERMUTATIONS = 32
+BANDS = 16
+THRESHOLD = 0.5
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def name_key(name: str) -> str:
+    """Name with case and punctuation removed: ``codex-monitor`` -> ``codexmonitor``."""
+    return _NON_ALNUM.sub("", name.lower())
+
+
+def shingles(name: str, description: str) -> set[str]:
+    compact = name_key(name)
+    grams = {"n:" + compact[i : i + 3] for i in range(max(len(compact) - 2, 1))}
+    words = tokenize(description)
+    grams.update("w:" + word for word in words)
+    grams.update(f"p:{a} {b}" for a, b in zip(words, words[1:]))
+    return grams
+
+
+class MinHasher:
+    """``permutations`` independent 32-bit hash functions over shingles.
+
+    The ``permutations`` hash values of a shingle are the words of one
+    SHAKE-128 digest of it, so a shingle costs a single C-level hash call.
+    Shingles repeat heavily across entries (common words, name fragments), so
+    the vector of every distinct shingle is also memoized; a signature is the
+    element-wise minimum of its shingles' vectors.
+    """
+
+    __slots__ = ("permutations", "_salt", "_unpack", "_vectors")
+
+    def __init__(self, permutations: int = PERMUTATIONS, seed: int = 1) -> None:
+        self.permutations = permutations
+        self._salt = seed.to_bytes(8, "little")
+        self._unpack = struct.Struct(f"<{permutations}I").unpack
+        self._vectors: dict[str, tuple[int, ...]] = {}
+
+    def _vector(self, item: str) -> tuple[int, ...]:
+        vector = self._vectors.get(item)
+        if vector is None:
+            digest = hashlib.shake_128(self._salt + item.encode()).digest(4 * self.permutations)
+            vector = self._vectors[item] = self._unpack(digest)
+        return vector
+
+    def signature(self, items: set[str]) -> tuple[int, ...]:
+        if not items:
+            return (0xFFFFFFFF,) * self.permutations
+        return tuple(map(min, zip(*map(self._vector, items))))
+
+
+def jaccard(a: set[str], b: set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def _pair_up(buckets: dict, pairs: set[tuple[int, int]]) -> None:
+    for members in buckets.values():
+        for x in range(len(members)):
+            for y in range(x + 1, len(members)):
+                pairs.add((members[x], members[y]))
+
+
+def candidate_pairs(signatures: list[tuple[int, ...]], bands: int = BANDS) -> set[tuple[int, int]]:
+    """Pairs of indices whose signatures agree on at least one whole band."""
+    rows = len(signatures[0]) // bands if signatures else 0
+    pairs: set[tuple[int, int]] = set()
+    for band in range(bands):
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        lo = band * rows
+        for i, signature in enumerate(signatures):
+            buckets.setdefault(signature[lo : lo + rows], []).append(i)
+        _pair_up(buckets, pairs)
+    return pairs
+
+
+def _find(parent: list[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_duplicates(catalog: Catalog, threshold: float = THRESHOLD) -> list[list[tuple[int, float]]]:
+    """Cluster entries whose shingle sets have Jaccard similarity ``>= threshold``.
+
+    Entries whose names differ only in case or punctuation are always paired,
+    whatever their descriptions say. Returns clusters of ``(entry index, best
+    similarity to another member)``, largest clusters first. Pairs below the
+    LSH detection curve can be missed; that is the price of not comparing all
+    pairs.
+    """
+    sets = [shingles(catalog.name_of(i), catalog.description_of(i)) for i in range(len(catalog))]
+    hasher = MinHasher()
+    signatures = [hasher.signature(s) for s in sets]
+    same_name: dict[str, list[int]] = {}
+    for i in range(len(catalog)):
+        same_name.setdefault(name_key(catalog.name_of(i)), []).append(i)
+    forced: set[tuple[int, int]] = set()
+    _pair_up(same_name, forced)
+
+    parent = list(range(len(sets)))
+    best: dict[int, float] = {}
+    for i, j in candidate_pairs(signatures) | forced:
+        score = jaccard(sets[i], sets[j])
+        if score < threshold and (i, j) not in forced:
+            continue
+        best[i] = max(best.get(i, 0.0), score)
+        best[j] = max(best.get(j, 0.0), score)
+        ri, rj = _find(parent, i), _find(parent, j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+    clusters: dict[int, list[tuple[int, float]]] = {}
+    for i in sorted(best):
+        clusters.setdefault(_find(parent, i), []).append((i, best[i]))
+    return sorted(clusters.values(), key=lambda c: (-len(c), c[0][0]))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog dupes", description="List near-duplicate skill entries.")
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("-t", "--threshold", type=float, default=THRESHOLD, help="minimum Jaccard similarity")
+    args = parser.parse_args(argv)
+
+    catalog = load(args.readme)
+    t0 = time.perf_counter()
+    clusters = find_duplicates(catalog, args.threshold)
+    elapsed = (time.perf_counter() - t0) * 1000
+    for cluster in clusters:
+        for index, score in cluster:
+            entry = catalog[index]
+            print(f"{score:.2f}  {entry.name:<36} {entry.category:<28} {entry.description}")
+        print()
+    members = sum(len(c) for c in clusters)
+    print(f"{len(clusters)} clusters, {members} entries, {elapsed:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Expand author-folder entries into the individual skills they contain.
+
+Some README entries link to an author folder (``skills/<author>``) instead of
+one skill, as CONTRIBUTING.md asks for authors with several skills. Given a
+local clone of openclaw/skills, :func:`expand` lists each such folder with
+one ``os.scandir`` and yields a :class:`ChildEntry` for every sub-folder that
+holds a ``SKILL.md``.
+
+The walk result is cached in ``expand-cache.json`` (git-ignored) keyed by
+the clone's ``HEAD`` commit, so later runs against the same commit never
+touch the tree; only authors missing from the cache are walked. A mirror that
+is not a git checkout is walked every time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+from catalog.parser import DEFAULT_README, LINK_AUTHOR, REPO_ROOT, Catalog, load
+
+DEFAULT_MIRROR = Path(os.environ.get("OPENCLAW_SKILLS", REPO_ROOT.parent / "skills"))
+DEFAULT_CACHE = REPO_ROOT / "expand-cache.json"
+
+SKILLS_TREE = "https://github.com/openclaw/skills/tree/main/"
+
+
+class ChildEntry:
+    """One skill inside an author folder that the README lists only as the folder."""
+
+    __slots__ = ("name", "author", "path", "parents")
+
+    def __init__(self, name: str, author: str, path: str, parents: list[int]) -> None:
+        self.name = name
+        self.author = author
+        self.path = path
+        # indices of the README entries that link to the author folder
+        self.parents = parents
+
+    @property
+    def url(self) -> str:
+        return SKILLS_TREE + self.path + "/SKILL.md"
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "author": self.author, "url": self.url, "path": self.path}
+
+    def __repr__(self) -> str:
+        return f"<ChildEntry {self.path!r}>"
+
+
+def tree_commit(mirror: str | Path) -> str | None:
+    """``HEAD`` commit of the clone at ``mirror``, or ``None`` if it is not a git checkout."""
+    git = Path(mirror) / ".git"
+    try:
+        head = (git / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head
+        ref = head[len("ref: ") :]
+        try:
+            return (git / ref).read_text().strip()
+        except FileNotFoundError:
+            with open(git / "packed-refs") as fh:
+                for line in fh:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha
+    except OSError:
+        pass
+    # worktrees, submodules and other layouts: let git resolve it
+    try:
+        out = subprocess.run(
+            ["git", "-C", str(mirror), "rev-parse", "HEAD"], check=True, capture_output=True, text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def walk_author(mirror: str | Path, author: str) -> list[str]:
+    """Sorted names of the skill folders (those with a ``SKILL.md``) under ``skills/<author>``."""
+    base = os.path.join(mirror, "skills", author)
+    names = []
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                    names.append(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    names.sort()
+    return names
+
+
+def _load_cache(path: Path, commit: str) -> dict[str, list[str]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("commit") != commit:
+        return {}
+    return data.get("authors", {})
+
+
+def _save_cache(path: Path, commit: str, authors: dict[str, list[str]]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"commit": commit, "authors": authors}, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def walk(
+    mirror: str | Path, authors: Iterable[str], cache_path: str | Path | None = DEFAULT_CACHE
+) -> dict[str, list[str]]:
+    """Skill folders of every author, reusing the cache when the mirror's commit matches."""
+    commit = tree_commit(mirror) if cache_path is not None else None
+    cached = _load_cache(Path(cache_path), commit) if commit else {}
+    result = {}
+    missing = False
+    for author in authors:
+        names = cached.get(author)
+        if names is None:
+            names = cached[author] = walk_author(mirror, author)
+            missing = True
+        result[author] = names
+    if commit and missing:
+        _save_cache(Path(cache_path), commit, cached)
+    return result
+
+
+def author_folders(catalog: Catalog) -> dict[str, list[int]]:
+    """Author name -> indices of the entries that link to that author's folder."""
+    folders: dict[str, list[int]] = {}
+    authors = catalog.authors
+    for i in range(len(catalog)):
+        if catalog.kind_of(i) == LINK_AUTHOR:
+            folders.setdefault(authors[catalog.author_of(i)], []).append(i)
+    return folders
+
+
+def expand(
+    catalog: Catalog, mirror: str | Path = DEFAULT_MIRROR, cache_path: str | Path | None = DEFAULT_CACHE
+) -> list[ChildEntry]:
+    """Virtual child entries for every author folder linked from ``catalog``."""
+    if not os.path.isdir(os.path.join(mirror, "skills")):
+        raise FileNotFoundError(f"{mirror}: no skills/ directory; clone openclaw/skills there")
+    folders = author_folders(catalog)
+    children = []
+    for author, names in walk(mirror, folders, cache_path).items():
+        parents = folders[author]
+        children.extend(ChildEntry(name, author, f"skills/{author}/{name}", parents) for name in names)
+    return children
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog expand", description="List the skills inside author-folder entries."
+    )
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--mirror", default=str(DEFAULT_MIRROR), help="local clone of openclaw/skills")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE))
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per skill")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    catalog = load(args.readme)
+    try:
+        children = expand(catalog, args.mirror, None if args.no_cache else args.cache)
+    except FileNotFoundError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    elapsed = (time.perf_counter() - t0) * 1000
+    for child in children:
+        if args.json:
+            print(json.dumps(child.as_dict(), ensure_ascii=False))
+        else:
+            listed = ", ".join(catalog.name_of(i) for i in child.parents)
+            print(f"{child.path:<60} via {listed}")
+    folders = len({child.author for child in children})
+    print(f"{len(children)} skills in {folders} author folders ({elapsed:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Trigram index for "did you mean" lookups of skill slugs.
+
+Every distinct ``[skill-name]`` is padded (``"  name "``) and split into
+character trigrams. A query gathers candidate names from the postings of its
+own trigrams and ranks them by Jaccard similarity of the trigram sets, so only
+names sharing at least one trigram are ever scored.
+
+The index can be persisted to a small binary file and loaded again without
+touching README.md; the file records the README digest so a stale index is
+rebuilt instead of trusted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from catalog.parser import DEFAULT_README, REPO_ROOT, Catalog, load
+from catalog.snapshot import readme_digest
+
+DEFAULT_INDEX = REPO_ROOT / "catalog-trigrams.bin"
+
+MAGIC = b"CLAWTRI\0"
+VERSION = 1
+# magic, version, reserved, README sha256, names, trigrams, names blob, keys blob
+_HEADER = struct.Struct("<8sHH32sIIII")
+
+MIN_SIMILARITY = 0.3
+
+
+def trigrams(text: str) -> set[str]:
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _little(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+class TrigramIndex:
+    """Trigram postings over the distinct skill names of a catalog."""
+
+    __slots__ = ("names", "digest", "_sizes", "_postings", "_lookup")
+
+    def __init__(
+        self, names: list[str], digest: bytes, sizes: array, keys: list[str], offsets: array, postings: array
+    ) -> None:
+        self.names = names
+        self.digest = digest
+        self._sizes = sizes
+        self._postings = postings
+        self._lookup = {key: (offsets[i], offsets[i + 1]) for i, key in enumerate(keys)}
+
+    @classmethod
+    def build(cls, catalog: Catalog) -> TrigramIndex:
+        names = sorted({catalog.name_of(i) for i in range(len(catalog))})
+        table: dict[str, list[int]] = {}
+        sizes = array("H")
+        for ident, name in enumerate(names):
+            grams = trigrams(name)
+            sizes.append(len(grams))
+            for gram in grams:
+                table.setdefault(gram, []).append(ident)
+        keys = sorted(table)
+        offsets = array("I", [0])
+        postings = array("I")
+        for key in keys:
+            postings.extend(table[key])
+            offsets.append(len(postings))
+        return cls(names, bytes.fromhex(catalog.digest), sizes, keys, offsets, postings)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def suggest(self, query: str, limit: int = 5, threshold: float = MIN_SIMILARITY) -> list[tuple[float, str]]:
+        """Return up to ``limit`` ``(similarity, name)`` pairs, best first."""
+        grams = trigrams(query)
+        shared: dict[int, int] = {}
+        postings = self._postings
+        for gram in grams:
+            span = self._lookup.get(gram)
+            if span is None:
+                continue
+            for ident in postings[span[0] : span[1]]:
+                shared[ident] = shared.get(ident, 0) + 1
+        size = len(grams)
+        sizes = self._sizes
+        ranked = []
+        for ident, common in shared.items():
+            score = common / (size + sizes[ident] - common)
+            if score >= threshold:
+                ranked.append((score, self.names[ident]))
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return ranked[:limit]
+
+    def save(self, path: str | Path = DEFAULT_INDEX) -> Path:
+        """Persist the index atomically."""
+        path = Path(path)
+        keys = sorted(self._lookup, key=lambda key: self._lookup[key][0])
+        offsets = array("I", [self._lookup[key][0] for key in keys])
+        offsets.append(len(self._postings))
+        names_blob = "\n".join(self.names).encode()
+        keys_blob = "\n".join(keys).encode()
+        header = _HEADER.pack(MAGIC, VERSION, 0, self.digest, len(self.names), len(keys), len(names_blob), len(keys_blob))
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as fh:
+            for chunk in (header, names_blob, keys_blob, _little(self._sizes), _little(offsets), _little(self._postings)):
+                fh.write(chunk)
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path = DEFAULT_INDEX) -> TrigramIndex:
+        """Load a persisted index; raises ``ValueError`` if the file is not one."""
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path}: truncated trigram index")
+        magic, version, _, digest, n_names, n_keys, names_len, keys_len = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a trigram index (or unsupported version)")
+        pos = _HEADER.size
+        names = data[pos : pos + names_len].decode().split("\n") if n_names else []
+        pos += names_len
+        keys = data[pos : pos + keys_len].decode().split("\n") if n_keys else []
+        pos += keys_len
+        sizes = _from_little("H", data[pos : pos + 2 * n_names])
+        pos += 2 * n_names
+        offsets = _from_little("I", data[pos : pos + 4 * (n_keys + 1)])
+        pos += 4 * (n_keys + 1)
+        postings = _from_little("I", data[pos:])
+        if len(names) != n_names or len(keys) != n_keys or len(offsets) != n_keys + 1 or len(postings) != offsets[-1]:
+            raise ValueError(f"{path}: corrupt trigram index")
+        return cls(names, digest, sizes, keys, offsets, postings)
+
+
+def open_index(path: str | Path = DEFAULT_INDEX, readme: str | Path = DEFAULT_README) -> TrigramIndex:
+    """Load the persisted index, rebuilding and re-saving it if missing or stale."""
+    try:
+        index = TrigramIndex.load(path)
+    except (OSError, ValueError):
+        index = None
+    if index is None or index.digest != readme_digest(readme):
+        index = TrigramIndex.build(load(readme))
+        index.save(path)
+    return index
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog suggest", description="Suggest skill slugs for a possibly mistyped name."
+    )
+    parser.add_argument("slug")
+    parser.add_argument("-n", "--limit", type=int, default=5)
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--index", default=str(DEFAULT_INDEX), help="persisted index file (rebuilt when stale)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    index = open_index(args.index, args.readme)
+    t1 = time.perf_counter()
+    matches = index.suggest(args.slug, args.limit)
+    t2 = time.perf_counter()
+    if matches and matches[0][1].lower() == args.slug.lower():
+        print(f"{args.slug}: found")
+        return 0
+    if matches:
+        print(f"{args.slug}: not found, did you mean:")
+        for score, name in matches:
+            print(f"  {name:<40} {score:.2f}")
+    else:
+        print(f"{args.slug}: not found, no similar skills")
+    print(f"index ready in {(t1 - t0) * 1000:.1f} ms, lookup took {(t2 - t1) * 1000:.3f} ms", file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""Harvest descriptions from SKILL.md frontmatter to repair truncated README entries.
+
+Given a local clone of openclaw/skills, every ``SKILL.md`` the README links to
+is opened on a thread pool and read line by line only up to the closing
+``---`` of its frontmatter; the body is never read. The frontmatter is parsed
+with a small YAML subset (top-level ``key: value`` pairs, quoted strings and
+``>``/``|`` block scalars), which covers what skill authors write.
+
+An entry gets a :class:`Proposal` when its README description looks cut off
+(it ends on a dangling word such as "the" or "that", on a dash or an
+ellipsis, or is a strict prefix of the frontmatter description) or is empty.
+The proposal is the first sentence of the frontmatter ``description``.
+Links whose path has an empty, ``.`` or ``..`` component or does not start
+with ``skills/`` are never joined onto the mirror, so nothing outside it is read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from catalog.expand import DEFAULT_MIRROR
+from catalog.lint import MAX_WORDS
+from catalog.parser import DEFAULT_README, LINK_SKILL, Catalog, load, split_link
+from catalog.search import STOPWORDS
+
+MAX_FRONTMATTER = 64 * 1024
+WORKERS = 32
+
+DANGLING = STOPWORDS | frozenset("when if use using wants asks e.g. i.e. like such including — – - ...".split())
+
+_KEY = re.compile(r"^([A-Za-z_][\w-]*):[ \t]*(.*)$")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z(\"'`])")
+_SPACE = re.compile(r"\s+")
+
+
+def _scalar(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    if " #" in value:
+        value = value.split(" #", 1)[0].rstrip()
+    return value
+
+
+def parse_frontmatter(lines: list[str]) -> dict[str, str]:
+    """Top-level string fields of a frontmatter block (without the ``---`` fences)."""
+    fields: dict[str, str] = {}
+    i = 0
+    while i < len(lines):
+        m = _KEY.match(lines[i])
+        i += 1
+        if m is None:
+            continue
+        key, value = m.group(1), m.group(2).rstrip()
+        block = []
+        while i < len(lines) and (not lines[i].strip() or lines[i][:1] in " \t"):
+            block.append(lines[i])
+            i += 1
+        if value and value[0] in ">|":
+            parts = [line.strip() for line in block]
+            fields[key] = ("\n" if value[0] == "|" else " ").join(parts).strip()
+        elif value:
+            # plain or quoted scalar, possibly continued on indented lines
+            fields[key] = _scalar(" ".join([value, *(line.strip() for line in block)]).strip())
+        else:
+            fields[key] = ""  # nested mapping or sequence: not needed here
+    return fields
+
+
+def read_header(path: str | Path) -> tuple[dict[str, str], int] | None:
+    """Frontmatter of ``path`` and the byte offset where its body starts; ``None`` if it has none."""
+    try:
+        with open(path, "rb") as fh:
+            first = fh.readline()
+            if first.strip() != b"---":
+                return None
+            offset = len(first)
+            lines = []
+            for line in fh:
+                offset += len(line)
+                if line.rstrip() == b"---":
+                    return parse_frontmatter(lines), offset
+                if offset > MAX_FRONTMATTER:
+                    return None
+                lines.append(line.decode("utf-8", "replace").rstrip("\r\n"))
+    except OSError:
+        return None
+    return None
+
+
+def read_frontmatter(path: str | Path) -> dict[str, str] | None:
+    """Parse the frontmatter of ``path`` without reading past it; ``None`` if it has none."""
+    header = read_header(path)
+    return header[0] if header else None
+
+
+def first_sentence(text: str) -> str:
+    text = _SPACE.sub(" ", text).strip()
+    return _SENTENCE_END.split(text, 1)[0]
+
+
+def looks_truncated(description: str, full: str = "") -> bool:
+    """Heuristic: does the README ``description`` stop mid-sentence?"""
+    text = description.rstrip()
+    if not text:
+        return True
+    if text.endswith(("...", "…")):
+        return True
+    if text.split()[-1].lower() in DANGLING:
+        return True
+    full = _SPACE.sub(" ", full).strip()
+    stem = text.rstrip(".").lower()
+    return len(full) > len(stem) + 1 and full.lower().startswith(stem) and full[len(stem)] not in ".!?"
+
+
+class Proposal:
+    __slots__ = ("index", "name", "line", "current", "proposed", "path")
+
+    def __init__(self, index: int, name: str, line: int, current: str, proposed: str, path: str) -> None:
+        self.index = index
+        self.name = name
+        self.line = line
+        self.current = current
+        self.proposed = proposed
+        self.path = path
+
+    @property
+    def words(self) -> int:
+        return len(self.proposed.split())
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "line": self.line,
+            "current": self.current,
+            "proposed": self.proposed,
+            "path": self.path,
+        }
+
+    def __repr__(self) -> str:
+        return f"<Proposal {self.name!r}>"
+
+
+def _safe(path: str) -> bool:
+    """``path`` lies under ``skills/`` with no empty, ``.`` or ``..`` component.
+
+    Unlike the installer's check this allows nested paths: some links point at
+    a SKILL.md below the skill folder (``skills/<author>/<slug>/references/...``).
+    """
+    parts = path.split("/")
+    return len(parts) >= 3 and parts[0] == "skills" and all(part not in ("", ".", "..") for part in parts)
+
+
+def harvest(
+    catalog: Catalog, mirror: str | Path = DEFAULT_MIRROR, workers: int = WORKERS
+) -> tuple[dict[int, dict[str, str]], int]:
+    """Frontmatter of every linked SKILL.md by entry index, plus the number of SKILL.md links read."""
+    targets = []
+    for i in range(len(catalog)):
+        if catalog.kind_of(i) != LINK_SKILL:
+            continue
+        path = split_link(catalog.url_of(i))[3]
+        if _safe(path):
+            targets.append((i, os.path.join(mirror, path, "SKILL.md")))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(read_frontmatter, [path for _, path in targets])
+        found = {i: fields for (i, _), fields in zip(targets, results) if fields is not None}
+    return found, len(targets)
+
+
+def propose(catalog: Catalog, frontmatter: dict[int, dict[str, str]], everything: bool = False) -> list[Proposal]:
+    """Proposals for entries whose description looks truncated (or differs, with ``everything``)."""
+    proposals = []
+    for i, fields in sorted(frontmatter.items()):
+        full = fields.get("description", "")
+        if not full:
+            continue
+        current = catalog.description_of(i)
+        proposed = first_sentence(full)
+        if proposed.rstrip(".") == current.rstrip("."):
+            continue
+        if everything or looks_truncated(current, full):
+            path = split_link(catalog.url_of(i))[3]
+            proposals.append(Proposal(i, catalog.name_of(i), catalog.line_of(i), current, proposed, path))
+    return proposals
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog harvest", description="Propose descriptions from SKILL.md frontmatter."
+    )
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--mirror", default=str(DEFAULT_MIRROR), help="local clone of openclaw/skills")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--all", action="store_true", help="list every entry whose description differs")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per proposal")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(os.path.join(args.mirror, "skills")):
+        print(f"error: {args.mirror}: no skills/ directory; clone openclaw/skills there", file=sys.stderr)
+        return 1
+    t0 = time.perf_counter()
+    catalog = load(args.readme)
+    frontmatter, wanted = harvest(catalog, args.mirror, args.workers)
+    proposals = propose(catalog, frontmatter, args.all)
+    elapsed = (time.perf_counter() - t0) * 1000
+    for p in proposals:
+        if args.json:
+            print(json.dumps(p.as_dict(), ensure_ascii=False))
+        else:
+            long = f"  ({p.words} words, max {MAX_WORDS})" if p.words > MAX_WORDS else ""
+            print(f"{args.readme}:{p.line}: {p.name}\n  - {p.current}\n  + {p.proposed}{long}")
+    print(
+        f"{len(proposals)} proposals from {len(frontmatter)}/{wanted} SKILL.md files ({elapsed:.0f} ms)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+"""Install many skills at once from a manifest.
+
+A manifest is a text file with one skill per line: its slug (``github``),
+``author/slug`` when a slug is not unique, or the README link itself. Blank
+lines and ``#`` comments are ignored. Every line is resolved against the
+parsed README.md catalog first, so a typo or an ambiguous slug is reported
+before anything is fetched.
+
+Skill folders are then fetched concurrently (at most ``--jobs`` at a time)
+from a source:
+
+* a local clone of openclaw/skills (the default, see :data:`DEFAULT_MIRROR`);
+  the folder ``skills/<author>/<slug>`` is copied,
+* an ``http(s)://`` registry that serves ``<base>/skills/<author>/<slug>.tar.gz``
+  (a stub registry can be ``python -m http.server`` over a directory of tarballs).
+
+Each skill is staged next to its destination and moved into place with one
+rename, so an interrupted run never leaves a half-written skill folder.
+Skills are installed to ``~/.openclaw/skills/`` or, with ``--project``, to
+``<project>/skills/``; existing folders are kept unless ``--force`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import itertools
+import os
+import shutil
+import sys
+import tarfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from catalog.expand import DEFAULT_MIRROR, tree_commit
+from catalog.parser import DEFAULT_README, LINK_SKILL, Catalog, load, split_link
+from catalog.store import DEFAULT_STORE, Store, StoreError, StoreSource
+
+GLOBAL_SKILLS = Path.home() / ".openclaw" / "skills"
+JOBS = 16
+USER_AGENT = "awesome-openclaw-skills-install/1.0"
+
+INSTALLED = "installed"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+_counter = itertools.count()
+
+# (author, slug, repo-relative folder)
+_Skill = tuple[str, str, str]
+
+
+class InstallError(Exception):
+    """A skill could not be resolved or fetched."""
+
+
+class Target:
+    """One resolved skill: where it lives in openclaw/skills and the folder name it installs as."""
+
+    __slots__ = ("spec", "author", "slug", "path")
+
+    def __init__(self, spec: str, author: str, slug: str, path: str) -> None:
+        self.spec = spec
+        self.author = author
+        self.slug = slug
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"<Target {self.path!r}>"
+
+
+class Result:
+    __slots__ = ("target", "status", "files", "error")
+
+    def __init__(self, target: Target, status: str, files: int = 0, error: str = "") -> None:
+        self.target = target
+        self.status = status
+        self.files = files
+        self.error = error
+
+    def as_dict(self) -> dict:
+        return {"skill": self.target.path, "status": self.status, "files": self.files, "error": self.error}
+
+
+def read_manifest(path: str | Path) -> list[str]:
+    """Skill specs from a manifest file (``-`` reads stdin)."""
+    text = sys.stdin.read() if str(path) == "-" else Path(path).read_text(encoding="utf-8")
+    specs = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            line = line.split(" #", 1)[0].rstrip()
+            specs.append(line)
+    return specs
+
+
+def _safe(path: str) -> bool:
+    """``path`` is ``skills/<author>/<slug>`` with no empty, ``.`` or ``..`` component."""
+    parts = path.split("/")
+    return len(parts) == 3 and parts[0] == "skills" and all(part not in ("", ".", "..") for part in parts)
+
+
+def _index(catalog: Catalog) -> tuple[dict[str, list[_Skill]], dict[str, list[_Skill]], dict[str, list[_Skill]]]:
+    """Lookups by slug, by display name and by ``author/slug`` over the SKILL.md links (all lowercased)."""
+    by_slug: dict[str, list[_Skill]] = {}
+    by_name: dict[str, list[_Skill]] = {}
+    by_path: dict[str, list[_Skill]] = {}
+    for i in range(len(catalog)):
+        kind, author, slug, path = split_link(catalog.url_of(i))
+        key = f"{author}/{slug}".lower()
+        if kind != LINK_SKILL or key in by_path or not _safe(path):
+            continue
+        skill = (author, slug, path)
+        by_path[key] = [skill]
+        by_slug.setdefault(slug.lower(), []).append(skill)
+        by_name.setdefault(catalog.name_of(i).lower(), []).append(skill)
+    return by_slug, by_name, by_path
+
+
+def resolve(catalog: Catalog, specs: Iterable[str]) -> tuple[list[Target], list[tuple[str, str]]]:
+    """Targets for the specs that name exactly one skill, and ``(spec, reason)`` for the rest."""
+    by_slug, by_name, by_path = _index(catalog)
+    targets: list[Target] = []
+    errors: list[tuple[str, str]] = []
+    seen: dict[str, Target] = {}
+    for spec in specs:
+        if "://" in spec:
+            kind, author, slug, path = split_link(spec)
+            if kind != LINK_SKILL or not _safe(path):
+                errors.append((spec, "not a link to a SKILL.md in openclaw/skills"))
+                continue
+            # links are looked up like author/slug: only catalog skills are installed
+            candidates = by_path.get(f"{author}/{slug}".lower(), [])
+        elif "/" in spec:
+            candidates = by_path.get(spec.strip("/").lower(), [])
+        else:
+            # an exact slug wins over a display name that happens to match
+            candidates = by_slug.get(spec.lower()) or by_name.get(spec.lower(), [])
+        if not candidates:
+            errors.append((spec, "not in the catalog"))
+            continue
+        if len(candidates) > 1:
+            options = ", ".join(f"{author}/{slug}" for author, slug, _ in candidates)
+            errors.append((spec, f"ambiguous, use one of {options}"))
+            continue
+        author, slug, path = candidates[0]
+        other = seen.get(slug.lower())
+        if other is not None:
+            if other.path != path:
+                errors.append((spec, f"installs as {slug}/, which {other.spec!r} already uses"))
+            continue
+        target = Target(spec, author, slug, path)
+        seen[slug.lower()] = target
+        targets.append(target)
+    return targets, errors
+
+
+class MirrorSource:
+    """Copies skill folders out of a local clone of openclaw/skills."""
+
+    def __init__(self, root: str | Path = DEFAULT_MIRROR) -> None:
+        self.root = Path(root)
+        commit = tree_commit(self.root)
+        # what the store keys its refs on; a checkout without a commit is re-read every time
+        self.ident = f"{self.root.resolve()}@{commit}" if commit else None
+
+    def fetch(self, target: Target, into: Path) -> int:
+        folder = self.root / target.path
+        if not (folder / "SKILL.md").is_file():
+            raise InstallError(f"{folder}: no SKILL.md")
+        shutil.copytree(folder, into, symlinks=True)
+        return sum(len(files) for _, _, files in os.walk(into))
+
+
+class RegistrySource:
+    """Downloads ``<base>/<path>.tar.gz`` and unpacks it."""
+
+    def __init__(self, base: str, timeout: float = 30.0) -> None:
+        self.base = base.rstrip("/")
+        self.timeout = timeout
+        self.ident = self.base
+
+    def fetch(self, target: Target, into: Path) -> int:
+        request = urllib.request.Request(f"{self.base}/{target.path}.tar.gz", headers={"User-Agent": USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = response.read()
+        except OSError as exc:
+            raise InstallError(f"{request.full_url}: {exc}") from None
+        into.mkdir()
+        files = 0
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:*") as archive:
+            for member in archive:
+                name = os.path.normpath(member.name)
+                if name.startswith(("/", "..")) or not (member.isfile() or member.isdir()):
+                    raise InstallError(f"{request.full_url}: refusing archive member {member.name!r}")
+                if member.isfile():
+                    files += 1
+            archive.extractall(into, **({"filter": "data"} if hasattr(tarfile, "data_filter") else {}))
+        if not (into / "SKILL.md").is_file():
+            raise InstallError(f"{request.full_url}: no SKILL.md at the top of the archive")
+        return files
+
+
+def open_source(spec: str | Path) -> MirrorSource | RegistrySource:
+    spec = str(spec)
+    if spec.startswith(("http://", "https://")):
+        return RegistrySource(spec)
+    return MirrorSource(spec)
+
+
+def _install_one(
+    source: MirrorSource | RegistrySource | StoreSource, target: Target, dest: Path, force: bool
+) -> Result:
+    final = dest / target.slug
+    if not force and final.exists():
+        return Result(target, SKIPPED)
+    stage = dest / f".{target.slug}.tmp-{os.getpid()}-{next(_counter)}"
+    try:
+        files = source.fetch(target, stage)
+        if final.exists():
+            old = stage.with_name(stage.name + "-old")
+            os.replace(final, old)
+            os.replace(stage, final)
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            os.replace(stage, final)
+    except (InstallError, StoreError, OSError, tarfile.TarError) as exc:
+        shutil.rmtree(stage, ignore_errors=True)
+        return Result(target, FAILED, error=str(exc))
+    return Result(target, INSTALLED, files)
+
+
+def install(
+    targets: list[Target],
+    source: MirrorSource | RegistrySource | StoreSource,
+    dest: str | Path = GLOBAL_SKILLS,
+    jobs: int = JOBS,
+    force: bool = False,
+) -> list[Result]:
+    """Fetch and install every target with at most ``jobs`` in flight; results are in target order."""
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return list(pool.map(lambda target: _install_one(source, target, dest, force), targets))
+
+
+def pins(results: list[Result]) -> dict[str, str]:
+    """``slug -> path`` to record in skills.lock: only folders this run installed.
+
+    A skipped folder was already there, maybe from another author or edited
+    after a ``--copy`` install, so its tree says nothing about ``target.path``.
+    """
+    return {r.target.slug: r.target.path for r in results if r.status == INSTALLED}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog install", description="Install the skills listed in a manifest concurrently."
+    )
+    parser.add_argument("skills", nargs="*", help="skills to install in addition to the manifest")
+    parser.add_argument("-m", "--manifest", help="file with one slug, author/slug or link per line (- for stdin)")
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument(
+        "--source", default=str(DEFAULT_MIRROR), help="openclaw/skills clone, or http(s) registry base URL"
+    )
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--project", help="install into <project>/skills/ instead of ~/.openclaw/skills/")
+    where.add_argument("--dest", help="install into this directory")
+    parser.add_argument("-j", "--jobs", type=int, default=JOBS, help="skills fetched at the same time")
+    parser.add_argument("--force", action="store_true", help="replace skills that are already installed")
+    parser.add_argument("--store", default=str(DEFAULT_STORE), help="content-addressed store to link skills from")
+    parser.add_argument("--refresh", action="store_true", help="fetch skills again even if they are in the store")
+    parser.add_argument("--copy", action="store_true", help="plain copies, bypassing the store")
+    parser.add_argument("--no-lock", action="store_true", help="do not record the installed trees in skills.lock")
+    args = parser.parse_args(argv)
+
+    specs = list(args.skills)
+    if args.manifest:
+        specs.extend(read_manifest(args.manifest))
+    if not specs:
+        parser.error("nothing to install; pass skills or --manifest")
+    dest = Path(args.dest) if args.dest else Path(args.project) / "skills" if args.project else GLOBAL_SKILLS
+
+    t0 = time.perf_counter()
+    targets, errors = resolve(load(args.readme), specs)
+    for spec, reason in errors:
+        print(f"error: {spec}: {reason}", file=sys.stderr)
+    source = open_source(args.source)
+    if not args.copy:
+        source = StoreSource(Store(args.store), source, args.refresh)
+    results = install(targets, source, dest, args.jobs, args.force)
+    elapsed = (time.perf_counter() - t0) * 1000
+
+    counts = {INSTALLED: 0, SKIPPED: 0, FAILED: 0}
+    files = 0
+    for result in results:
+        counts[result.status] += 1
+        files += result.files
+        if result.status == FAILED:
+            print(f"error: {result.target.spec}: {result.error}", file=sys.stderr)
+    print(
+        f"{counts[INSTALLED]} installed ({files} files), {counts[SKIPPED]} already present,"
+        f" {counts[FAILED] + len(errors)} failed of {len(targets) + len(errors)} into {dest} ({elapsed:.0f} ms)"
+    )
+    if isinstance(source, StoreSource):
+        print(f"store {args.store}: {source.reused} linked from the store, {source.fetched} fetched")
+    installed = pins(results)
+    if installed and not args.no_lock:
+        from catalog.lock import lock_path, update
+
+        lockfile = lock_path(dest)
+        update(lockfile, dest, installed)
+        print(f"pinned {len(installed)} skills in {lockfile}")
+    return 1 if errors or counts[FAILED] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Persistent cache of link-check results with conditional revalidation.
+
+Results are stored in SQLite keyed by URL, together with the ``ETag`` and
+``Last-Modified`` validators the server sent. A later run
+
+* skips URLs checked within ``max_age`` seconds entirely, and
+* revalidates the rest with ``If-None-Match`` / ``If-Modified-Since``, so an
+  unchanged page costs a ``304`` with no body.
+
+All writes of a run go into one transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable
+
+from catalog.links import LinkChecker, LinkResult
+from catalog.parser import REPO_ROOT
+
+DEFAULT_CACHE = REPO_ROOT / "linkcache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    url           TEXT PRIMARY KEY,
+    status        INTEGER NOT NULL,
+    error         TEXT NOT NULL DEFAULT '',
+    final_url     TEXT NOT NULL DEFAULT '',
+    etag          TEXT,
+    last_modified TEXT,
+    latency       REAL NOT NULL DEFAULT 0,
+    checked_at    REAL NOT NULL
+)
+"""
+
+
+class CachedLink:
+    __slots__ = ("url", "status", "error", "final_url", "etag", "last_modified", "latency", "checked_at")
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        error: str,
+        final_url: str,
+        etag: str | None,
+        last_modified: str | None,
+        latency: float,
+        checked_at: float,
+    ) -> None:
+        self.url = url
+        self.status = status
+        self.error = error
+        self.final_url = final_url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.latency = latency
+        self.checked_at = checked_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this URL."""
+        if self.error or not 200 <= self.status < 400:
+            return {}
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def as_result(self) -> LinkResult:
+        return LinkResult(self.url, self.status, self.latency, self.error, self.final_url, cached=True)
+
+
+class LinkCache:
+    """SQLite-backed store of the last check of every URL."""
+
+    def __init__(self, path: str | Path = DEFAULT_CACHE) -> None:
+        self.path = Path(path)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def __enter__(self) -> LinkCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM links").fetchone()[0]
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, CachedLink]:
+        urls = list(urls)
+        found: dict[str, CachedLink] = {}
+        # Stay under SQLite's default host-parameter limit.
+        for i in range(0, len(urls), 500):
+            chunk = urls[i : i + 500]
+            rows = self._db.execute(
+                "SELECT url, status, error, final_url, etag, last_modified, latency, checked_at"
+                f" FROM links WHERE url IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for row in rows:
+                found[row[0]] = CachedLink(*row)
+        return found
+
+    def store(self, results: Iterable[LinkResult], now: float | None = None) -> None:
+        """Record results in one transaction; 304s keep the previous status."""
+        now = time.time() if now is None else now
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO links (url, status, error, final_url, etag, last_modified, latency, checked_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET"
+                "  status = CASE WHEN excluded.status = 304 THEN links.status ELSE excluded.status END,"
+                "  error = excluded.error, final_url = excluded.final_url,"
+                "  etag = COALESCE(excluded.etag, links.etag),"
+                "  last_modified = COALESCE(excluded.last_modified, links.last_modified),"
+                "  latency = excluded.latency, checked_at = excluded.checked_at",
+                (
+                    (
+                        r.url,
+                        r.status,
+                        r.error,
+                        r.final_url,
+                        r.headers.get("etag"),
+                        r.headers.get("last-modified"),
+                        r.latency,
+                        now,
+                    )
+                    for r in results
+                    if not r.cached
+                ),
+            )
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Drop rows for URLs no longer linked from the READMEs; return how many."""
+        keep = set(keep)
+        stale = [(url,) for (url,) in self._db.execute("SELECT url FROM links") if url not in keep]
+        with self._db:
+            self._db.executemany("DELETE FROM links WHERE url = ?", stale)
+        return len(stale)
+
+
+async def check_cached(
+    urls: Iterable[str], cache: LinkCache, max_age: float = 0.0, **options: object
+) -> list[LinkResult]:
+    """Check ``urls`` using ``cache``; results come back in input order.
+
+    URLs checked less than ``max_age`` seconds ago are answered from the cache
+    without a request, unless that check failed at the network level.
+    Everything else is revalidated conditionally, and a ``304`` reports the
+    previously recorded status.
+    """
+    urls = list(dict.fromkeys(urls))
+    known = cache.get_many(urls)
+    cutoff = time.time() - max_age
+    results: dict[str, LinkResult] = {}
+    pending = []
+    for url in urls:
+        entry = known.get(url)
+        if entry is not None and max_age > 0 and entry.checked_at >= cutoff and not entry.error:
+            results[url] = entry.as_result()
+        else:
+            pending.append(url)
+
+    async def revalidate(checker: LinkChecker, url: str) -> LinkResult:
+        entry = known.get(url)
+        result = await checker.check(url, headers=entry.validators() if entry else None)
+        if result.status == 304 and entry is not None:
+            result.status = entry.status
+            result.final_url = entry.final_url or url
+            result.revalidated = True
+        return result
+
+    async with LinkChecker(**options) as checker:
+        fresh = await asyncio.gather(*(revalidate(checker, url) for url in pending))
+    cache.store(fresh)
+    results.update((r.url, r) for r in fresh)
+    return [results[url] for url in urls]
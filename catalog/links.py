@@ -0,0 +1,367 @@
+"""Asynchronous bulk link checker for the READMEs.
+
+Every ``http(s)`` link in README.md and README_zh.md is extracted and
+deduplicated, then checked concurrently with a small HTTP/1.1 client built on
+``asyncio`` streams:
+
+* connections are kept alive and pooled per ``(scheme, host, port)``, so the
+  thousands of ``github.com`` links reuse a handful of TLS sessions;
+* a global semaphore bounds the number of requests in flight and a per-host
+  semaphore bounds the number of open connections to one host;
+* each result records the status code, latency and any error.
+
+The client speaks plain ``http://`` as well, which is how it is exercised
+against a local stub server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import socket
+import ssl
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import urljoin, urlsplit
+
+from catalog.parser import DEFAULT_README, REPO_ROOT
+
+DEFAULT_SOURCES = (DEFAULT_README, REPO_ROOT / "README_zh.md")
+
+USER_AGENT = "awesome-openclaw-skills-linkcheck/1.0"
+MAX_REDIRECTS = 5
+
+_URL = re.compile(r"""\]\((https?://[^)\s]+)\)|(?:href|src)="(https?://[^"\s]+)\"""")
+
+
+def extract_urls(paths: Iterable[str | Path] = DEFAULT_SOURCES) -> list[str]:
+    """Return every distinct http(s) URL linked from ``paths``, in first-seen order."""
+    seen: dict[str, None] = {}
+    for path in paths:
+        text = Path(path).read_text(encoding="utf-8")
+        for m in _URL.finditer(text):
+            seen.setdefault(m.group(1) or m.group(2), None)
+    return list(seen)
+
+
+class LinkResult:
+    """Outcome of checking one URL."""
+
+    __slots__ = ("url", "status", "latency", "error", "final_url", "headers", "cached", "revalidated")
+
+    def __init__(
+        self,
+        url: str,
+        status: int = 0,
+        latency: float = 0.0,
+        error: str = "",
+        final_url: str = "",
+        headers: dict[str, str] | None = None,
+        cached: bool = False,
+    ) -> None:
+        self.url = url
+        self.status = status
+        self.latency = latency
+        self.error = error
+        self.final_url = final_url or url
+        self.headers = headers or {}
+        # Answered from the link cache without a request / confirmed by a 304.
+        self.cached = cached
+        self.revalidated = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and 200 <= self.status < 400
+
+    def as_dict(self) -> dict:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "latency_ms": round(self.latency * 1000, 1),
+            "error": self.error,
+            "final_url": self.final_url,
+            "cached": self.cached,
+            "revalidated": self.revalidated,
+        }
+
+    def __repr__(self) -> str:
+        return f"<LinkResult {self.status or self.error} {self.url}>"
+
+
+class HttpError(Exception):
+    """Malformed or truncated HTTP response."""
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _HostPool:
+    """Idle keep-alive connections to one origin, capped at ``limit`` open at once.
+
+    The host name is resolved once per pool; every later connection (and every
+    failure) reuses that lookup.
+    """
+
+    __slots__ = ("scheme", "host", "port", "idle", "slots", "_address")
+
+    def __init__(self, scheme: str, host: str, port: int, limit: int) -> None:
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.idle: list[_Connection] = []
+        self.slots = asyncio.Semaphore(limit)
+        self._address: asyncio.Task | None = None
+
+    async def _resolve(self) -> str:
+        if self._address is None:
+            loop = asyncio.get_running_loop()
+            # A task rather than a bare await, so a caller timing out does not
+            # cancel the lookup the other waiters share.
+            self._address = loop.create_task(loop.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM))
+        infos = await asyncio.shield(self._address)
+        return infos[0][4][0]
+
+    async def connect(self, ssl_context: ssl.SSLContext | None) -> _Connection:
+        address = await self._resolve()
+        if self.scheme == "https":
+            reader, writer = await asyncio.open_connection(
+                address, self.port, ssl=ssl_context, server_hostname=self.host
+            )
+        else:
+            reader, writer = await asyncio.open_connection(address, self.port)
+        return _Connection(reader, writer)
+
+    def close(self) -> None:
+        while self.idle:
+            self.idle.pop().close()
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> tuple[int, dict[str, str]]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed before response")
+    parts = status_line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        raise HttpError(f"bad status line {status_line[:60]!r}")
+    headers: dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise HttpError("truncated headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+async def _drain_body(reader: asyncio.StreamReader, headers: dict[str, str]) -> bool:
+    """Consume the response body; return whether the connection can be reused."""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return True
+            await reader.readexactly(size + 2)
+    length = headers.get("content-length")
+    if length is not None:
+        await reader.readexactly(int(length))
+        return True
+    await reader.read()
+    return False
+
+
+class LinkChecker:
+    """Concurrent URL checker with per-host keep-alive pools.
+
+    Use as an async context manager so pooled connections are closed::
+
+        async with LinkChecker(concurrency=64) as checker:
+            results = await checker.check_all(urls)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 64,
+        per_host: int = 16,
+        timeout: float = 15.0,
+        method: str = "HEAD",
+        follow_redirects: bool = True,
+    ) -> None:
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.method = method
+        self.follow_redirects = follow_redirects
+        self._limit: asyncio.Semaphore | None = None
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+        self._ssl = ssl.create_default_context()
+        self.connections_opened = 0
+
+    async def __aenter__(self) -> LinkChecker:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+    def _pool(self, scheme: str, host: str, port: int) -> _HostPool:
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(scheme, host, port, self.per_host)
+        return pool
+
+    async def request(
+        self, url: str, method: str | None = None, headers: dict[str, str] | None = None
+    ) -> tuple[int, dict[str, str]]:
+        """Send one request over a pooled connection and return ``(status, headers)``."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise HttpError(f"unsupported URL {url!r}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        pool = self._pool(scheme, parts.hostname, port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        method = method or self.method
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", f"User-Agent: {USER_AGENT}", "Accept: */*"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        async with pool.slots:
+            for attempt in (0, 1):
+                reused = bool(pool.idle)
+                conn = pool.idle.pop() if reused else await pool.connect(self._ssl if scheme == "https" else None)
+                if not reused:
+                    self.connections_opened += 1
+                try:
+                    conn.writer.write(payload)
+                    await conn.writer.drain()
+                    status, response_headers = await _read_headers(conn.reader)
+                    reusable = True
+                    if method != "HEAD" and status not in (204, 304) and status >= 200:
+                        reusable = await _drain_body(conn.reader, response_headers)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue  # the server dropped an idle keep-alive connection
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                if reusable and response_headers.get("connection", "").lower() != "close":
+                    pool.idle.append(conn)
+                else:
+                    conn.close()
+                return status, response_headers
+        raise AssertionError("unreachable")
+
+    async def check(self, url: str, headers: dict[str, str] | None = None) -> LinkResult:
+        """Check one URL, following redirects, and time it."""
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.concurrency)
+        async with self._limit:
+            start = time.perf_counter()
+            current = url
+            try:
+                for _ in range(MAX_REDIRECTS + 1):
+                    status, response_headers = await asyncio.wait_for(
+                        self.request(current, headers=headers), self.timeout
+                    )
+                    if status == 405 and self.method == "HEAD":
+                        status, response_headers = await asyncio.wait_for(
+                            self.request(current, method="GET", headers=headers), self.timeout
+                        )
+                    location = response_headers.get("location")
+                    if not (self.follow_redirects and 300 <= status < 400 and status != 304 and location):
+                        break
+                    current = urljoin(current, location)
+                return LinkResult(url, status, time.perf_counter() - start, final_url=current, headers=response_headers)
+            except asyncio.TimeoutError:
+                return LinkResult(url, latency=time.perf_counter() - start, error="timeout")
+            except (OSError, HttpError, ValueError, asyncio.IncompleteReadError) as exc:
+                return LinkResult(url, latency=time.perf_counter() - start, error=f"{type(exc).__name__}: {exc}")
+
+    async def check_all(self, urls: Iterable[str]) -> list[LinkResult]:
+        """Check every URL concurrently; results come back in input order."""
+        return await asyncio.gather(*(self.check(url) for url in dict.fromkeys(urls)))
+
+
+async def check_urls(urls: Iterable[str], **options: object) -> list[LinkResult]:
+    async with LinkChecker(**options) as checker:
+        return await checker.check_all(urls)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog links", description="Check every link in the READMEs.")
+    parser.add_argument("files", nargs="*", default=[str(p) for p in DEFAULT_SOURCES])
+    parser.add_argument("-c", "--concurrency", type=int, default=64)
+    parser.add_argument("--per-host", type=int, default=16, help="max open connections per host")
+    parser.add_argument("--timeout", type=float, default=15.0)
+    parser.add_argument("--get", action="store_true", help="use GET instead of HEAD")
+    parser.add_argument("--json", metavar="PATH", help="write all results as JSON lines")
+    parser.add_argument("--cache", metavar="PATH", help="result cache (default: linkcache.sqlite in the repo root)")
+    parser.add_argument("--no-cache", action="store_true", help="check every link without reading or writing the cache")
+    parser.add_argument(
+        "--max-age", type=float, default=0.0, metavar="HOURS", help="skip links checked less than HOURS ago"
+    )
+    args = parser.parse_args(argv)
+
+    urls = extract_urls(args.files)
+    options = dict(
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout,
+        method="GET" if args.get else "HEAD",
+    )
+    t0 = time.perf_counter()
+    if args.no_cache:
+        results = asyncio.run(check_urls(urls, **options))
+    else:
+        from catalog.linkcache import DEFAULT_CACHE, LinkCache, check_cached
+
+        with LinkCache(args.cache or DEFAULT_CACHE) as cache:
+            results = asyncio.run(check_cached(urls, cache, args.max_age * 3600, **options))
+            cache.prune(urls)
+    elapsed = time.perf_counter() - t0
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            for result in results:
+                fh.write(json.dumps(result.as_dict()) + "\n")
+    broken = [r for r in results if not r.ok]
+    for result in broken:
+        print(f"{result.status or result.error:<24} {result.url}")
+    requested = sum(not r.cached for r in results)
+    unchanged = sum(r.revalidated for r in results)
+    print(
+        f"checked {len(results)} unique links in {elapsed:.1f} s ({requested} requested, {unchanged} not modified):"
+        f" {len(results) - len(broken)} ok, {len(broken)} broken"
+    )
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""Lint README.md entries against the CONTRIBUTING.md rules.
+
+Rules (all evaluated in one pass over the parsed catalog):
+
+``format``      the bullet is exactly ``- [name](url) - Description``
+``words``       the description has at most :data:`MAX_WORDS` words
+``link``        the URL points into ``github.com/openclaw/skills/tree/main/skills``
+``duplicate``   no other entry has the same name
+``finance``     no crypto, blockchain, DeFi or finance skills (keyword heuristic, warning)
+
+With ``--diff BASE`` only the lines that ``git diff BASE`` reports as added
+or changed in the README are linted, which is what a PR check needs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from catalog.parser import DEFAULT_README, Catalog, load
+
+MAX_WORDS = 10
+SKILLS_TREE = "https://github.com/openclaw/skills/tree/main/skills/"
+
+ERROR = "error"
+WARNING = "warning"
+
+FINANCE_TERMS = frozenset(
+    "crypto cryptocurrency blockchain defi bitcoin btc ethereum solana nft nfts web3 "
+    "memecoin wallet wallets onchain staking airdrop trading trader forex stock stocks "
+    "polymarket hyperliquid uniswap binance coinbase".split()
+)
+
+_WORD = re.compile(r"[a-z0-9]+")
+_BULLET = re.compile(rb"^- .*$", re.M)
+_HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.M)
+
+
+class Problem:
+    __slots__ = ("line", "rule", "message", "severity")
+
+    def __init__(self, line: int, rule: str, message: str, severity: str = ERROR) -> None:
+        self.line = line
+        self.rule = rule
+        self.message = message
+        self.severity = severity
+
+    def format(self, path: str) -> str:
+        return f"{path}:{self.line}: {self.severity}: [{self.rule}] {self.message}"
+
+    def __repr__(self) -> str:
+        return f"<Problem {self.line} {self.rule}>"
+
+
+class _Context:
+    """Per-run lookups shared by the rules."""
+
+    __slots__ = ("catalog", "names")
+
+    def __init__(self, catalog: Catalog) -> None:
+        self.catalog = catalog
+        names: dict[str, list[int]] = {}
+        for i in range(len(catalog)):
+            names.setdefault(catalog.name_of(i).lower(), []).append(i)
+        self.names = names
+
+
+def _check_format(ctx: _Context, i: int) -> Iterator[Problem]:
+    catalog = ctx.catalog
+    start, end = catalog.span_of(i)
+    raw = catalog.buffer[start:end].decode()
+    name, url, description = catalog.name_of(i), catalog.url_of(i), catalog.description_of(i)
+    if not description:
+        yield Problem(catalog.line_of(i), "format", f"{name}: missing ' - Description'")
+    elif raw != f"- [{name}]({url}) - {description}":
+        yield Problem(catalog.line_of(i), "format", f"{name}: separator must be ' - ' with no trailing whitespace")
+
+
+def _check_words(ctx: _Context, i: int) -> Iterator[Problem]:
+    words = len(ctx.catalog.description_of(i).split())
+    if words > MAX_WORDS:
+        name = ctx.catalog.name_of(i)
+        yield Problem(ctx.catalog.line_of(i), "words", f"{name}: description has {words} words (max {MAX_WORDS})")
+
+
+def _check_link(ctx: _Context, i: int) -> Iterator[Problem]:
+    url = ctx.catalog.url_of(i)
+    if not url.startswith(SKILLS_TREE):
+        yield Problem(ctx.catalog.line_of(i), "link", f"{ctx.catalog.name_of(i)}: {url} is not in {SKILLS_TREE}")
+
+
+def _check_duplicate(ctx: _Context, i: int) -> Iterator[Problem]:
+    name = ctx.catalog.name_of(i)
+    others = [j for j in ctx.names[name.lower()] if j != i]
+    if others:
+        lines = ", ".join(str(ctx.catalog.line_of(j)) for j in others)
+        yield Problem(ctx.catalog.line_of(i), "duplicate", f"{name}: also listed on line {lines}")
+
+
+def _check_finance(ctx: _Context, i: int) -> Iterator[Problem]:
+    catalog = ctx.catalog
+    text = f"{catalog.name_of(i)} {catalog.description_of(i)}".lower()
+    hits = sorted(FINANCE_TERMS.intersection(_WORD.findall(text)))
+    if hits:
+        yield Problem(
+            catalog.line_of(i), "finance", f"{catalog.name_of(i)}: looks finance-related ({', '.join(hits)})", WARNING
+        )
+
+
+RULES: dict[str, Callable[[_Context, int], Iterable[Problem]]] = {
+    "format": _check_format,
+    "words": _check_words,
+    "link": _check_link,
+    "duplicate": _check_duplicate,
+    "finance": _check_finance,
+}
+
+
+def _unparsed_bullets(catalog: Catalog, lines: set[int] | None) -> Iterator[Problem]:
+    """Bullets inside a category that the parser could not read as entries."""
+    parsed = {catalog.line_of(i) for i in range(len(catalog))}
+    buffer = catalog.buffer
+    for section in catalog.sections:
+        line = section.line
+        pos = section.start
+        for m in _BULLET.finditer(buffer, section.start, section.end):
+            line += buffer.count(b"\n", pos, m.start())
+            pos = m.start()
+            if line not in parsed and (lines is None or line in lines):
+                yield Problem(line, "format", f"unparseable entry {m.group().decode()[:60]!r}")
+
+
+def lint(catalog: Catalog, lines: set[int] | None = None, rules: Iterable[str] = RULES) -> list[Problem]:
+    """Run ``rules`` over every entry, or only entries on ``lines``."""
+    ctx = _Context(catalog)
+    checks = [RULES[name] for name in rules]
+    problems = list(_unparsed_bullets(catalog, lines))
+    for i in range(len(catalog)):
+        if lines is not None and catalog.line_of(i) not in lines:
+            continue
+        for check in checks:
+            problems.extend(check(ctx, i))
+    problems.sort(key=lambda p: p.line)
+    return problems
+
+
+def changed_lines(base: str, path: str | Path = DEFAULT_README, cwd: str | Path | None = None) -> set[int]:
+    """Line numbers of ``path`` added or modified relative to ``base``.
+
+    A relative ``path`` is taken from ``cwd`` (the working directory by
+    default); git runs in the file's own directory, so the file may sit in
+    any checkout, not only this one.
+    """
+    path = Path(cwd or os.getcwd(), path).resolve()
+    diff = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-color", base, "--", path.name],
+        cwd=path.parent,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    lines: set[int] = set()
+    for m in _HUNK.finditer(diff):
+        start = int(m.group(1))
+        count = 1 if m.group(2) is None else int(m.group(2))
+        lines.update(range(start, start + count))
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog lint", description="Lint README.md entries.")
+    parser.add_argument("readme", nargs="?", default=str(DEFAULT_README))
+    parser.add_argument("--diff", metavar="BASE", help="only lint lines changed since git revision BASE")
+    parser.add_argument("--rules", default=",".join(RULES), help=f"comma-separated subset of {', '.join(RULES)}")
+    parser.add_argument("--strict", action="store_true", help="fail on warnings too")
+    args = parser.parse_args(argv)
+
+    rules = [r.strip() for r in args.rules.split(",") if r.strip()]
+    unknown = [r for r in rules if r not in RULES]
+    if unknown:
+        parser.error(f"unknown rule(s): {', '.join(unknown)}")
+    t0 = time.perf_counter()
+    lines = None
+    if args.diff:
+        try:
+            lines = changed_lines(args.diff, args.readme)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            print(f"error: git diff failed: {exc}", file=sys.stderr)
+            return 2
+    problems = lint(load(args.readme), lines, rules)
+    elapsed = (time.perf_counter() - t0) * 1000
+
+    for problem in problems:
+        print(problem.format(args.readme))
+    errors = sum(p.severity == ERROR for p in problems)
+    warnings = len(problems) - errors
+    scope = f"{len(lines)} changed lines" if lines is not None else "all entries"
+    print(f"{errors} errors, {warnings} warnings in {scope} ({elapsed:.0f} ms)", file=sys.stderr)
+    return 1 if errors or (args.strict and warnings) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
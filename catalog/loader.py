@@ -0,0 +1,188 @@
+"""Load installed skills from their frontmatter only; read a body when it is used.
+
+Choosing a skill needs its name and description, not the instructions in the
+body of its ``SKILL.md``. :func:`load_skills` resolves the installed skills
+(Workspace > Local > Bundled, see :mod:`catalog.resolve`) and, for each one,
+keeps only the frontmatter fields and the byte offset where the body starts.
+:meth:`Skill.read_body` seeks to that offset when the skill is invoked.
+
+The headers are persisted in ``~/.openclaw/skill-index.json``
+(``$OPENCLAW_SKILL_INDEX``) keyed by ``SKILL.md`` path and validated with its
+size, mtime and inode, so a warm start costs one ``stat`` per skill and reads
+no ``SKILL.md`` at all; only new or changed files have their header re-read
+(concurrently).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from catalog.harvest import WORKERS, read_header
+from catalog.resolve import Resolver, default_locations
+
+DEFAULT_INDEX = Path(os.environ.get("OPENCLAW_SKILL_INDEX", Path.home() / ".openclaw" / "skill-index.json"))
+INDEX_VERSION = 1
+
+
+class Skill:
+    """One installed skill; the body of its ``SKILL.md`` is not held in memory."""
+
+    __slots__ = ("name", "location", "path", "fields", "offset")
+
+    def __init__(self, name: str, location: str, path: str, fields: dict[str, str], offset: int) -> None:
+        self.name = name
+        self.location = location
+        self.path = path
+        self.fields = fields
+        # byte offset of the body in SKILL.md (0 when there is no frontmatter)
+        self.offset = offset
+
+    @property
+    def description(self) -> str:
+        return self.fields.get("description", "")
+
+    def read_body(self) -> str:
+        with open(self.path, "rb") as fh:
+            fh.seek(self.offset)
+            return fh.read().decode("utf-8", "replace")
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "location": self.location, "path": self.path, "description": self.description}
+
+    def __repr__(self) -> str:
+        return f"<Skill {self.name!r} {self.location}>"
+
+
+class Skills:
+    """The loaded skills by name, plus how much of the disk the load touched."""
+
+    __slots__ = ("by_name", "reused", "read", "header_bytes")
+
+    def __init__(self, skills: list[Skill], reused: int, read: int, header_bytes: int) -> None:
+        self.by_name = {skill.name: skill for skill in skills}
+        self.reused = reused
+        self.read = read
+        # frontmatter bytes parsed for the ``read`` headers that were not in the index
+        self.header_bytes = header_bytes
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+    def __iter__(self) -> Iterator[Skill]:
+        return iter(self.by_name.values())
+
+    def __getitem__(self, name: str) -> Skill:
+        return self.by_name[name]
+
+    def get(self, name: str) -> Skill | None:
+        return self.by_name.get(name)
+
+
+def _read_index(path: Path) -> dict[str, list]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("skills", {})
+
+
+def _write_index(path: Path, skills: dict[str, list]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"version": INDEX_VERSION, "skills": skills}, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _header(path: str) -> tuple[dict[str, str], int]:
+    return read_header(path) or ({}, 0)
+
+
+def load_skills(
+    resolver: Resolver | None = None, index_path: str | Path | None = DEFAULT_INDEX, workers: int = WORKERS
+) -> Skills:
+    """Frontmatter of every installed skill, from the index where ``SKILL.md`` is unchanged."""
+    own = resolver is None
+    resolver = resolver or Resolver(watch=False)
+    try:
+        resolutions = list(resolver)
+    finally:
+        if own:
+            resolver.close()
+    cached = _read_index(Path(index_path)) if index_path is not None else {}
+    index: dict[str, list] = {}
+    stale = []
+    for resolution in resolutions:
+        path = os.path.join(resolution.path, "SKILL.md")
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        key = [st.st_size, st.st_mtime_ns, st.st_ino]
+        entry = cached.get(path)
+        if entry is not None and entry[0] == key:
+            index[path] = entry
+        else:
+            stale.append((path, key))
+    header_bytes = 0
+    if stale:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for (path, key), (fields, offset) in zip(stale, pool.map(_header, [path for path, _ in stale])):
+                index[path] = [key, fields, offset]
+                header_bytes += offset
+    skills = []
+    for resolution in resolutions:
+        path = os.path.join(resolution.path, "SKILL.md")
+        entry = index.get(path)
+        if entry is not None:
+            skills.append(Skill(resolution.name, resolution.location, path, entry[1], entry[2]))
+    if index_path is not None and (stale or index.keys() != cached.keys()):
+        _write_index(Path(index_path), index)
+    return Skills(skills, len(index) - len(stale), len(stale), header_bytes)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog skills", description="List installed skills from their frontmatter index."
+    )
+    parser.add_argument("--project", help="workspace whose skills/ directory comes first (default: cwd)")
+    parser.add_argument("--bundled", help="directory of the skills bundled with OpenClaw")
+    parser.add_argument("--index", default=str(DEFAULT_INDEX))
+    parser.add_argument("--show", metavar="NAME", help="print the body of one skill")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per skill")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    with Resolver(default_locations(args.project, args.bundled), watch=False) as resolver:
+        skills = load_skills(resolver, args.index)
+    elapsed = (time.perf_counter() - t0) * 1000
+    if args.show:
+        skill = skills.get(args.show)
+        if skill is None:
+            print(f"error: {args.show}: not installed", file=sys.stderr)
+            return 1
+        sys.stdout.write(skill.read_body())
+        return 0
+    for skill in skills:
+        if args.json:
+            print(json.dumps(skill.as_dict(), ensure_ascii=False))
+        else:
+            print(f"{skill.name}\t{skill.location}\t{skill.description}")
+    print(
+        f"{len(skills)} skills ({skills.reused} from the index, {skills.read} headers read,"
+        f" {skills.header_bytes / 1024:.1f} KiB of frontmatter parsed) in {elapsed:.1f} ms",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
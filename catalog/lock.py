@@ -0,0 +1,238 @@
+"""Pin installed skills to tree hashes and verify installs against the pins.
+
+``skills.lock`` sits next to the ``skills/`` directory it describes
+(``<project>/skills.lock``, or ``~/.openclaw/skills.lock`` for the global
+location) and records, for every installed catalog skill, the openclaw/skills
+folder it came from and its tree hash::
+
+    {"version": 1, "skills": {"github": {"path": "skills/steipete/github", "tree": "9f2c..."}}}
+
+The tree hash is the same digest the content-addressed store
+(:mod:`catalog.store`) uses: sha256 over the sorted file paths, their sha256
+and executable bit, and symlink targets. ``install`` updates the lockfile for
+what it installs; ``lock write`` pins whatever is installed now.
+
+``lock verify`` checks every pinned folder concurrently. A file whose
+``(size, mtime, ctime, inode)`` matches the previous run's is not read again;
+its hash comes from a machine-local cache (``~/.openclaw/verify-cache.json``),
+so verifying an unchanged install costs one ``stat`` per file. The ctime is
+what catches an in-place edit of a store-linked file: the inode stays, and the
+mtime can be put back, but every write moves the ctime.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import stat
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from catalog.harvest import WORKERS
+from catalog.install import GLOBAL_SKILLS, resolve
+from catalog.parser import DEFAULT_README, load
+from catalog.store import Tree, hash_file
+
+LOCK_VERSION = 1
+DEFAULT_CACHE = Path.home() / ".openclaw" / "verify-cache.json"
+
+OK = "ok"
+MODIFIED = "modified"
+MISSING = "missing"
+
+# absolute file path -> [size, mtime_ns, ctime_ns, inode, sha256]
+_Cache = dict[str, list]
+
+
+def lock_path(skills_dir: str | Path) -> Path:
+    return Path(skills_dir).parent / "skills.lock"
+
+
+def read_lock(path: str | Path) -> dict[str, dict[str, str]]:
+    """``slug -> {"path": ..., "tree": ...}``; empty if there is no lockfile yet."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    if data.get("version") != LOCK_VERSION:
+        raise ValueError(f"{path}: unsupported lockfile version {data.get('version')!r}")
+    return data["skills"]
+
+
+def write_lock(path: str | Path, skills: dict[str, dict[str, str]]) -> None:
+    path = Path(path)
+    data = {"version": LOCK_VERSION, "skills": dict(sorted(skills.items()))}
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read_cache(path: Path) -> _Cache:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path: Path, cache: _Cache) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def tree_of(folder: str | Path, cache: _Cache | None = None) -> tuple[str, _Cache, int]:
+    """Tree hash of ``folder``, the cache entries of its files, and how many files had to be hashed."""
+    folder = os.path.abspath(folder)
+    cache = cache or {}
+    files, links = [], []
+    entries: _Cache = {}
+    hashed = 0
+    for base, dirs, names in os.walk(folder):
+        for name in dirs + names:
+            path = os.path.join(base, name)
+            rel = os.path.relpath(path, folder).replace(os.sep, "/")
+            if os.path.islink(path):
+                links.append((rel, os.readlink(path)))
+            elif name in names:
+                st = os.stat(path)
+                key = [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+                entry = cache.get(path)
+                if entry is None or entry[:4] != key:
+                    entry = key + [hash_file(path)]
+                    hashed += 1
+                entries[path] = entry
+                files.append((rel, entry[4], bool(st.st_mode & stat.S_IXUSR)))
+    return Tree(files, links).digest, entries, hashed
+
+
+class Check:
+    __slots__ = ("slug", "status", "expected", "actual", "hashed")
+
+    def __init__(self, slug: str, status: str, expected: str, actual: str = "", hashed: int = 0) -> None:
+        self.slug = slug
+        self.status = status
+        self.expected = expected
+        self.actual = actual
+        self.hashed = hashed
+
+    def as_dict(self) -> dict:
+        return {"skill": self.slug, "status": self.status, "expected": self.expected, "actual": self.actual}
+
+
+def update(
+    lockfile: str | Path,
+    skills_dir: str | Path,
+    pins: dict[str, str],
+    cache_path: str | Path = DEFAULT_CACHE,
+    keep: bool = True,
+) -> dict[str, dict[str, str]]:
+    """Pin the installed folders ``slug -> openclaw/skills path`` in ``lockfile``.
+
+    Other entries of the lockfile are kept, or dropped with ``keep=False``.
+    """
+    skills = read_lock(lockfile) if keep else {}
+    cache = _read_cache(Path(cache_path))
+    for slug, path in pins.items():
+        tree, entries, _ = tree_of(Path(skills_dir) / slug, cache)
+        cache.update(entries)
+        skills[slug] = {"path": path, "tree": tree}
+    write_lock(lockfile, skills)
+    _write_cache(Path(cache_path), cache)
+    return skills
+
+
+def verify(
+    lockfile: str | Path,
+    skills_dir: str | Path,
+    cache_path: str | Path | None = DEFAULT_CACHE,
+    workers: int = WORKERS,
+) -> list[Check]:
+    """Check every pinned skill under ``skills_dir`` against ``lockfile``, in lockfile order."""
+    skills = read_lock(lockfile)
+    cache = _read_cache(Path(cache_path)) if cache_path is not None else {}
+    entries: _Cache = {}
+
+    def check(item: tuple[str, dict[str, str]]) -> Check:
+        slug, pin = item
+        folder = Path(skills_dir) / slug
+        if not folder.is_dir():
+            return Check(slug, MISSING, pin["tree"])
+        tree, found, hashed = tree_of(folder, cache)
+        entries.update(found)
+        return Check(slug, OK if tree == pin["tree"] else MODIFIED, pin["tree"], tree, hashed)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        checks = list(pool.map(check, skills.items()))
+    if cache_path is not None:
+        # forget files that are gone from the verified folders
+        prefix = os.path.abspath(skills_dir) + os.sep
+        kept = {path: entry for path, entry in cache.items() if not path.startswith(prefix)}
+        kept.update(entries)
+        if kept != cache:
+            _write_cache(Path(cache_path), kept)
+    return checks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog lock", description="Pin installed skills to tree hashes, or verify them."
+    )
+    parser.add_argument("action", choices=("write", "verify"))
+    where = parser.add_mutually_exclusive_group()
+    where.add_argument("--project", help="use <project>/skills/ instead of ~/.openclaw/skills/")
+    where.add_argument("--dest", help="use this skills directory")
+    parser.add_argument("--lockfile", help="default: skills.lock next to the skills directory")
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--no-cache", action="store_true", help="hash every file, ignoring (size, mtime, ctime, inode)")
+    args = parser.parse_args(argv)
+
+    skills_dir = Path(args.dest) if args.dest else Path(args.project) / "skills" if args.project else GLOBAL_SKILLS
+    lockfile = Path(args.lockfile) if args.lockfile else lock_path(skills_dir)
+    t0 = time.perf_counter()
+    try:
+        if args.action == "verify":
+            checks = verify(lockfile, skills_dir, None if args.no_cache else DEFAULT_CACHE)
+            elapsed = (time.perf_counter() - t0) * 1000
+            bad = [c for c in checks if c.status != OK]
+            for c in bad:
+                detail = f" (tree {c.actual[:12]}, locked {c.expected[:12]})" if c.actual else ""
+                print(f"{c.slug}: {c.status}{detail}")
+            hashed = sum(c.hashed for c in checks)
+            print(
+                f"{len(checks) - len(bad)} of {len(checks)} skills match {lockfile} ({hashed} files hashed,"
+                f" {elapsed:.1f} ms)",
+                file=sys.stderr,
+            )
+            return 1 if bad else 0
+
+        locked = read_lock(lockfile)
+        names = sorted(
+            entry.name
+            for entry in os.scandir(skills_dir)
+            if not entry.name.startswith(".") and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        )
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    unresolved = [name for name in names if name not in locked]
+    targets, errors = resolve(load(args.readme), unresolved)
+    pins = {name: locked[name]["path"] for name in names if name in locked}
+    for target in targets:
+        if target.slug == target.spec:
+            pins[target.spec] = target.path
+        else:
+            errors.append((target.spec, f"matches {target.author}/{target.slug} only by display name"))
+    for name, reason in errors:
+        print(f"warning: {name}: {reason}; not pinned", file=sys.stderr)
+    update(lockfile, skills_dir, pins, DEFAULT_CACHE, keep=False)
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(f"pinned {len(pins)} skills in {lockfile} ({elapsed:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
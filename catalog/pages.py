@@ -0,0 +1,131 @@
+"""Split the catalog into one markdown page per category.
+
+``categories/<anchor>.md`` holds the skills of one category and
+``categories/README.md`` links to all of them with their counts; the Chinese
+pages go to ``categories/zh/``. A reader or tool that needs one category
+fetches a page of a few tens of KB instead of the whole README.
+
+Pages are rendered from the canonical ``data/`` catalog with the same entry
+formatting as the READMEs, and a file is only rewritten when its bytes
+change. Pages of categories that no longer exist are removed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from catalog import source
+from catalog.parser import REPO_ROOT
+from catalog.render import render_entry
+from catalog.source import CatalogData
+
+PAGES_DIR = REPO_ROOT / "categories"
+
+# (directory, language, path of the full README relative to the directory)
+OUTPUTS = (
+    (PAGES_DIR, "en", "../README.md"),
+    (PAGES_DIR / "zh", "zh", "../../README_zh.md"),
+)
+
+_TEXT = {
+    "en": {
+        "index": "Awesome OpenClaw Skills by category",
+        "summary": "{count:,} skills in {categories} categories. The full list is in the [main README]({readme}).",
+        "header": "| Category | Skills |",
+        "back": "[← All categories](README.md) · {count} skills",
+    },
+    "zh": {
+        "index": "按类别浏览 Awesome OpenClaw Skills",
+        "summary": "{categories} 个类别，共 {count:,} 个技能。完整列表见[主 README]({readme})。",
+        "header": "| 类别 | 技能数 |",
+        "back": "[← 全部类别](README.md) · {count} 个技能",
+    },
+}
+
+
+def page_name(anchor: str) -> str:
+    return f"{anchor}.md"
+
+
+def render_pages(data: CatalogData, language: str, readme: str) -> dict[str, str]:
+    """File name -> content for every category page plus the index."""
+    text = _TEXT[language]
+    pages = {}
+    summary = text["summary"].format(count=len(data), categories=len(data.categories), readme=readme)
+    rows = [f"# {text['index']}", "", summary]
+    rows.extend(("", text["header"], "|---|---:|"))
+    for category in data.categories:
+        skills = data.skills.get(category.title, [])
+        title = category.title_zh if language == "zh" else category.title
+        name = page_name(category.anchor)
+        rows.append(f"| [{title}]({name}) | {len(skills)} |")
+        lines = [f"# {title}", "", text["back"].format(count=len(skills)), ""]
+        lines.extend(render_entry(skill, language) for skill in skills)
+        pages[name] = "\n".join(lines) + "\n"
+    pages["README.md"] = "\n".join(rows) + "\n"
+    return pages
+
+
+def write_pages(directory: Path, pages: dict[str, str], check: bool = False) -> tuple[list[str], list[str]]:
+    """Write changed pages and delete stale ones; return ``(written, removed)`` file names."""
+    written = []
+    for name, content in pages.items():
+        path = directory / name
+        data = content.encode()
+        try:
+            if path.read_bytes() == data:
+                continue
+        except OSError:
+            pass
+        written.append(name)
+        if not check:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+    removed = []
+    if directory.is_dir():
+        for path in directory.glob("*.md"):
+            if path.name not in pages:
+                removed.append(path.name)
+                if not check:
+                    path.unlink()
+    return written, sorted(removed)
+
+
+def build(data: CatalogData, outputs=OUTPUTS, check: bool = False) -> list[tuple[Path, list[str], list[str]]]:
+    return [
+        (directory, *write_pages(directory, render_pages(data, language, readme), check))
+        for directory, language, readme in outputs
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog pages", description="Write one markdown page per category into categories/."
+    )
+    parser.add_argument("--check", action="store_true", help="exit 1 if a page is out of date; write nothing")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    results = build(source.read(), check=args.check)
+    elapsed = (time.perf_counter() - t0) * 1000
+    stale = False
+    for directory, written, removed in results:
+        where = directory.relative_to(REPO_ROOT)
+        if written or removed:
+            stale = True
+            verb = "out of date" if args.check else "updated"
+            print(f"{where}: {verb} {len(written)} pages" + (f", {len(removed)} stale" if removed else ""))
+        else:
+            print(f"{where}: up to date")
+    print(f"{elapsed:.1f} ms")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
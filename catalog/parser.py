@@ -0,0 +1,386 @@
+"""Single-pass parser for the skill catalog in README.md.
+
+The README is walked once as a byte stream. Every ``<details>`` block opens a
+category, and every ``- [name](url) - description`` bullet inside it becomes an
+entry. Entries are not materialized as objects: the store keeps the raw README
+bytes as one shared text buffer and records byte offsets into it in flat
+``array`` columns, with category and author strings interned once.
+
+    >>> from catalog import load
+    >>> cat = load()
+    >>> len(cat), len(cat.sections)
+    (2885, 32)
+    >>> cat[0].name, cat[0].category
+    ('achurch', 'Coding Agents & IDEs')
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_README = REPO_ROOT / "README.md"
+
+LINK_SKILL = 0
+LINK_AUTHOR = 1
+LINK_EXTERNAL = 2
+LINK_KINDS = ("skill", "author", "external")
+
+_EN_DASH = "–".encode()
+
+_ENTRY = re.compile(
+    rb"- \[(?P<name>[^\]\n]*)\]\((?P<url>[^)\s]*)\)"
+    rb"(?:[ \t]+(?:-|" + _EN_DASH + rb")[ \t]+(?P<desc>[^\n]*))?"
+)
+_TRAILING = b" \t\r"
+_SUMMARY = re.compile(rb"<summary><h3[^>]*>(?P<title>[^<]*)</h3>")
+
+_CANONICAL_PREFIX = "https://github.com/openclaw/skills/tree/main/skills/"
+_GITHUB_TREE = re.compile(r"github\.com/[^/]+/[^/]+/(?:tree|blob)/[^/]+/(skills/[^?#]*)", re.I)
+_CLAWHUB = re.compile(r"clawhub\.(?:ai|com)/([^/?#]+)/([^/?#]+)", re.I)
+_ANCHOR_DROP = re.compile(r"[^\w\- ]", re.U)
+
+
+def anchor(title: str) -> str:
+    """Return the GitHub heading anchor for a category title."""
+    return _ANCHOR_DROP.sub("", title.strip().lower()).replace(" ", "-")
+
+
+def split_link(url: str) -> tuple[int, str, str, str]:
+    """Classify a skill URL into ``(kind, author, slug, path)``.
+
+    ``path`` is the repo-relative folder inside openclaw/skills (``skills/<author>``
+    or ``skills/<author>/<slug>``) and is empty for external links.
+    """
+    if url.startswith(_CANONICAL_PREFIX):
+        path = url[len(_CANONICAL_PREFIX) - len("skills/") :].rstrip("/")
+    else:
+        m = _GITHUB_TREE.search(url)
+        path = m.group(1).rstrip("/") if m else ""
+    if path:
+        is_skill = path.endswith("/SKILL.md")
+        if is_skill:
+            path = path[: -len("/SKILL.md")]
+        parts = path.split("/")
+        author = parts[1] if len(parts) > 1 else ""
+        if is_skill:
+            return LINK_SKILL, author, parts[-1], path
+        if len(parts) == 2:
+            return LINK_AUTHOR, author, "", path
+        return LINK_EXTERNAL, author, parts[-1], ""
+    m = _CLAWHUB.search(url)
+    if m and m.group(1).lower() != "skills":
+        return LINK_EXTERNAL, m.group(1), m.group(2), ""
+    return LINK_EXTERNAL, "", "", ""
+
+
+class Section:
+    """One ``<details>`` category block.
+
+    ``start``/``end`` are byte offsets of the block in the buffer (from the
+    ``<details>`` line to just past ``</details>``), ``first``/``stop`` the
+    half-open range of entry indices it holds.
+    """
+
+    __slots__ = ("index", "title", "anchor", "expanded", "start", "end", "line", "first", "stop")
+
+    def __init__(self, index: int, title: str, expanded: bool, start: int, line: int, first: int) -> None:
+        self.index = index
+        self.title = title
+        self.anchor = anchor(title)
+        self.expanded = expanded
+        self.start = start
+        self.end = start
+        self.line = line
+        self.first = first
+        self.stop = first
+
+    def __len__(self) -> int:
+        return self.stop - self.first
+
+    def __repr__(self) -> str:
+        return f"<Section {self.title!r} entries={len(self)}>"
+
+
+class Entry:
+    """Lazy view of one catalog entry; fields are decoded on access."""
+
+    __slots__ = ("_catalog", "index")
+
+    def __init__(self, catalog: Catalog, index: int) -> None:
+        self._catalog = catalog
+        self.index = index
+
+    def _field(self, column: int) -> str:
+        spans = self._catalog._spans
+        base = self.index * 6 + column * 2
+        return self._catalog.buffer[spans[base] : spans[base + 1]].decode()
+
+    @property
+    def name(self) -> str:
+        return self._field(0)
+
+    @property
+    def url(self) -> str:
+        return self._field(1)
+
+    @property
+    def description(self) -> str:
+        return self._field(2)
+
+    @property
+    def category(self) -> str:
+        return self._catalog.sections[self._catalog._category[self.index]].title
+
+    @property
+    def section(self) -> Section:
+        return self._catalog.sections[self._catalog._category[self.index]]
+
+    @property
+    def author(self) -> str:
+        return self._catalog.authors[self._catalog._author[self.index]]
+
+    @property
+    def kind(self) -> int:
+        return self._catalog._kind[self.index]
+
+    @property
+    def slug(self) -> str:
+        """Skill folder name for ``SKILL.md`` links, the entry name otherwise."""
+        return split_link(self.url)[2] or self.name
+
+    @property
+    def path(self) -> str:
+        return split_link(self.url)[3]
+
+    @property
+    def line(self) -> int:
+        return self._catalog._line[self.index]
+
+    @property
+    def span(self) -> tuple[int, int]:
+        """Byte offsets of the whole bullet line (without the newline)."""
+        return self._catalog.span_of(self.index)
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "url": self.url,
+            "description": self.description,
+            "category": self.category,
+            "author": self.author,
+            "kind": LINK_KINDS[self.kind],
+            "line": self.line,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Entry) and other._catalog is self._catalog and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self._catalog), self.index))
+
+    def __repr__(self) -> str:
+        return f"<Entry {self.index} {self.name!r} [{self.category}]>"
+
+
+class Catalog:
+    """Array-backed store of every entry in a README.
+
+    Per entry it keeps six ``uint32`` byte offsets (name, url, description
+    start/end) into ``buffer``, the bullet line bounds, the 1-based line
+    number, the category index, the author index and the link kind.
+    """
+
+    __slots__ = (
+        "buffer",
+        "sections",
+        "authors",
+        "_author_ids",
+        "_spans",
+        "_bounds",
+        "_line",
+        "_category",
+        "_author",
+        "_kind",
+        "_by_name",
+        "_digest",
+    )
+
+    def __init__(self, buffer: bytes) -> None:
+        self.buffer = buffer
+        self.sections: list[Section] = []
+        self.authors: list[str] = [""]
+        self._author_ids: dict[str, int] = {"": 0}
+        self._spans = array("I")
+        self._bounds = array("I")
+        self._line = array("I")
+        self._category = array("H")
+        self._author = array("I")
+        self._kind = array("B")
+        self._by_name: dict[str, list[int]] | None = None
+        self._digest: str | None = None
+
+    def __len__(self) -> int:
+        return len(self._line)
+
+    def __getitem__(self, index: int) -> Entry:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("catalog index out of range")
+        return Entry(self, index)
+
+    def __iter__(self) -> Iterator[Entry]:
+        for i in range(len(self)):
+            yield Entry(self, i)
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 hex digest of the source README bytes."""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.buffer).hexdigest()
+        return self._digest
+
+    def section(self, title: str) -> Section:
+        """Look up a category by title or anchor."""
+        for section in self.sections:
+            if section.title == title or section.anchor == title:
+                return section
+        raise KeyError(title)
+
+    def entries(self, category: str | Section) -> Iterator[Entry]:
+        section = category if isinstance(category, Section) else self.section(category)
+        for i in range(section.first, section.stop):
+            yield Entry(self, i)
+
+    def find(self, name: str) -> list[Entry]:
+        """Return every entry whose bracketed name equals ``name``."""
+        if self._by_name is None:
+            by_name: dict[str, list[int]] = {}
+            for i in range(len(self)):
+                by_name.setdefault(self.name_of(i), []).append(i)
+            self._by_name = by_name
+        return [Entry(self, i) for i in self._by_name.get(name, ())]
+
+    def name_of(self, index: int) -> str:
+        return self.buffer[self._spans[index * 6] : self._spans[index * 6 + 1]].decode()
+
+    def description_of(self, index: int) -> str:
+        return self.buffer[self._spans[index * 6 + 4] : self._spans[index * 6 + 5]].decode()
+
+    def url_of(self, index: int) -> str:
+        return self.buffer[self._spans[index * 6 + 2] : self._spans[index * 6 + 3]].decode()
+
+    def category_of(self, index: int) -> int:
+        return self._category[index]
+
+    def author_of(self, index: int) -> int:
+        return self._author[index]
+
+    def kind_of(self, index: int) -> int:
+        return self._kind[index]
+
+    def line_of(self, index: int) -> int:
+        return self._line[index]
+
+    def span_of(self, index: int) -> tuple[int, int]:
+        """Byte offsets of the whole bullet line (without the newline)."""
+        return self._bounds[index * 2], self._bounds[index * 2 + 1]
+
+    def _intern_author(self, author: str) -> int:
+        ident = self._author_ids.get(author)
+        if ident is None:
+            ident = self._author_ids[author] = len(self.authors)
+            self.authors.append(sys.intern(author))
+        return ident
+
+    def nbytes(self) -> int:
+        """Approximate resident size of the offset columns in bytes."""
+        columns = (self._spans, self._bounds, self._line, self._category, self._author, self._kind)
+        return sum(c.itemsize * len(c) for c in columns)
+
+
+def parse(buffer: bytes) -> Catalog:
+    """Build a :class:`Catalog` from README bytes in one pass."""
+    catalog = Catalog(buffer)
+    spans, bounds, lines = catalog._spans, catalog._bounds, catalog._line
+    categories, authors, kinds = catalog._category, catalog._author, catalog._kind
+    sections = catalog.sections
+    current: Section | None = None
+    pending: tuple[int, int, bool] | None = None
+    size = len(buffer)
+    pos = 0
+    line = 0
+
+    while pos < size:
+        eol = buffer.find(b"\n", pos)
+        if eol < 0:
+            eol = size
+        line += 1
+        if buffer.startswith(b"- [", pos):
+            m = _ENTRY.match(buffer, pos, eol) if current is not None else None
+            if m is not None:
+                url = m.group("url").decode()
+                link_kind, author, _, _ = split_link(url)
+                desc_start, desc_end = m.span("desc") if m.group("desc") is not None else (m.end(), m.end())
+                while desc_end > desc_start and buffer[desc_end - 1] in _TRAILING:
+                    desc_end -= 1
+                spans.extend((m.start("name"), m.end("name"), m.start("url"), m.end("url"), desc_start, desc_end))
+                end = eol - 1 if buffer[eol - 1 : eol] == b"\r" else eol
+                bounds.extend((pos, end))
+                lines.append(line)
+                categories.append(current.index)
+                authors.append(catalog._intern_author(author))
+                kinds.append(link_kind)
+        elif buffer.startswith(b"<details", pos):
+            pending = (pos, line, b"open" in buffer[pos:eol])
+        elif buffer.startswith(b"<summary>", pos):
+            m = _SUMMARY.match(buffer, pos, eol)
+            if m is not None and pending is not None:
+                start, start_line, expanded = pending
+                title = sys.intern(m.group("title").decode().strip())
+                current = Section(len(sections), title, expanded, start, start_line, len(lines))
+                sections.append(current)
+            pending = None
+        elif buffer.startswith(b"</details>", pos):
+            pending = None
+            if current is not None:
+                current.end = min(eol + 1, size)
+                current.stop = len(lines)
+                current = None
+        pos = eol + 1
+    return catalog
+
+
+def load(path: str | Path = DEFAULT_README) -> Catalog:
+    """Read and parse a README file."""
+    with open(path, "rb") as fh:
+        return parse(fh.read())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog parse", description="Parse the skill catalog and print per-category counts."
+    )
+    parser.add_argument("readme", nargs="?", default=str(DEFAULT_README))
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    catalog = load(args.readme)
+    elapsed = (time.perf_counter() - t0) * 1000
+    for section in catalog.sections:
+        print(f"{len(section):5d}  {section.title}")
+    print(f"{len(catalog):5d}  entries in {len(catalog.sections)} categories, {len(catalog.authors) - 1} authors")
+    print(f"parsed in {elapsed:.2f} ms, {catalog.nbytes() / 1024:.0f} KiB of offsets")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Reconcile the hand-maintained counts in the READMEs with the actual lists.
+
+Per-category counts come from the ``<details>`` sections of each file (one
+parse). They are compared with
+
+* the ``(N)`` after every Table of Contents link,
+* the ``Discover N`` / ``发现 N`` header line,
+* the shields badge ``skills-N``, and
+* the ``**N skills**`` / ``**N 个技能**`` sentence,
+
+and only the spans that differ are rewritten. When every replacement keeps
+its byte length the file is patched in place at those offsets; otherwise it is
+rewritten from the first changed byte onwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from catalog.parser import Catalog, parse
+from catalog.render import COUNT_PATTERNS, OUTPUTS, TOC_TABLE
+
+_COUNTS = tuple((re.compile(pattern.pattern.encode()), name) for pattern, name in COUNT_PATTERNS)
+_TOC_TABLE = re.compile(TOC_TABLE.pattern.encode(), re.M)
+_TOC_CELL = re.compile(rb"\[(?P<title>[^\]]+)\]\(#(?P<anchor>[^)\s]+)\) \((?P<count>\d+)\)")
+
+DEFAULT_FILES = tuple(path for path, _, _ in OUTPUTS)
+
+
+class Edit:
+    """Replace ``buffer[start:end]`` (the old count) with ``new``."""
+
+    __slots__ = ("start", "end", "old", "new", "what", "line")
+
+    def __init__(self, start: int, end: int, old: bytes, new: bytes, what: str, line: int) -> None:
+        self.start = start
+        self.end = end
+        self.old = old
+        self.new = new
+        self.what = what
+        self.line = line
+
+    def __repr__(self) -> str:
+        return f"<Edit line {self.line} {self.what}: {self.old.decode()} -> {self.new.decode()}>"
+
+
+def plan(catalog: Catalog) -> list[Edit]:
+    """Every count span in ``catalog.buffer`` that disagrees with the parsed lists."""
+    buffer = catalog.buffer
+    total = len(catalog)
+    values = {"count": str(total).encode(), "count_grouped": f"{total:,}".encode()}
+    edits = []
+
+    def line_at(offset: int) -> int:
+        return buffer.count(b"\n", 0, offset) + 1
+
+    for pattern, name in _COUNTS:
+        for m in pattern.finditer(buffer):
+            if m.group() != values[name]:
+                edits.append(Edit(m.start(), m.end(), m.group(), values[name], f"total ({name})", line_at(m.start())))
+
+    table = _TOC_TABLE.search(buffer)
+    if table is not None:
+        by_anchor = {s.anchor: len(s) for s in catalog.sections}
+        by_title = {s.title: len(s) for s in catalog.sections}
+        for m in _TOC_CELL.finditer(buffer, table.start(), table.end()):
+            title = m.group("title").decode()
+            expected = by_anchor.get(m.group("anchor").decode(), by_title.get(title))
+            if expected is None:
+                continue
+            new = str(expected).encode()
+            if m.group("count") != new:
+                start, end = m.span("count")
+                edits.append(Edit(start, end, m.group("count"), new, f"ToC {title}", line_at(start)))
+    edits.sort(key=lambda e: e.start)
+    return edits
+
+
+def apply(path: str | Path, buffer: bytes, edits: list[Edit]) -> int:
+    """Write ``edits`` into ``path`` (whose current content is ``buffer``); return bytes written."""
+    if not edits:
+        return 0
+    written = 0
+    with open(path, "r+b") as fh:
+        if all(len(e.new) == e.end - e.start for e in edits):
+            for edit in edits:
+                fh.seek(edit.start)
+                written += fh.write(edit.new)
+            return written
+        chunks = []
+        pos = edits[0].start
+        for edit in edits:
+            chunks.append(buffer[pos : edit.start])
+            chunks.append(edit.new)
+            pos = edit.end
+        chunks.append(buffer[pos:])
+        fh.seek(edits[0].start)
+        written = fh.write(b"".join(chunks))
+        fh.truncate()
+    return written
+
+
+def reconcile(path: str | Path, check: bool = False) -> list[Edit]:
+    """Fix the counts in one README; with ``check`` only report them."""
+    with open(path, "rb") as fh:
+        buffer = fh.read()
+    edits = plan(parse(buffer))
+    if not check:
+        apply(path, buffer, edits)
+    return edits
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog reconcile", description="Fix the skill counts in the header, badge and ToC."
+    )
+    parser.add_argument("files", nargs="*", default=[str(p) for p in DEFAULT_FILES])
+    parser.add_argument("--check", action="store_true", help="report drift and exit 1 without writing")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    drift = 0
+    for path in args.files:
+        edits = reconcile(path, args.check)
+        drift += len(edits)
+        for edit in edits:
+            print(f"{path}:{edit.line}: {edit.what}: {edit.old.decode()} -> {edit.new.decode()}")
+    elapsed = (time.perf_counter() - t0) * 1000
+    verb = "found" if args.check else "fixed"
+    print(f"{verb} {drift} stale counts in {len(args.files)} files ({elapsed:.1f} ms)", file=sys.stderr)
+    return 1 if args.check and drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
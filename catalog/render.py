@@ -0,0 +1,365 @@
+"""Render README.md and README_zh.md from the canonical catalog in ``data/``.
+
+Each README has a template in ``data/templates/`` holding the hand-written
+chrome (intro, installation, security notice, ...) with placeholders:
+
+``{{count}}``          total number of skills (``2885``)
+``{{count_grouped}}``  the same with thousands separators (``2,885``)
+``{{toc}}``            the Table of Contents table with per-category counts
+``{{sections}}``       every ``<details>`` category block
+
+Templates are compiled once per process and recompiled only when the file
+changes. A manifest (``data/.render-manifest.json``, not committed) keeps the
+hash of every rendered section and of each output file, so a run where no
+section, count or template changed returns without touching the outputs, and
+an output file is rewritten only when its bytes differ.
+
+The manifest also holds the hash of the bytes last rendered to each README,
+keyed by the README's path relative to the manifest so a checkout can move.
+If the file on disk no longer matches it, the README was edited by hand
+(CONTRIBUTING.md asks contributors to edit README.md) and rendering would
+drop those edits, so :func:`render` raises :class:`RenderConflict` instead;
+``--import`` takes the edits into ``data/`` and ``--force`` overwrites them.
+Without a recorded hash (a fresh clone), a README counts as unedited when its
+chrome is the template and its entries are exactly those of ``data/``, each
+either as it is now or as committed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from catalog import source
+from catalog.parser import REPO_ROOT, load
+from catalog.source import DATA_DIR, CatalogData, Category, Skill
+
+TEMPLATE_DIR = DATA_DIR / "templates"
+MANIFEST = DATA_DIR / ".render-manifest.json"
+TOC_COLUMNS = 3
+
+# (output, language, template)
+OUTPUTS = (
+    (REPO_ROOT / "README.md", "en", TEMPLATE_DIR / "README.md.tmpl"),
+    (REPO_ROOT / "README_zh.md", "zh", TEMPLATE_DIR / "README_zh.md.tmpl"),
+)
+
+# Hand-maintained counts in the READMEs and the placeholder each one becomes.
+COUNT_PATTERNS = (
+    (re.compile(r"(?<=Discover )\d[\d,]*"), "count"),
+    (re.compile(r"(?<=发现 )\d[\d,]*"), "count"),
+    (re.compile(r"(?<=badge/skills-)\d+(?=-)"), "count"),
+    (re.compile(r"(?<=has \*\*)\d[\d,]*(?= skills\*\*)"), "count_grouped"),
+    (re.compile(r"(?<=收录了 \*\*)\d[\d,]*(?= 个技能\*\*)"), "count_grouped"),
+)
+TOC_TABLE = re.compile(r"^\|(?: \|){%d}\n\|(?:---\|){%d}\n(?:\|.*\|\n)+" % (TOC_COLUMNS, TOC_COLUMNS), re.M)
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_compiled: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+
+
+def compile_template(path: Path) -> list[str]:
+    """Split a template into alternating literal text and placeholder names (cached)."""
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _compiled.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    parts = _PLACEHOLDER.split(path.read_text(encoding="utf-8"))
+    _compiled[path] = (key, parts)
+    return parts
+
+
+def render_entry(skill: Skill, language: str) -> str:
+    description = skill.description_zh if language == "zh" and skill.description_zh else skill.description
+    link = f"- [{skill.name}]({skill.url})"
+    return f"{link} - {description}" if description else link
+
+
+def render_section(category: Category, skills: list[Skill], language: str) -> str:
+    title = category.title_zh if language == "zh" else category.title
+    lines = [
+        "<details open>" if category.expanded else "<details>",
+        f'<summary><h3 style="display:inline">{title}</h3></summary>',
+        "",
+    ]
+    lines.extend(render_entry(skill, language) for skill in skills)
+    lines.extend(("", "</details>", ""))
+    return "\n".join(lines)
+
+
+def render_toc(data: CatalogData, language: str) -> str:
+    categories = data.categories
+    rows = -(-len(categories) // TOC_COLUMNS)
+    lines = ["|" + " |" * TOC_COLUMNS, "|" + "---|" * TOC_COLUMNS]
+    for row in range(rows):
+        cells = []
+        for column in range(TOC_COLUMNS):
+            i = column * rows + row
+            if i < len(categories):
+                c = categories[i]
+                title = c.title_zh if language == "zh" else c.title
+                cells.append(f" [{title}](#{c.anchor}) ({len(data.skills.get(c.title, ()))}) |")
+            else:
+                cells.append(" |")
+        lines.append("|" + "".join(cells))
+    return "\n".join(lines) + "\n"
+
+
+def _digest(text: str | bytes) -> str:
+    return hashlib.blake2b(text.encode() if isinstance(text, str) else text, digest_size=16).hexdigest()
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _file_key(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _entries(data: CatalogData, language: str) -> list[tuple[str, list[tuple[str, str, str]]]]:
+    """Every category title with its ``(name, url, description)`` entries, as rendered in ``language``."""
+    zh = language == "zh"
+    return [
+        (
+            c.title_zh if zh else c.title,
+            [
+                (s.name, s.url, s.description_zh if zh and s.description_zh else s.description)
+                for s in data.skills.get(c.title, ())
+            ],
+        )
+        for c in data.categories
+    ]
+
+
+def _parsed_entries(path: Path) -> list[tuple[str, list[tuple[str, str, str]]]]:
+    catalog = load(path)
+    return [
+        (
+            section.title,
+            [
+                (catalog.name_of(i), catalog.url_of(i), catalog.description_of(i))
+                for i in range(section.first, section.stop)
+            ],
+        )
+        for section in catalog.sections
+    ]
+
+
+class _Baselines:
+    """Whether a README with no recorded hash still holds only rendered text.
+
+    It does when its chrome is the template and its entries are those of
+    ``data/``, each either as on disk now or as committed.
+    """
+
+    __slots__ = ("data", "data_dir", "_committed")
+
+    def __init__(self, data: CatalogData, data_dir: Path) -> None:
+        self.data = data
+        self.data_dir = data_dir
+        self._committed: list[CatalogData] | None = None
+
+    def matches(self, path: Path, language: str, template_path: Path) -> bool:
+        try:
+            chrome = extract_template(path)
+        except ValueError:
+            return False
+        if chrome != template_path.read_text(encoding="utf-8") and chrome != source.committed_text(template_path):
+            return False
+        entries = _parsed_entries(path)
+        if entries == _entries(self.data, language):
+            return True
+        if self._committed is None:
+            committed = source.read_committed(self.data_dir)
+            self._committed = [committed] if committed is not None else []
+        return any(entries == _entries(data, language) for data in self._committed)
+
+
+class RenderConflict(Exception):
+    """An output was edited after it was last rendered."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        super().__init__(", ".join(path.name for path in paths) + " changed since the last render")
+        self.paths = paths
+
+
+class RenderResult:
+    __slots__ = ("path", "changed_sections", "written")
+
+    def __init__(self, path: Path, changed_sections: list[str], written: bool) -> None:
+        self.path = path
+        self.changed_sections = changed_sections
+        self.written = written
+
+
+def render(
+    data: CatalogData,
+    outputs=OUTPUTS,
+    manifest_path: Path = MANIFEST,
+    check: bool = False,
+    force: bool = False,
+) -> list[RenderResult]:
+    """Render every output; with ``check`` nothing is written.
+
+    ``written`` on a result means the file was (or, with ``check``, would be)
+    rewritten. Unless ``force`` is given, :class:`RenderConflict` is raised
+    before anything is written when an output that would be rewritten differs
+    from what was last rendered to it.
+    """
+    manifest = {} if force else _load_manifest(manifest_path)
+    # the manifest lives in the data directory, next to the committed jsonl files
+    baselines = _Baselines(data, manifest_path.parent)
+    results = []
+    pending = []
+    conflicts = []
+    for path, language, template_path in outputs:
+        parts = compile_template(template_path)
+        sections = {c.title: render_section(c, data.skills.get(c.title, []), language) for c in data.categories}
+        hashes = {title: _digest(text) for title, text in sections.items()}
+        values = {"count": str(len(data)), "count_grouped": f"{len(data):,}", "toc": render_toc(data, language)}
+        state = {
+            "template": _digest(template_path.read_bytes()),
+            "values": _digest(json.dumps(values, sort_keys=True)),
+            "sections": hashes,
+        }
+        key = Path(os.path.relpath(path, manifest_path.parent)).as_posix()
+        previous = manifest.get(key, {})
+        changed = [title for title, digest in hashes.items() if previous.get("sections", {}).get(title) != digest]
+        unchanged = (
+            not changed
+            and previous.get("template") == state["template"]
+            and previous.get("values") == state["values"]
+            and list(previous.get("sections", {})) == list(hashes)
+            and previous.get("file") is not None
+            and previous.get("file") == _file_key(path)
+        )
+        if unchanged:
+            results.append(RenderResult(path, [], False))
+            continue
+
+        values["sections"] = "\n".join(sections.values())
+        chunks = []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                chunks.append(part)
+            elif part in values:
+                chunks.append(values[part])
+            else:
+                raise KeyError(f"{template_path}: unknown placeholder {{{{{part}}}}}")
+        output = "".join(chunks).encode()
+        try:
+            current = path.read_bytes()
+        except OSError:
+            current = None
+        written = current != output
+        if written and current is not None and not force:
+            recorded = previous.get("output")
+            if recorded is not None:
+                edited = _digest(current) != recorded
+            else:
+                edited = not baselines.matches(path, language, template_path)
+            if edited:
+                conflicts.append(path)
+        state["output"] = _digest(output)
+        pending.append((path, key, output, state, written))
+        results.append(RenderResult(path, changed, written))
+    if conflicts:
+        raise RenderConflict(conflicts)
+    if not check:
+        for path, key, output, state, written in pending:
+            if written:
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_bytes(output)
+                os.replace(tmp, path)
+            state["file"] = _file_key(path)
+            manifest[key] = state
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=1, ensure_ascii=False), encoding="utf-8")
+    return results
+
+
+def extract_template(readme: Path) -> str:
+    """Turn an existing README into a template by replacing generated regions."""
+    catalog = load(readme)
+    if not catalog.sections:
+        raise ValueError(f"{readme}: no <details> categories found")
+    buffer = catalog.buffer
+    start, end = catalog.sections[0].start, catalog.sections[-1].end
+    text = buffer[:start].decode() + "{{sections}}" + buffer[end:].decode()
+    text, found = TOC_TABLE.subn("{{toc}}", text, count=1)
+    if not found:
+        raise ValueError(f"{readme}: Table of Contents table not found")
+    for pattern, name in COUNT_PATTERNS:
+        text = pattern.sub("{{%s}}" % name, text)
+    return text
+
+
+def import_all(outputs=OUTPUTS, data_dir: Path = DATA_DIR) -> CatalogData:
+    """Create ``data/`` (skills, categories and templates) from the current READMEs."""
+    (english, _, _), (chinese, _, _) = outputs[0], outputs[1]
+    data = source.import_readmes(english, chinese)
+    source.write(data, data_dir)
+    for path, _, template_path in outputs:
+        template_path.parent.mkdir(parents=True, exist_ok=True)
+        template_path.write_text(extract_template(path), encoding="utf-8")
+    return data
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog render", description="Render README.md and README_zh.md from data/."
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--import", dest="do_import", action="store_true", help="rebuild data/ from the READMEs")
+    group.add_argument("--check", action="store_true", help="exit 1 if a README is out of date; write nothing")
+    parser.add_argument(
+        "--force", action="store_true", help="ignore the manifest and overwrite READMEs even if edited by hand"
+    )
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    if args.do_import:
+        data = import_all()
+        print(f"imported {len(data)} skills in {len(data.categories)} categories into {DATA_DIR}")
+        return 0
+    try:
+        results = render(source.read(), check=args.check, force=args.force)
+    except RenderConflict as exc:
+        print(
+            f"error: {exc}; run `python -m catalog render --import` to take the edits into data/,"
+            " or --force to overwrite them",
+            file=sys.stderr,
+        )
+        return 1
+    elapsed = (time.perf_counter() - t0) * 1000
+    stale = False
+    for result in results:
+        name = result.path.name
+        if result.written:
+            stale = True
+            verb = "out of date" if args.check else "wrote"
+            detail = ", ".join(result.changed_sections) or "counts/template"
+            print(f"{verb} {name} ({detail})")
+        else:
+            print(f"{name} up to date")
+    print(f"{elapsed:.1f} ms")
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""Resolve installed skill names to folders, honoring Workspace > Local > Bundled.
+
+A skill is a sub-folder holding a ``SKILL.md`` in one of the skills
+directories, searched in priority order:
+
+* Workspace: ``<project>/skills/``
+* Local: ``~/.openclaw/skills/`` (the README's "Global" location)
+* Bundled: the skills shipped with OpenClaw, when ``--bundled`` or
+  ``$OPENCLAW_BUNDLED_SKILLS`` names their directory
+
+:class:`Resolver` lists every directory once and keeps one merged
+``name -> folder`` dict, so a lookup is a dict access instead of a ``stat``
+per location. Changes are picked up incrementally before each call: on Linux
+an inotify watch on every directory reports created, deleted and renamed
+folders, a watch on every skill folder reports its ``SKILL.md`` coming and
+going, and only those names are re-checked; elsewhere, or for a directory
+that does not exist yet, the directory's mtime is polled at most once per
+:data:`POLL_INTERVAL` and only that directory is re-listed, and a skill found
+in an unwatched folder has its ``SKILL.md`` checked again before it is returned.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+from catalog.install import GLOBAL_SKILLS
+
+try:
+    import ctypes
+    import ctypes.util
+
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True) if sys.platform.startswith("linux") else None
+    _libc.inotify_init1
+except (ImportError, OSError, AttributeError):
+    _libc = None
+
+WORKSPACE = "workspace"
+LOCAL = "local"
+BUNDLED = "bundled"
+
+POLL_INTERVAL = 1.0
+
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ONLYDIR = 0x01000000
+_IN_MASK = _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+# on a skill folder: its SKILL.md being created, deleted or renamed
+_IN_FOLDER_MASK = _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR
+_EVENT = struct.Struct("iIII")
+
+
+def default_locations(project: str | Path | None = None, bundled: str | Path | None = None) -> list[tuple[str, Path]]:
+    """``(label, directory)`` in priority order; ``project`` defaults to the working directory."""
+    locations = [(WORKSPACE, Path(project or os.getcwd()) / "skills"), (LOCAL, GLOBAL_SKILLS)]
+    bundled = bundled or os.environ.get("OPENCLAW_BUNDLED_SKILLS")
+    if bundled:
+        locations.append((BUNDLED, Path(bundled)))
+    return locations
+
+
+def _is_skill(directory: str, name: str) -> bool:
+    return not name.startswith(".") and os.path.isfile(os.path.join(directory, name, "SKILL.md"))
+
+
+class Resolution:
+    __slots__ = ("name", "path", "location")
+
+    def __init__(self, name: str, path: str, location: str) -> None:
+        self.name = name
+        self.path = path
+        self.location = location
+
+    def as_dict(self) -> dict:
+        return {"name": self.name, "path": self.path, "location": self.location}
+
+    def __repr__(self) -> str:
+        return f"<Resolution {self.name!r} {self.location}>"
+
+
+class _Location:
+    """One skills directory: the skill names in it and how it is kept current."""
+
+    __slots__ = ("rank", "label", "path", "names", "pending", "wd", "key", "folders")
+
+    def __init__(self, rank: int, label: str, path: Path) -> None:
+        self.rank = rank
+        self.label = label
+        self.path = str(path)
+        self.names: set[str] = set()
+        # folders seen without a SKILL.md yet (a copy in progress); re-checked on lookup
+        self.pending: set[str] = set()
+        self.wd: int | None = None
+        self.key: tuple[int, int] | None = None
+        # skill folder name -> inotify watch on it
+        self.folders: dict[str, int] = {}
+
+    def scan(self) -> tuple[set[str], set[str]]:
+        names, pending = set(), set()
+        try:
+            with os.scandir(self.path) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.is_dir():
+                        continue
+                    (names if _is_skill(self.path, entry.name) else pending).add(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return names, pending
+
+    def stat_key(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_ino
+
+
+class Resolver:
+    """Merged index of installed skills across locations, refreshed incrementally."""
+
+    def __init__(self, locations: list[tuple[str, str | Path]] | None = None, watch: bool = True) -> None:
+        locations = locations or default_locations()
+        self.locations = [_Location(rank, label, path) for rank, (label, path) in enumerate(locations)]
+        self._index: dict[str, _Location] = {}
+        self._by_wd: dict[int, _Location] = {}
+        self._folder_wd: dict[int, tuple[_Location, str]] = {}
+        self._fd = -1
+        if watch and _libc is not None:
+            fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+        self._checked = 0.0
+        for location in self.locations:
+            self._watch(location)
+            self._rescan(location)
+
+    def __enter__(self) -> Resolver:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._by_wd.clear()
+            self._folder_wd.clear()
+            for location in self.locations:
+                location.wd = None
+                location.folders.clear()
+
+    @property
+    def watching(self) -> bool:
+        return self._fd >= 0
+
+    def _watch(self, location: _Location) -> None:
+        if self._fd < 0 or location.wd is not None:
+            return
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(location.path), _IN_MASK)
+        if wd >= 0:
+            location.wd = wd
+            self._by_wd[wd] = location
+
+    def _watch_folder(self, location: _Location, name: str) -> None:
+        """Watch the folder ``name`` for its SKILL.md, or stop watching it once it is gone."""
+        if location.wd is None:
+            return
+        present = name in location.names or name in location.pending
+        wd = location.folders.get(name)
+        if present and wd is None:
+            wd = _libc.inotify_add_watch(self._fd, os.fsencode(os.path.join(location.path, name)), _IN_FOLDER_MASK)
+            if wd >= 0:
+                location.folders[name] = wd
+                self._folder_wd[wd] = (location, name)
+        elif not present and wd is not None:
+            # the kernel drops the watch of a deleted folder itself; this covers a folder renamed away
+            del location.folders[name]
+            if self._folder_wd.pop(wd, None) is not None:
+                _libc.inotify_rm_watch(self._fd, wd)
+
+    def _update(self, name: str) -> None:
+        """Recompute the winning location of ``name`` after it changed somewhere."""
+        for location in self.locations:
+            if name in location.names:
+                self._index[name] = location
+                return
+        self._index.pop(name, None)
+
+    def _check(self, location: _Location, name: str) -> None:
+        location.names.discard(name)
+        location.pending.discard(name)
+        if _is_skill(location.path, name):
+            location.names.add(name)
+        elif not name.startswith(".") and os.path.isdir(os.path.join(location.path, name)):
+            location.pending.add(name)
+        self._watch_folder(location, name)
+        self._update(name)
+
+    def _rescan(self, location: _Location) -> None:
+        location.key = location.stat_key()
+        names, pending = location.scan()
+        changed = names ^ location.names
+        location.names, location.pending = names, pending
+        for name in changed:
+            self._update(name)
+        for name in names | pending | set(location.folders):
+            self._watch_folder(location, name)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                name = data[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    for location in self.locations:
+                        self._rescan(location)
+                    continue
+                folder = self._folder_wd.get(wd)
+                if folder is not None:
+                    location, folder_name = folder
+                    if mask & _IN_IGNORED:
+                        del self._folder_wd[wd]
+                        if location.folders.get(folder_name) == wd:
+                            del location.folders[folder_name]
+                    elif name == b"SKILL.md":
+                        self._check(location, folder_name)
+                    continue
+                location = self._by_wd.get(wd)
+                if location is None:
+                    continue
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF | _IN_IGNORED):
+                    # the directory itself went away: fall back to polling until it is back
+                    if location.wd is not None:
+                        del self._by_wd[location.wd]
+                        if not mask & _IN_IGNORED:
+                            _libc.inotify_rm_watch(self._fd, location.wd)
+                        location.wd = None
+                        for folder_wd in location.folders.values():
+                            if self._folder_wd.pop(folder_wd, None) is not None:
+                                _libc.inotify_rm_watch(self._fd, folder_wd)
+                        location.folders.clear()
+                    self._rescan(location)
+                elif name:
+                    self._check(location, os.fsdecode(name))
+
+    def refresh(self) -> None:
+        """Apply changes since the last call; cheap enough to run before every lookup."""
+        if self._fd >= 0:
+            self._drain()
+        now = time.monotonic()
+        if now - self._checked < POLL_INTERVAL:
+            return
+        self._checked = now
+        for location in self.locations:
+            if location.wd is None:
+                if location.stat_key() != location.key:
+                    self._watch(location)
+                    self._rescan(location)
+            for name in list(location.pending):
+                self._check(location, name)
+
+    def resolve(self, name: str) -> Resolution | None:
+        """The folder ``name`` resolves to, or ``None`` if no location has it."""
+        self.refresh()
+        location = self._index.get(name)
+        if location is None:
+            for location in self.locations:
+                if name in location.pending:
+                    self._check(location, name)
+            location = self._index.get(name)
+        # without a watch on the folder, its SKILL.md may have gone since it was listed
+        while location is not None and name not in location.folders and not _is_skill(location.path, name):
+            self._check(location, name)
+            location = self._index.get(name)
+        if location is None:
+            return None
+        return Resolution(name, os.path.join(location.path, name), location.label)
+
+    def shadowed(self, name: str) -> list[Resolution]:
+        """Every lower-priority copy of ``name`` that the resolved one hides."""
+        self.refresh()
+        found = [loc for loc in self.locations if name in loc.names]
+        return [Resolution(name, os.path.join(loc.path, name), loc.label) for loc in found[1:]]
+
+    def __iter__(self) -> Iterator[Resolution]:
+        self.refresh()
+        for name in sorted(self._index):
+            location = self._index[name]
+            yield Resolution(name, os.path.join(location.path, name), location.label)
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog resolve",
+        description="Resolve installed skill names with Workspace > Local > Bundled priority.",
+    )
+    parser.add_argument("names", nargs="*", help="skill names to resolve; none lists every installed skill")
+    parser.add_argument("--project", help="workspace whose skills/ directory comes first (default: cwd)")
+    parser.add_argument("--bundled", help="directory of the skills bundled with OpenClaw")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    with Resolver(default_locations(args.project, args.bundled), watch=False) as resolver:
+        built = (time.perf_counter() - t0) * 1000
+        if not args.names:
+            for resolution in resolver:
+                hidden = resolver.shadowed(resolution.name)
+                note = f"  (shadows {', '.join(r.location for r in hidden)})" if hidden else ""
+                print(f"{resolution.name}\t{resolution.location}\t{resolution.path}{note}")
+            print(f"{len(resolver)} skills indexed in {built:.1f} ms", file=sys.stderr)
+            return 0
+        missing = 0
+        for name in args.names:
+            resolution = resolver.resolve(name)
+            if resolution is None:
+                missing += 1
+                print(f"error: {name}: not installed", file=sys.stderr)
+            else:
+                print(f"{name}\t{resolution.location}\t{resolution.path}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Full-text BM25 search over skill names and descriptions.
+
+The index is split into one segment per ``<details>`` category. Each segment
+holds its own postings (term -> sorted ``array`` of local doc ids plus a
+parallel term-frequency array); collection statistics are summed over
+segments at query time. When README.md changes, :meth:`SearchIndex.update`
+re-tokenizes only the categories whose bytes changed.
+
+Names are split on dashes and other punctuation, so ``codex-account-switcher``
+is indexed as ``codex``, ``account`` and ``switcher``; name terms count
+:data:`NAME_WEIGHT` times towards term frequency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import math
+import re
+import sys
+import time
+from array import array
+
+from catalog.parser import DEFAULT_README, Catalog, Section, load
+
+K1 = 1.2
+B = 0.75
+NAME_WEIGHT = 3
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it its of on or the this that to via with your you".split()
+)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase ``text`` and split it into alphanumeric terms, dropping stopwords."""
+    return [t for t in _WORD.findall(text.lower()) if t not in STOPWORDS]
+
+
+class Hit:
+    """One ranked search result."""
+
+    __slots__ = ("score", "name", "category", "description", "url")
+
+    def __init__(self, score: float, name: str, category: str, description: str, url: str) -> None:
+        self.score = score
+        self.name = name
+        self.category = category
+        self.description = description
+        self.url = url
+
+    def as_dict(self) -> dict:
+        return {
+            "score": round(self.score, 4),
+            "name": self.name,
+            "category": self.category,
+            "description": self.description,
+            "url": self.url,
+        }
+
+    def __repr__(self) -> str:
+        return f"<Hit {self.name!r} {self.score:.3f}>"
+
+
+class _Segment:
+    """Postings for the entries of a single category."""
+
+    __slots__ = ("title", "digest", "names", "descriptions", "urls", "lengths", "total", "postings")
+
+    def __init__(self, catalog: Catalog, section: Section, digest: str) -> None:
+        self.title = section.title
+        self.digest = digest
+        self.names: list[str] = []
+        self.descriptions: list[str] = []
+        self.urls: list[str] = []
+        self.lengths = array("H")
+        postings: dict[str, tuple[array, array]] = {}
+        for doc, index in enumerate(range(section.first, section.stop)):
+            name = catalog.name_of(index)
+            description = catalog.description_of(index)
+            self.names.append(name)
+            self.descriptions.append(description)
+            self.urls.append(catalog.url_of(index))
+            counts: dict[str, int] = {}
+            for term in tokenize(name):
+                counts[term] = counts.get(term, 0) + NAME_WEIGHT
+            for term in tokenize(description):
+                counts[term] = counts.get(term, 0) + 1
+            self.lengths.append(min(sum(counts.values()), 0xFFFF))
+            for term, tf in counts.items():
+                ids, tfs = postings.get(term) or postings.setdefault(term, (array("I"), array("H")))
+                ids.append(doc)
+                tfs.append(tf)
+        self.postings = postings
+        self.total = sum(self.lengths)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _section_digest(catalog: Catalog, section: Section) -> str:
+    return hashlib.blake2b(catalog.buffer[section.start : section.end], digest_size=16).hexdigest()
+
+
+class SearchIndex:
+    """Segmented inverted index with BM25 ranking."""
+
+    __slots__ = ("segments", "_docs", "_total")
+
+    def __init__(self) -> None:
+        self.segments: list[_Segment] = []
+        self._docs = 0
+        self._total = 0
+
+    @classmethod
+    def build(cls, catalog: Catalog) -> SearchIndex:
+        index = cls()
+        index.update(catalog)
+        return index
+
+    def __len__(self) -> int:
+        return self._docs
+
+    def update(self, catalog: Catalog) -> list[str]:
+        """Bring the index in line with ``catalog``; return the re-indexed category titles.
+
+        Categories whose bytes are unchanged keep their existing segment.
+        """
+        previous = {(s.title, s.digest): s for s in self.segments}
+        segments = []
+        changed = []
+        for section in catalog.sections:
+            digest = _section_digest(catalog, section)
+            segment = previous.get((section.title, digest))
+            if segment is None:
+                segment = _Segment(catalog, section, digest)
+                changed.append(section.title)
+            segments.append(segment)
+        self.segments = segments
+        self._docs = sum(len(s) for s in segments)
+        self._total = sum(s.total for s in segments)
+        return changed
+
+    def updated(self, catalog: Catalog) -> SearchIndex:
+        """A new index for ``catalog`` sharing the unchanged segments of this one, which is left as it is."""
+        index = type(self)()
+        index.segments = self.segments
+        index.update(catalog)
+        return index
+
+    def search(self, query: str, limit: int = 10) -> list[Hit]:
+        """Return up to ``limit`` hits for ``query`` ranked by BM25."""
+        terms = set(tokenize(query))
+        if not terms or not self._docs:
+            return []
+        avgdl = self._total / self._docs
+        scores: dict[tuple[int, int], float] = {}
+        for term in terms:
+            found = []
+            df = 0
+            for seg_no, segment in enumerate(self.segments):
+                posting = segment.postings.get(term)
+                if posting is not None:
+                    found.append((seg_no, segment, posting))
+                    df += len(posting[0])
+            if not df:
+                continue
+            idf = math.log(1 + (self._docs - df + 0.5) / (df + 0.5))
+            for seg_no, segment, (ids, tfs) in found:
+                lengths = segment.lengths
+                for doc, tf in zip(ids, tfs):
+                    norm = K1 * (1 - B + B * lengths[doc] / avgdl)
+                    key = (seg_no, doc)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for (seg_no, doc), score in best:
+            segment = self.segments[seg_no]
+            hits.append(Hit(score, segment.names[doc], segment.title, segment.descriptions[doc], segment.urls[doc]))
+        return hits
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog search", description="Rank skills for a query with BM25.")
+    parser.add_argument("query", nargs="+")
+    parser.add_argument("-n", "--limit", type=int, default=10)
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    index = SearchIndex.build(load(args.readme))
+    t1 = time.perf_counter()
+    hits = index.search(" ".join(args.query), args.limit)
+    t2 = time.perf_counter()
+    for hit in hits:
+        print(f"{hit.score:6.2f}  {hit.name:<32} {hit.category:<28} {hit.description}")
+    print(f"indexed {len(index)} entries in {(t1 - t0) * 1000:.1f} ms, query took {(t2 - t1) * 1000:.3f} ms")
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""Long-running catalog query server on a Unix domain socket, plus a client.
+
+The server parses README.md and builds the search and trigram indexes once,
+then answers queries from memory. When README.md changes on disk (checked at
+most once per :data:`RELOAD_INTERVAL`) it is re-parsed; the BM25 index only
+re-indexes the categories whose bytes changed.
+
+Protocol: every message is a frame ``uint32 length`` (big-endian) followed by
+``length`` bytes.
+
+request   ``uint8 op``, ``uint16 limit``, UTF-8 query
+response  ``uint8 status`` (0 ok, 1 error), UTF-8 JSON: a list of result
+          objects, or an error message
+
+Ops: :data:`PING`, :data:`NAME` (exact skill name), :data:`CATEGORY` (title
+or anchor; limit 0 means all), :data:`SEARCH` (BM25 full text) and
+:data:`SUGGEST` (did-you-mean slugs). A connection may send any number of
+requests; responses come back in order.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import errno
+import json
+import signal
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+
+from catalog.fuzzy import TrigramIndex
+from catalog.parser import DEFAULT_README, REPO_ROOT, Catalog, load
+from catalog.search import SearchIndex
+
+DEFAULT_SOCKET = REPO_ROOT / "catalog.sock"
+
+PING = 0
+NAME = 1
+CATEGORY = 2
+SEARCH = 3
+SUGGEST = 4
+OPS = {"ping": PING, "name": NAME, "category": CATEGORY, "search": SEARCH, "suggest": SUGGEST}
+
+OK = 0
+ERROR = 1
+
+MAX_FRAME = 1 << 20
+RELOAD_INTERVAL = 1.0
+
+_LENGTH = struct.Struct("!I")
+_REQUEST = struct.Struct("!BH")
+
+
+class ServerError(RuntimeError):
+    """The server answered a request with an error."""
+
+
+class _State:
+    """Parsed catalog and indexes, refreshed when the README changes."""
+
+    __slots__ = ("readme", "catalog", "search", "trigrams", "_key", "_checked")
+
+    def __init__(self, readme: str | Path) -> None:
+        self.readme = Path(readme)
+        self._key: tuple[int, int] | None = None
+        self._checked = 0.0
+        self.search = SearchIndex()
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> bool:
+        now = time.monotonic()
+        if not force and now - self._checked < RELOAD_INTERVAL:
+            return False
+        self._checked = now
+        stat = self.readme.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == self._key:
+            return False
+        catalog = load(self.readme)
+        self.search.update(catalog)
+        self.trigrams = TrigramIndex.build(catalog)
+        self.catalog: Catalog = catalog
+        self._key = key
+        return True
+
+    def answer(self, op: int, query: str, limit: int) -> list:
+        self.refresh()
+        catalog = self.catalog
+        if op == PING:
+            return [{"entries": len(catalog), "digest": catalog.digest}]
+        if op == NAME:
+            return [entry.as_dict() for entry in catalog.find(query)]
+        if op == CATEGORY:
+            try:
+                section = catalog.section(query)
+            except KeyError:
+                raise ServerError(f"unknown category {query!r}") from None
+            entries = catalog.entries(section)
+            return [entry.as_dict() for _, entry in zip(range(limit or len(section)), entries)]
+        if op == SEARCH:
+            return [hit.as_dict() for hit in self.search.search(query, limit or 10)]
+        if op == SUGGEST:
+            matches = self.trigrams.suggest(query, limit or 5)
+            return [{"name": name, "score": round(score, 4)} for score, name in matches]
+        raise ServerError(f"unknown op {op}")
+
+
+def _frame(status: int, payload: object) -> bytes:
+    body = bytes((status,)) + json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+    return _LENGTH.pack(len(body)) + body
+
+
+async def _handle(state: _State, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            try:
+                (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+            except asyncio.IncompleteReadError:
+                break
+            if not _REQUEST.size <= length <= MAX_FRAME:
+                writer.write(_frame(ERROR, f"bad frame length {length}"))
+                break
+            body = await reader.readexactly(length)
+            op, limit = _REQUEST.unpack_from(body)
+            try:
+                response = _frame(OK, state.answer(op, body[_REQUEST.size :].decode(), limit))
+            except (ServerError, UnicodeDecodeError, OSError) as exc:
+                # OSError: the README could not be re-read (deleted, permissions); keep the connection
+                response = _frame(ERROR, str(exc))
+            writer.write(response)
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+def _listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+    return True
+
+
+async def serve(path: str | Path = DEFAULT_SOCKET, readme: str | Path = DEFAULT_README) -> None:
+    """Serve until cancelled; the socket file is removed on exit.
+
+    A socket left behind by a server that died is replaced; if a server still
+    answers on ``path``, ``OSError(EADDRINUSE)`` is raised instead.
+    """
+    path = Path(path)
+    if path.is_socket():
+        if _listening(path):
+            raise OSError(errno.EADDRINUSE, f"a server is already running on {path}")
+        path.unlink()
+    state = _State(readme)
+    server = await asyncio.start_unix_server(lambda r, w: _handle(state, r, w), path=str(path))
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        path.unlink(missing_ok=True)
+
+
+async def _run(path: str | Path, readme: str | Path) -> None:
+    # SIGTERM (and SIGINT, which background jobs ignore) cancel serve() so the socket is removed
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, task.cancel)
+    await serve(path, readme)
+
+
+class Client:
+    """Blocking client; keeps one connection open for any number of requests."""
+
+    __slots__ = ("path", "_sock")
+
+    def __init__(self, path: str | Path = DEFAULT_SOCKET, timeout: float | None = 5.0) -> None:
+        self.path = Path(path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(str(self.path))
+        except OSError:
+            self._sock.close()
+            raise
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def _read(self, size: int) -> bytes:
+        chunks = []
+        while size:
+            chunk = self._sock.recv(size)
+            if not chunk:
+                raise ConnectionError("server closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def request(self, op: int, query: str = "", limit: int = 0) -> list:
+        body = _REQUEST.pack(op, limit) + query.encode()
+        self._sock.sendall(_LENGTH.pack(len(body)) + body)
+        (length,) = _LENGTH.unpack(self._read(_LENGTH.size))
+        body = self._read(length)
+        payload = json.loads(body[1:])
+        if body[0] != OK:
+            raise ServerError(payload)
+        return payload
+
+    def ping(self) -> dict:
+        return self.request(PING)[0]
+
+    def name(self, name: str) -> list[dict]:
+        return self.request(NAME, name)
+
+    def category(self, title: str, limit: int = 0) -> list[dict]:
+        return self.request(CATEGORY, title, limit)
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        return self.request(SEARCH, query, limit)
+
+    def suggest(self, slug: str, limit: int = 5) -> list[dict]:
+        return self.request(SUGGEST, slug, limit)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog server", description="Serve catalog queries on a Unix socket, or query a server."
+    )
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET))
+    sub = parser.add_subparsers(dest="action", required=True)
+    run = sub.add_parser("run", help="start the server")
+    run.add_argument("--readme", default=str(DEFAULT_README))
+    query = sub.add_parser("query", help="send one request to a running server")
+    query.add_argument("op", choices=OPS)
+    query.add_argument("query", nargs="*")
+    query.add_argument("-n", "--limit", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.action == "run":
+        print(f"serving {args.readme} on {args.socket}", file=sys.stderr)
+        try:
+            asyncio.run(_run(args.socket, args.readme))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        except OSError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+        return 0
+
+    try:
+        with Client(args.socket) as client:
+            t0 = time.perf_counter()
+            results = client.request(OPS[args.op], " ".join(args.query), args.limit)
+            elapsed = (time.perf_counter() - t0) * 1000
+    except ServerError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    except OSError as exc:
+        print(f"error: cannot reach {args.socket}: {exc}", file=sys.stderr)
+        return 2
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+    print(f"{len(results)} results in {elapsed:.3f} ms", file=sys.stderr)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
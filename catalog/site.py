@@ -0,0 +1,423 @@
+"""Static HTML site with a sharded client-side search index.
+
+Output (``site/`` by default, git-ignored)::
+
+    index.html              category list and search box
+    <anchor>.html           one page per category
+    skills/<author>/<name>.html
+                            one detail page per skill
+    search/manifest.json    shard keys and the entry count
+    search/<key>.json       records whose name has a word starting with <key>
+    search.js, style.css    the search client and styles
+
+Search shards are keyed by name prefix: every record is filed under the first
+letter of each word of its skill name, and a shard larger than
+:data:`SHARD_BYTES` is split by the next letter until it fits. The browser
+fetches the manifest, then only the shards matching what has been typed.
+
+Every file is written with ``.gz`` and, when the optional ``brotli`` module is
+installed, ``.br`` variants next to it so a static server can send them
+as-is (``gzip_static`` / ``brotli_static``).
+
+:func:`build_site` hashes the README bytes behind every page and compares
+them with ``.manifest.json`` from the previous build; only categories with a
+changed page are rendered, fanned out over a process pool (one task per
+category) while the parent process writes the results as they arrive. Files
+whose bytes are unchanged are not rewritten and pages that no longer exist
+are deleted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from catalog.parser import DEFAULT_README, REPO_ROOT, Catalog, parse
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz variants are written without it
+    brotli = None
+
+DEFAULT_SITE = REPO_ROOT / "site"
+MANIFEST = ".manifest.json"
+SHARD_BYTES = 32 * 1024
+MAX_KEY_LENGTH = 3
+COMPRESS_MIN_BYTES = 256
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+STYLE = """\
+body{font:16px/1.5 system-ui,sans-serif;max-width:60rem;margin:2rem auto;padding:0 1rem;color:#1f2328}
+a{color:#0969da;text-decoration:none}a:hover{text-decoration:underline}
+ul{padding-left:1.2rem}li{margin:.25rem 0}nav{margin-bottom:1rem}
+input{width:100%;font:inherit;padding:.5rem;box-sizing:border-box}
+.count{color:#59636e}
+"""
+
+SEARCH_JS = """\
+(() => {
+  const box = document.getElementById("q"), out = document.getElementById("results");
+  const shards = new Map();
+  let manifest = null;
+  const load = (key) => {
+    if (!shards.has(key)) shards.set(key, fetch(`search/${key}.json`).then((r) => r.json()));
+    return shards.get(key);
+  };
+  const words = (text) => text.toLowerCase().match(/[a-z0-9]+/g) || [];
+  const escape = (s) => s.replace(/[&<>"]/g, (c) => ({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})[c]);
+  box.addEventListener("input", async () => {
+    const terms = words(box.value);
+    if (!terms.length) { out.innerHTML = ""; return; }
+    manifest = manifest || await fetch("search/manifest.json").then((r) => r.json());
+    const first = terms[0];
+    const keys = manifest.keys.filter((k) => k.startsWith(first) || first.startsWith(k));
+    const records = (await Promise.all(keys.map(load))).flat();
+    const seen = new Set(), hits = [];
+    for (const [name, description, url, page] of records) {
+      const nameWords = words(name), text = `${name} ${description}`.toLowerCase();
+      if (seen.has(url) || !nameWords.some((w) => w.startsWith(first))) continue;
+      if (!terms.slice(1).every((t) => text.includes(t))) continue;
+      seen.add(url);
+      hits.push(`<li><a href="${escape(url)}">${escape(name)}</a> - ${escape(description)} ` +
+                `<a class="count" href="${page}.html">#</a></li>`);
+      if (hits.length >= 50) break;
+    }
+    out.innerHTML = hits.join("");
+  });
+})();
+"""
+
+_PAGE = """\
+<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<link rel="stylesheet" href="{root}style.css">
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+# Any change to this module (templates, styles, script) invalidates every page.
+_CODE_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def _page(title: str, body: str, root: str = "") -> str:
+    return _PAGE.format(title=html.escape(title), body=body, root=root)
+
+
+def skill_paths(catalog: Catalog) -> list[str]:
+    """Site path of every entry's detail page, ``skills/<author>/<name>.html``, made unique."""
+    paths = []
+    seen: set[str] = set()
+    for i in range(len(catalog)):
+        author = catalog.authors[catalog.author_of(i)] or "_"
+        stem = f"skills/{_slug(author)}/{_slug(catalog.name_of(i))}"
+        path = f"{stem}.html"
+        n = 1
+        while path in seen:
+            n += 1
+            path = f"{stem}-{n}.html"
+        seen.add(path)
+        paths.append(path)
+    return paths
+
+
+def _slug(text: str) -> str:
+    return "-".join(_WORD.findall(text.lower())) or "_"
+
+
+def render_category(catalog: Catalog, index: int, paths: list[str]) -> str:
+    section = catalog.sections[index]
+    items = []
+    for i in range(section.first, section.stop):
+        name, description = catalog.name_of(i), catalog.description_of(i)
+        item = f'<li><a href="{paths[i]}">{html.escape(name)}</a>'
+        items.append(item + (f" - {html.escape(description)}</li>" if description else "</li>"))
+    body = (
+        '<nav><a href="index.html">← All categories</a></nav>\n'
+        f'<h1>{html.escape(section.title)} <span class="count">({len(section)})</span></h1>\n'
+        "<ul>\n" + "\n".join(items) + "\n</ul>"
+    )
+    return _page(section.title, body)
+
+
+def render_skill(catalog: Catalog, index: int) -> str:
+    section = catalog.sections[catalog.category_of(index)]
+    name, url, description = catalog.name_of(index), catalog.url_of(index), catalog.description_of(index)
+    author = catalog.authors[catalog.author_of(index)]
+    rows = [f"<dt>Category</dt><dd><a href=\"../../{section.anchor}.html\">{html.escape(section.title)}</a></dd>"]
+    if author:
+        rows.append(f"<dt>Author</dt><dd>{html.escape(author)}</dd>")
+    rows.append(f'<dt>Source</dt><dd><a href="{html.escape(url)}">{html.escape(url)}</a></dd>')
+    body = (
+        f'<nav><a href="../../index.html">All categories</a> › <a href="../../{section.anchor}.html">'
+        f"{html.escape(section.title)}</a></nav>\n"
+        f"<h1>{html.escape(name)}</h1>\n"
+        + (f"<p>{html.escape(description)}</p>\n" if description else "")
+        + "<dl>\n" + "\n".join(rows) + "\n</dl>"
+    )
+    return _page(name, body, "../../")
+
+
+def render_index(catalog: Catalog) -> str:
+    links = "\n".join(
+        f'<li><a href="{s.anchor}.html">{html.escape(s.title)}</a> <span class="count">({len(s)})</span></li>'
+        for s in catalog.sections
+    )
+    body = (
+        "<h1>Awesome OpenClaw Skills</h1>\n"
+        f"<p>{len(catalog):,} skills in {len(catalog.sections)} categories.</p>\n"
+        '<input id="q" type="search" placeholder="Search skills by name..." autofocus>\n'
+        '<ul id="results"></ul>\n'
+        f"<h2>Categories</h2>\n<ul>\n{links}\n</ul>\n"
+        '<script src="search.js" defer></script>'
+    )
+    return _page("Awesome OpenClaw Skills", body)
+
+
+def _encode(records: list) -> bytes:
+    return json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def build_shards(catalog: Catalog, limit: int = SHARD_BYTES) -> dict[str, bytes]:
+    """Shard key -> JSON list of ``[name, description, url, category anchor]`` records."""
+    records = []
+    words = []
+    for i in range(len(catalog)):
+        name = catalog.name_of(i)
+        anchor = catalog.sections[catalog.category_of(i)].anchor
+        records.append([name, catalog.description_of(i), catalog.url_of(i), anchor])
+        words.append(sorted(set(_WORD.findall(name.lower()))))
+
+    def group(ids: list[int], length: int) -> dict[str, list[int]]:
+        # the record goes under each distinct prefix of its name words
+        buckets: dict[str, list[int]] = {}
+        for i in ids:
+            for key in sorted({w[:length] for w in words[i]}):
+                buckets.setdefault(key, []).append(i)
+        return buckets
+
+    shards = {}
+    pending = [(key, ids, 1) for key, ids in group(range(len(records)), 1).items()]
+    while pending:
+        key, ids, length = pending.pop()
+        data = _encode([records[i] for i in ids])
+        if len(data) <= limit or length >= MAX_KEY_LENGTH:
+            shards[key] = data
+            continue
+        # words exactly as long as the key stay in a shard of their own
+        exact = [i for i in ids if key in words[i]]
+        longer = [i for i in ids if any(w.startswith(key) and len(w) > length for w in words[i])]
+        if exact:
+            shards[key] = _encode([records[i] for i in exact])
+        for sub, sub_ids in group(longer, length + 1).items():
+            if sub.startswith(key) and len(sub) > length:
+                pending.append((sub, sub_ids, length + 1))
+    return shards
+
+
+def _digest(*parts: bytes | str) -> str:
+    h = hashlib.blake2b(_CODE_DIGEST, digest_size=16)
+    for part in parts:
+        h.update(part.encode() if isinstance(part, str) else part)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def plan(catalog: Catalog, paths: list[str]) -> tuple[dict[str, str], dict[int, list[tuple[str, int]]]]:
+    """Input hash of every page, and the pages of each category as ``(path, entry or -1)``.
+
+    Category ``-1`` holds the pages built from the whole catalog: the index,
+    the assets and the search shards (which share the README digest).
+    """
+    buffer = catalog.buffer
+    hashes = {}
+    tasks: dict[int, list[tuple[str, int]]] = {-1: [("index.html", -1)]}
+    hashes["index.html"] = _digest(catalog.digest)
+    for section in catalog.sections:
+        page = f"{section.anchor}.html"
+        hashes[page] = _digest(buffer[section.start : section.end], *paths[section.first : section.stop])
+        pages = tasks[section.index] = [(page, -1)]
+        for i in range(section.first, section.stop):
+            start, end = catalog.span_of(i)
+            hashes[paths[i]] = _digest(buffer[start:end], section.title, section.anchor, paths[i])
+            pages.append((paths[i], i))
+    return hashes, tasks
+
+
+_worker_catalog: Catalog | None = None
+_worker_paths: list[str] = []
+
+
+def _init_worker(buffer: bytes) -> None:
+    global _worker_catalog, _worker_paths
+    _worker_catalog = parse(buffer)
+    _worker_paths = skill_paths(_worker_catalog)
+
+
+def _render_task(category: int, pages: list[tuple[str, int]]) -> list[tuple[str, bytes]]:
+    """Render ``pages`` of one category (or the global pages for ``-1``) with compressed variants."""
+    catalog, paths = _worker_catalog, _worker_paths
+    files: list[tuple[str, bytes]] = []
+    if category == -1:
+        shards = build_shards(catalog)
+        files.append(("index.html", render_index(catalog).encode()))
+        files.append(("style.css", STYLE.encode()))
+        files.append(("search.js", SEARCH_JS.encode()))
+        files.extend((f"search/{key}.json", data) for key, data in shards.items())
+        files.append(("search/manifest.json", _encode({"entries": len(catalog), "keys": sorted(shards)})))
+    else:
+        for path, entry in pages:
+            if entry < 0:
+                files.append((path, render_category(catalog, category, paths).encode()))
+            else:
+                files.append((path, render_skill(catalog, entry).encode()))
+    return [
+        (name + suffix, variant)
+        for name, data in files
+        for suffix, variant in (("", data), *compressed(data).items())
+    ]
+
+
+def compressed(data: bytes) -> dict[str, bytes]:
+    """Precompressed variants of ``data`` by suffix (empty for tiny files)."""
+    if len(data) < COMPRESS_MIN_BYTES:
+        return {}
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def _write(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+class BuildResult:
+    __slots__ = ("pages", "rendered", "written", "removed")
+
+    def __init__(self, pages: int, rendered: int, written: int, removed: int) -> None:
+        self.pages = pages
+        self.rendered = rendered
+        self.written = written
+        self.removed = removed
+
+
+def build_site(
+    readme: str | Path = DEFAULT_README, out: str | Path = DEFAULT_SITE, jobs: int | None = None, force: bool = False
+) -> BuildResult:
+    """Build the site into ``out``, re-rendering only pages whose inputs changed.
+
+    Categories with changed pages are rendered on a process pool of ``jobs``
+    workers (all CPUs by default, in-process for 1); files are written here,
+    as each category's results arrive.
+    """
+    out = Path(out)
+    buffer = Path(readme).read_bytes()
+    catalog = parse(buffer)
+    hashes, tasks = plan(catalog, skill_paths(catalog))
+    manifest_path = out / MANIFEST
+    previous = {} if force else _load_manifest(manifest_path)
+    old_pages = previous.get("pages", {})
+    old_files = previous.get("files", {})
+
+    def fresh(page: str) -> bool:
+        return old_pages.get(page) == hashes[page] and (out / page).exists()
+
+    todo = {}
+    for category, pages in tasks.items():
+        stale = [(page, entry) for page, entry in pages if not fresh(page)]
+        if stale:
+            todo[category] = stale
+    # the global task produces many files from one page key; keep its file list
+    files = {name: page for name, page in old_files.items() if page in hashes and fresh(page)}
+
+    written = 0
+
+    def store(category: int, results: list[tuple[str, bytes]]) -> None:
+        nonlocal written
+        page = "index.html" if category == -1 else None
+        for name, data in results:
+            written += _write(out / name, data)
+            files[name] = page or name.removesuffix(".gz").removesuffix(".br")
+
+    rendered = sum(len(pages) for pages in todo.values())
+    if todo:
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(todo) == 1:
+            _init_worker(buffer)
+            for category, pages in todo.items():
+                store(category, _render_task(category, pages))
+        else:
+            workers = min(jobs, len(todo))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(buffer,)) as pool:
+                futures = {pool.submit(_render_task, category, pages): category for category, pages in todo.items()}
+                for future in as_completed(futures):
+                    store(futures[future], future.result())
+
+    removed = 0
+    for name, page in old_files.items():
+        if name not in files:
+            try:
+                (out / name).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+    out.mkdir(parents=True, exist_ok=True)
+    tmp = manifest_path.with_name(MANIFEST + ".tmp")
+    tmp.write_text(json.dumps({"pages": hashes, "files": files}, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, manifest_path)
+    return BuildResult(len(hashes), rendered, written, removed)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog site", description="Build the static HTML site.")
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("-o", "--output", default=str(DEFAULT_SITE))
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--force", action="store_true", help="ignore the manifest and render every page")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    result = build_site(args.readme, args.output, args.jobs, args.force)
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(
+        f"rendered {result.rendered}/{result.pages} pages, wrote {result.written} files, removed {result.removed}"
+        f" in {args.output} ({elapsed:.0f} ms)" + ("" if brotli is not None else "; brotli not installed, gzip only")
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
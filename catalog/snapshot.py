@@ -0,0 +1,397 @@
+"""Precompiled binary snapshot of the catalog (``catalog.bin``).
+
+The snapshot is written once from README.md and then opened with ``mmap``;
+lookups read fields straight out of the mapping with ``struct.unpack_from``
+and nothing is deserialized up front.
+
+Layout (all integers little-endian)::
+
+    header      magic, version, entry/section counts, README sha256,
+                offsets of the tables below
+    sections    one fixed-width record per <details> category
+    entries     one fixed-width record per bullet
+    slug index  entry numbers sorted by slug bytes (binary searched)
+    strings     UTF-8 string table; records point into it by (offset, length)
+
+The README digest in the header lets readers detect a snapshot that was built
+from a different README.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+from catalog.parser import DEFAULT_README, LINK_KINDS, REPO_ROOT, Catalog, load
+
+DEFAULT_SNAPSHOT = REPO_ROOT / "catalog.bin"
+
+MAGIC = b"CLAWCAT\0"
+VERSION = 1
+
+# magic, version, reserved, entries, sections, digest,
+# sections_off, entries_off, slugs_off, strings_off, strings_len
+_HEADER = struct.Struct("<8sHHII32sIIIII")
+# title (off, len), anchor (off, len), first entry, stop entry
+_SECTION = struct.Struct("<IHIHII")
+# name, slug, url, description, author as (off, len); category, kind, pad, line
+_ENTRY = struct.Struct("<IHIHIHIHIHHBxI")
+
+
+class SnapshotError(ValueError):
+    """The file is not a readable catalog snapshot."""
+
+
+class StaleSnapshotError(SnapshotError):
+    """The snapshot was built from a different README."""
+
+
+class _Strings:
+    """Deduplicating UTF-8 string table builder."""
+
+    __slots__ = ("blob", "_seen")
+
+    def __init__(self) -> None:
+        self.blob = bytearray()
+        self._seen: dict[str, tuple[int, int]] = {}
+
+    def add(self, text: str) -> tuple[int, int]:
+        ref = self._seen.get(text)
+        if ref is None:
+            data = text.encode()
+            if len(data) > 0xFFFF:
+                raise SnapshotError(f"string too long for snapshot: {text[:40]!r}...")
+            ref = self._seen[text] = (len(self.blob), len(data))
+            self.blob += data
+        return ref
+
+
+def build(catalog: Catalog) -> bytes:
+    """Serialize a parsed catalog into snapshot bytes."""
+    strings = _Strings()
+    sections = bytearray()
+    for section in catalog.sections:
+        sections += _SECTION.pack(*strings.add(section.title), *strings.add(section.anchor), section.first, section.stop)
+
+    entries = bytearray()
+    slugs: list[tuple[bytes, int]] = []
+    for entry in catalog:
+        slug = entry.slug
+        slugs.append((slug.encode(), entry.index))
+        entries += _ENTRY.pack(
+            *strings.add(entry.name),
+            *strings.add(slug),
+            *strings.add(entry.url),
+            *strings.add(entry.description),
+            *strings.add(entry.author),
+            catalog.category_of(entry.index),
+            entry.kind,
+            entry.line,
+        )
+    slugs.sort()
+    slug_index = array("I", (i for _, i in slugs))
+    if sys.byteorder != "little":
+        slug_index.byteswap()
+
+    sections_off = _HEADER.size
+    entries_off = sections_off + len(sections)
+    slugs_off = entries_off + len(entries)
+    strings_off = slugs_off + len(slug_index) * slug_index.itemsize
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        len(catalog),
+        len(catalog.sections),
+        bytes.fromhex(catalog.digest),
+        sections_off,
+        entries_off,
+        slugs_off,
+        strings_off,
+        len(strings.blob),
+    )
+    return b"".join((header, sections, entries, slug_index.tobytes(), strings.blob))
+
+
+def write(catalog: Catalog, path: str | Path = DEFAULT_SNAPSHOT) -> Path:
+    """Write a snapshot atomically (temp file + rename) and return its path."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(build(catalog))
+    os.replace(tmp, path)
+    return path
+
+
+def readme_digest(path: str | Path = DEFAULT_README) -> bytes:
+    with open(path, "rb") as fh:
+        return hashlib.sha256(fh.read()).digest()
+
+
+class SnapshotEntry:
+    """View of one entry record inside the mapping."""
+
+    __slots__ = ("_snapshot", "index", "_record")
+
+    def __init__(self, snapshot: Snapshot, index: int) -> None:
+        self._snapshot = snapshot
+        self.index = index
+        self._record = _ENTRY.unpack_from(snapshot._map, snapshot._entries_off + index * _ENTRY.size)
+
+    def _string(self, field: int) -> str:
+        return self._snapshot._string(self._record[field * 2], self._record[field * 2 + 1])
+
+    @property
+    def name(self) -> str:
+        return self._string(0)
+
+    @property
+    def slug(self) -> str:
+        return self._string(1)
+
+    @property
+    def url(self) -> str:
+        return self._string(2)
+
+    @property
+    def description(self) -> str:
+        return self._string(3)
+
+    @property
+    def author(self) -> str:
+        return self._string(4)
+
+    @property
+    def category(self) -> str:
+        return self._snapshot.section_title(self._record[10])
+
+    @property
+    def kind(self) -> int:
+        return self._record[11]
+
+    @property
+    def line(self) -> int:
+        return self._record[12]
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "url": self.url,
+            "description": self.description,
+            "category": self.category,
+            "author": self.author,
+            "kind": LINK_KINDS[self.kind],
+            "line": self.line,
+        }
+
+    def __repr__(self) -> str:
+        return f"<SnapshotEntry {self.index} {self.name!r} [{self.category}]>"
+
+
+class Snapshot:
+    """Read-only, memory-mapped catalog snapshot.
+
+    Use as a context manager or call :meth:`close` when done.
+    """
+
+    __slots__ = (
+        "path",
+        "digest",
+        "_file",
+        "_map",
+        "_entries",
+        "_sections",
+        "_sections_off",
+        "_entries_off",
+        "_slugs_off",
+        "_strings_off",
+    )
+
+    def __init__(self, path: str | Path = DEFAULT_SNAPSHOT) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            self._file.close()
+            raise SnapshotError(f"{self.path}: empty snapshot") from exc
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise SnapshotError(f"{self.path}: truncated header")
+        (
+            magic,
+            version,
+            _,
+            self._entries,
+            self._sections,
+            self.digest,
+            self._sections_off,
+            self._entries_off,
+            self._slugs_off,
+            self._strings_off,
+            strings_len,
+        ) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise SnapshotError(f"{self.path}: not a catalog snapshot")
+        if version != VERSION:
+            self.close()
+            raise SnapshotError(f"{self.path}: unsupported snapshot version {version}")
+        if self._strings_off + strings_len != len(self._map):
+            self.close()
+            raise SnapshotError(f"{self.path}: truncated snapshot")
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def __getitem__(self, index: int) -> SnapshotEntry:
+        if index < 0:
+            index += self._entries
+        if not 0 <= index < self._entries:
+            raise IndexError("snapshot index out of range")
+        return SnapshotEntry(self, index)
+
+    def __iter__(self) -> Iterator[SnapshotEntry]:
+        for i in range(self._entries):
+            yield SnapshotEntry(self, i)
+
+    def is_stale(self, readme: str | Path = DEFAULT_README) -> bool:
+        """True if ``readme`` no longer matches the digest in the header."""
+        return readme_digest(readme) != self.digest
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_off + offset
+        return self._map[start : start + length].decode()
+
+    def _slug_bytes(self, index: int) -> bytes:
+        off, length = struct.unpack_from("<IH", self._map, self._entries_off + index * _ENTRY.size + 6)
+        start = self._strings_off + off
+        return self._map[start : start + length]
+
+    def _slug_at(self, position: int) -> int:
+        return struct.unpack_from("<I", self._map, self._slugs_off + position * 4)[0]
+
+    def get(self, slug: str) -> SnapshotEntry | None:
+        """Return the first entry with the given slug, or ``None``."""
+        matches = self.get_all(slug)
+        return matches[0] if matches else None
+
+    def get_all(self, slug: str) -> list[SnapshotEntry]:
+        """Return every entry with the given slug (binary search on the slug index)."""
+        key = slug.encode()
+        lo, hi = 0, self._entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._slug_bytes(self._slug_at(mid)) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        found = []
+        while lo < self._entries:
+            index = self._slug_at(lo)
+            if self._slug_bytes(index) != key:
+                break
+            found.append(SnapshotEntry(self, index))
+            lo += 1
+        return found
+
+    def _section(self, index: int) -> tuple[int, int, int, int, int, int]:
+        return _SECTION.unpack_from(self._map, self._sections_off + index * _SECTION.size)
+
+    def section_title(self, index: int) -> str:
+        title_off, title_len, *_ = self._section(index)
+        return self._string(title_off, title_len)
+
+    @property
+    def categories(self) -> list[str]:
+        return [self.section_title(i) for i in range(self._sections)]
+
+    def category(self, title: str) -> Iterator[SnapshotEntry]:
+        """Yield the entries of a category, looked up by title or anchor."""
+        for i in range(self._sections):
+            title_off, title_len, anchor_off, anchor_len, first, stop = self._section(i)
+            if title in (self._string(title_off, title_len), self._string(anchor_off, anchor_len)):
+                for index in range(first, stop):
+                    yield SnapshotEntry(self, index)
+                return
+        raise KeyError(title)
+
+
+def open_snapshot(path: str | Path = DEFAULT_SNAPSHOT, readme: str | Path | None = None) -> Snapshot:
+    """Open a snapshot, raising :class:`StaleSnapshotError` if ``readme`` has changed."""
+    snapshot = Snapshot(path)
+    if readme is not None and snapshot.is_stale(readme):
+        snapshot.close()
+        raise StaleSnapshotError(f"{path} was built from a different {Path(readme).name}")
+    return snapshot
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catalog snapshot", description="Build or query catalog.bin.")
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--snapshot", default=str(DEFAULT_SNAPSHOT))
+    sub = parser.add_subparsers(dest="action", required=True)
+    sub.add_parser("build", help="write the snapshot from the README")
+    sub.add_parser("check", help="exit 1 if the snapshot is stale")
+    get = sub.add_parser("get", help="look up entries by slug")
+    get.add_argument("slug")
+    category = sub.add_parser("category", help="list a category by title or anchor")
+    category.add_argument("title")
+    args = parser.parse_args(argv)
+
+    if args.action == "build":
+        t0 = time.perf_counter()
+        path = write(load(args.readme), args.snapshot)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"wrote {path} ({path.stat().st_size / 1024:.0f} KiB) in {elapsed:.1f} ms")
+        return 0
+
+    try:
+        # ``check`` reports staleness itself; lookups refuse to answer from an old README
+        snapshot = open_snapshot(args.snapshot, None if args.action == "check" else args.readme)
+    except StaleSnapshotError as exc:
+        print(f"error: {exc}; run `python -m catalog snapshot build`", file=sys.stderr)
+        return 1
+    except (OSError, SnapshotError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    with snapshot:
+        if args.action == "check":
+            if snapshot.is_stale(args.readme):
+                print(f"{args.snapshot} is stale; run `python -m catalog snapshot build`")
+                return 1
+            print(f"{args.snapshot} is up to date ({len(snapshot)} entries)")
+            return 0
+        if args.action == "get":
+            entries = snapshot.get_all(args.slug)
+        else:
+            try:
+                entries = list(snapshot.category(args.title))
+            except KeyError:
+                print(f"error: unknown category {args.title!r}", file=sys.stderr)
+                return 1
+        for entry in entries:
+            print(f"{entry.name}\t{entry.category}\t{entry.url}\t{entry.description}")
+        return 0 if entries else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Canonical structured catalog: ``data/categories.jsonl`` and ``data/skills.jsonl``.
+
+``categories.jsonl`` holds one category per line in README order::
+
+    {"title": "Git & GitHub", "title_zh": "Git 与 GitHub", "expanded": true}
+
+``skills.jsonl`` holds one skill per line, grouped by category in README
+order::
+
+    {"category": "Git & GitHub", "name": "github", "url": "https://...", "description": "..."}
+
+A skill may carry ``description_zh`` when README_zh.md shows a different
+description. :func:`import_readmes` builds both files from the current READMEs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from catalog.parser import DEFAULT_README, REPO_ROOT, Catalog, anchor, load
+
+DATA_DIR = REPO_ROOT / "data"
+DEFAULT_ZH_README = REPO_ROOT / "README_zh.md"
+
+
+class Category:
+    __slots__ = ("title", "title_zh", "expanded", "anchor")
+
+    def __init__(self, title: str, title_zh: str = "", expanded: bool = False) -> None:
+        self.title = title
+        self.title_zh = title_zh or title
+        self.expanded = expanded
+        self.anchor = anchor(title)
+
+    def as_dict(self) -> dict:
+        return {"title": self.title, "title_zh": self.title_zh, "expanded": self.expanded}
+
+    def __repr__(self) -> str:
+        return f"<Category {self.title!r}>"
+
+
+class Skill:
+    __slots__ = ("category", "name", "url", "description", "description_zh")
+
+    def __init__(self, category: str, name: str, url: str, description: str = "", description_zh: str = "") -> None:
+        self.category = category
+        self.name = name
+        self.url = url
+        self.description = description
+        self.description_zh = description_zh
+
+    def as_dict(self) -> dict:
+        record = {"category": self.category, "name": self.name, "url": self.url, "description": self.description}
+        if self.description_zh:
+            record["description_zh"] = self.description_zh
+        return record
+
+    def __repr__(self) -> str:
+        return f"<Skill {self.name!r} [{self.category}]>"
+
+
+class CatalogData:
+    """Categories plus the skills of each category, in display order."""
+
+    __slots__ = ("categories", "skills")
+
+    def __init__(self, categories: list[Category], skills: dict[str, list[Skill]]) -> None:
+        self.categories = categories
+        self.skills = skills
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.skills.values())
+
+    def __iter__(self) -> Iterator[Skill]:
+        for category in self.categories:
+            yield from self.skills.get(category.title, ())
+
+    def counts(self) -> dict[str, int]:
+        return {c.title: len(self.skills.get(c.title, ())) for c in self.categories}
+
+
+def _parse_jsonl(name: object, lines: Iterable[str]) -> Iterator[dict]:
+    for number, line in enumerate(lines, 1):
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{name}:{number}: {exc.msg}") from exc
+
+
+def _read_jsonl(path: Path) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as fh:
+        yield from _parse_jsonl(path, fh)
+
+
+def _build(categories: Iterable[dict], records: Iterable[dict]) -> CatalogData:
+    categories = [Category(**record) for record in categories]
+    skills: dict[str, list[Skill]] = {c.title: [] for c in categories}
+    for record in records:
+        bucket = skills.get(record.get("category", ""))
+        if bucket is None:
+            raise ValueError(f"skill {record.get('name')!r} has unknown category {record.get('category')!r}")
+        bucket.append(Skill(**record))
+    return CatalogData(categories, skills)
+
+
+def read(data_dir: str | Path = DATA_DIR) -> CatalogData:
+    """Load the canonical catalog; raises ``ValueError`` on unknown categories."""
+    data_dir = Path(data_dir)
+    return _build(_read_jsonl(data_dir / "categories.jsonl"), _read_jsonl(data_dir / "skills.jsonl"))
+
+
+def committed_text(path: str | Path, revision: str = "HEAD") -> str | None:
+    """``path`` as committed at ``revision``; ``None`` outside a git checkout or if it is not committed."""
+    path = Path(path)
+    try:
+        shown = subprocess.run(
+            ["git", "show", f"{revision}:./{path.name}"],
+            cwd=path.parent,
+            check=True,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return shown.stdout
+
+
+def read_committed(data_dir: str | Path = DATA_DIR, revision: str = "HEAD") -> CatalogData | None:
+    """The catalog as committed at ``revision``, or ``None`` (see :func:`committed_text`)."""
+    data_dir = Path(data_dir)
+    categories = committed_text(data_dir / "categories.jsonl", revision)
+    skills = committed_text(data_dir / "skills.jsonl", revision)
+    if categories is None or skills is None:
+        return None
+    return _build(
+        _parse_jsonl(f"{revision}:categories.jsonl", categories.splitlines()),
+        _parse_jsonl(f"{revision}:skills.jsonl", skills.splitlines()),
+    )
+
+
+def _write_jsonl(path: Path, records: Iterator[dict]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8", newline="\n") as fh:
+        for record in records:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
+
+
+def write(data: CatalogData, data_dir: str | Path = DATA_DIR) -> None:
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    _write_jsonl(data_dir / "categories.jsonl", (c.as_dict() for c in data.categories))
+    _write_jsonl(data_dir / "skills.jsonl", (s.as_dict() for s in data))
+
+
+def from_catalogs(english: Catalog, chinese: Catalog | None = None) -> CatalogData:
+    """Build canonical data from parsed READMEs; the Chinese one supplies translated titles."""
+    if chinese is not None and len(chinese.sections) != len(english.sections):
+        raise ValueError("README.md and README_zh.md have different category counts")
+    categories = []
+    skills: dict[str, list[Skill]] = {}
+    for i, section in enumerate(english.sections):
+        zh_section = chinese.sections[i] if chinese is not None else None
+        categories.append(Category(section.title, zh_section.title if zh_section else "", section.expanded))
+        bucket = skills[section.title] = []
+        zh_by_key = {}
+        if zh_section is not None:
+            zh_by_key = {
+                (chinese.name_of(j), chinese.url_of(j)): chinese.description_of(j)
+                for j in range(zh_section.first, zh_section.stop)
+            }
+        for j in range(section.first, section.stop):
+            name, url, description = english.name_of(j), english.url_of(j), english.description_of(j)
+            description_zh = zh_by_key.get((name, url), description)
+            bucket.append(
+                Skill(section.title, name, url, description, description_zh if description_zh != description else "")
+            )
+    return CatalogData(categories, skills)
+
+
+def import_readmes(
+    readme: str | Path = DEFAULT_README, readme_zh: str | Path | None = DEFAULT_ZH_README
+) -> CatalogData:
+    english = load(readme)
+    chinese = load(readme_zh) if readme_zh is not None and Path(readme_zh).exists() else None
+    return from_catalogs(english, chinese)
@@ -0,0 +1,199 @@
+"""Export the catalog to a normalized SQLite database with FTS5 search.
+
+Tables::
+
+    categories (id, title, anchor, position)
+    authors    (id, name)
+    skills     (id, name, slug, description, category_id, author_id, line)
+    links      (skill_id, url, kind, path)
+    skills_fts FTS5 over skills(name, description), external content
+    meta       (key, value) -- readme_sha256, entries
+
+The database is built in a temporary file inside one transaction with
+``executemany`` over prepared statements, then renamed into place, so readers
+never see a half-written file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from catalog.parser import DEFAULT_README, LINK_KINDS, REPO_ROOT, Catalog, load, split_link
+
+DEFAULT_DATABASE = REPO_ROOT / "catalog.sqlite"
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE categories (
+    id       INTEGER PRIMARY KEY,
+    title    TEXT NOT NULL UNIQUE,
+    anchor   TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE authors (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE skills (
+    id          INTEGER PRIMARY KEY,
+    name        TEXT NOT NULL,
+    slug        TEXT NOT NULL,
+    description TEXT NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories(id),
+    author_id   INTEGER REFERENCES authors(id),
+    line        INTEGER NOT NULL
+);
+CREATE TABLE links (
+    skill_id INTEGER PRIMARY KEY REFERENCES skills(id),
+    url      TEXT NOT NULL,
+    kind     TEXT NOT NULL,
+    path     TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE skills_fts USING fts5(
+    name, description, content='skills', content_rowid='id', tokenize='unicode61'
+);
+"""
+
+INDEXES = (
+    "CREATE INDEX skills_name ON skills(name)",
+    "CREATE INDEX skills_slug ON skills(slug)",
+    "CREATE INDEX skills_category ON skills(category_id)",
+    "CREATE INDEX skills_author ON skills(author_id)",
+    "CREATE INDEX links_kind ON links(kind)",
+)
+
+
+def export(catalog: Catalog, path: str | Path = DEFAULT_DATABASE) -> Path:
+    """Write ``catalog`` to a fresh database at ``path``."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    db = sqlite3.connect(tmp, isolation_level=None)
+    try:
+        db.execute("PRAGMA journal_mode=OFF")
+        db.execute("PRAGMA synchronous=OFF")
+        db.executescript(SCHEMA)
+        db.execute("BEGIN")
+        db.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            (("readme_sha256", catalog.digest), ("entries", str(len(catalog)))),
+        )
+        db.executemany(
+            "INSERT INTO categories (id, title, anchor, position) VALUES (?, ?, ?, ?)",
+            ((s.index + 1, s.title, s.anchor, s.index) for s in catalog.sections),
+        )
+        # Author 0 in the catalog is the empty "unknown author"; store it as NULL.
+        db.executemany(
+            "INSERT INTO authors (id, name) VALUES (?, ?)",
+            ((i, name) for i, name in enumerate(catalog.authors) if i),
+        )
+        skills = []
+        links = []
+        for i in range(len(catalog)):
+            name, url = catalog.name_of(i), catalog.url_of(i)
+            kind, _, slug, repo_path = split_link(url)
+            skills.append(
+                (
+                    i + 1,
+                    name,
+                    slug or name,
+                    catalog.description_of(i),
+                    catalog.category_of(i) + 1,
+                    catalog.author_of(i) or None,
+                    catalog.line_of(i),
+                )
+            )
+            links.append((i + 1, url, LINK_KINDS[kind], repo_path))
+        db.executemany(
+            "INSERT INTO skills (id, name, slug, description, category_id, author_id, line)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            skills,
+        )
+        db.executemany("INSERT INTO links (skill_id, url, kind, path) VALUES (?, ?, ?, ?)", links)
+        db.execute("INSERT INTO skills_fts (rowid, name, description) SELECT id, name, description FROM skills")
+        for statement in INDEXES:
+            db.execute(statement)
+        db.execute("INSERT INTO skills_fts (skills_fts) VALUES ('optimize')")
+        db.execute("COMMIT")
+        db.execute("ANALYZE")
+    except BaseException:
+        db.close()
+        tmp.unlink(missing_ok=True)
+        raise
+    db.close()
+    os.replace(tmp, path)
+    return path
+
+
+def fts_query(text: str) -> str:
+    """``text`` as an FTS5 query that matches every word literally.
+
+    Each whitespace-separated term becomes an FTS5 string, so ``foo-bar`` or
+    ``c++`` is searched for instead of parsed as a column filter or operator.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+def search(db: sqlite3.Connection, query: str, limit: int = 10, raw: bool = False) -> list[tuple]:
+    """FTS5 query ranked by bm25; rows are ``(name, category, description, url)``.
+
+    Plain words are ANDed; with ``raw=True``, ``query`` is passed to MATCH as
+    FTS5 syntax (``OR``, ``NEAR``, ``name:pdf``, ``pdf*``).
+    """
+    return db.execute(
+        "SELECT s.name, c.title, s.description, l.url"
+        " FROM skills_fts f"
+        " JOIN skills s ON s.id = f.rowid"
+        " JOIN categories c ON c.id = s.category_id"
+        " JOIN links l ON l.skill_id = s.id"
+        " WHERE skills_fts MATCH ?"
+        " ORDER BY bm25(skills_fts, 3.0, 1.0)"
+        " LIMIT ?",
+        (query if raw else fts_query(query), limit),
+    ).fetchall()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog sqlite", description="Export the catalog to SQLite with FTS5 search."
+    )
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("-o", "--output", default=str(DEFAULT_DATABASE))
+    parser.add_argument("-q", "--query", help="search an existing export instead of writing one")
+    parser.add_argument("-n", "--limit", type=int, default=10)
+    parser.add_argument("--raw", action="store_true", help="the query is FTS5 syntax, not plain words")
+    args = parser.parse_args(argv)
+
+    if args.query:
+        try:
+            db = sqlite3.connect(f"file:{args.output}?mode=ro", uri=True)
+            try:
+                rows = search(db, args.query, args.limit, args.raw)
+            finally:
+                db.close()
+        except sqlite3.OperationalError as exc:
+            # with --raw this is usually FTS5 syntax; otherwise the database is missing or not an export
+            print(f"error: {args.query if args.raw else args.output}: {exc}", file=sys.stderr)
+            return 1
+        except sqlite3.Error as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        for name, category, description, _ in rows:
+            print(f"{name:<36} {category:<28} {description}")
+        return 0 if rows else 1
+
+    t0 = time.perf_counter()
+    path = export(load(args.readme), args.output)
+    elapsed = (time.perf_counter() - t0) * 1000
+    print(f"wrote {path} ({path.stat().st_size / 1024:.0f} KiB) in {elapsed:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
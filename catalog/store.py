@@ -0,0 +1,311 @@
+"""Content-addressed store of skill files, materialized into installs as links.
+
+Every installed skill passes through the store, ``~/.openclaw/store/`` by
+default (``$OPENCLAW_STORE``)::
+
+    objects/ab/cdef...      file contents keyed by sha256 (``-x`` suffix: executable)
+    trees/<sha256>.json     one skill folder: relative path -> object, plus symlinks
+    refs/skills/<author>/<slug>.ref    tree last fetched for that skill, and from where
+
+A skill is fetched once into the store; each install into ``~/.openclaw/skills/``
+or ``<project>/skills/`` is then only directories and hardlinks to the objects,
+so installing an already-stored skill writes no file data and every copy of a
+file across all workspaces shares one inode. When the install lives on another
+file system the object is reflinked (``FICLONE``) if possible and copied
+otherwise.
+
+Objects are read-only: an installed skill that has to be edited should be
+installed with ``--copy`` instead. ``gc`` removes trees and objects no ref
+points to any more.
+"""
+
+from __future__ import annotations
+
+import argparse
+import errno
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None
+
+DEFAULT_STORE = Path(os.environ.get("OPENCLAW_STORE", Path.home() / ".openclaw" / "store"))
+
+# ioctl that makes a copy-on-write clone of a whole file (Linux btrfs/xfs/bcachefs)
+_FICLONE = 0x40049409
+_CHUNK = 1 << 20
+
+LINK = "link"
+REFLINK = "reflink"
+COPY = "copy"
+
+_counter = itertools.count()
+
+
+class StoreError(Exception):
+    """The store is missing a tree or an object it should have."""
+
+
+def hash_file(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def link_file(src: str | Path, dst: str | Path) -> str:
+    """Put ``src`` at ``dst`` as a hardlink, else a reflink, else a copy; return which one was made."""
+    try:
+        os.link(src, dst)
+        return LINK
+    except OSError as exc:
+        if exc.errno not in (errno.EXDEV, errno.EMLINK, errno.EPERM, errno.EACCES, errno.ENOTSUP):
+            raise
+    mode = 0o755 if os.stat(src).st_mode & stat.S_IXUSR else 0o644
+    if fcntl is not None:
+        try:
+            with open(src, "rb") as fin, open(dst, "wb") as fout:
+                fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+            os.chmod(dst, mode)
+            return REFLINK
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    os.chmod(dst, mode)
+    return COPY
+
+
+class Tree:
+    """The files (``(path, sha256, executable)``) and symlinks (``(path, target)``) of one skill folder."""
+
+    __slots__ = ("files", "links")
+
+    def __init__(self, files: list[tuple[str, str, bool]], links: list[tuple[str, str]]) -> None:
+        self.files = sorted(files)
+        self.links = sorted(links)
+
+    def encode(self) -> bytes:
+        data = {"files": [list(f) for f in self.files], "links": [list(link) for link in self.links]}
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(self.encode()).hexdigest()
+
+    @classmethod
+    def decode(cls, data: bytes) -> Tree:
+        raw = json.loads(data)
+        return cls([(p, h, bool(x)) for p, h, x in raw["files"]], [(p, t) for p, t in raw["links"]])
+
+
+class Store:
+    def __init__(self, root: str | Path = DEFAULT_STORE) -> None:
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.trees = self.root / "trees"
+        self.refs = self.root / "refs"
+        self.tmp = self.root / "tmp"
+
+    def object_path(self, digest: str, executable: bool = False) -> Path:
+        return self.objects / digest[:2] / (digest[2:] + ("-x" if executable else ""))
+
+    def stage(self) -> Path:
+        """A fresh path inside the store (same file system) for a source to fetch a skill into."""
+        self.tmp.mkdir(parents=True, exist_ok=True)
+        return self.tmp / f"{os.getpid()}-{next(_counter)}"
+
+    def ingest(self, folder: str | Path) -> str:
+        """Move the files of ``folder`` into the store and return its tree digest; ``folder`` is consumed."""
+        folder = str(folder)
+        files, links = [], []
+        for base, dirs, names in os.walk(folder):
+            for name in dirs + names:
+                path = os.path.join(base, name)
+                rel = os.path.relpath(path, folder).replace(os.sep, "/")
+                if os.path.islink(path):
+                    links.append((rel, os.readlink(path)))
+                elif name in names:
+                    executable = bool(os.stat(path).st_mode & stat.S_IXUSR)
+                    digest = hash_file(path)
+                    target = self.object_path(digest, executable)
+                    if not target.exists():
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        os.chmod(path, 0o555 if executable else 0o444)
+                        os.replace(path, target)
+                    files.append((rel, digest, executable))
+        tree = Tree(files, links)
+        digest = tree.digest
+        path = self.trees / f"{digest}.json"
+        if not path.exists():
+            self.trees.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}-{next(_counter)}.tmp")
+            tmp.write_bytes(tree.encode())
+            os.replace(tmp, path)
+        shutil.rmtree(folder, ignore_errors=True)
+        return digest
+
+    def tree(self, digest: str) -> Tree:
+        try:
+            return Tree.decode((self.trees / f"{digest}.json").read_bytes())
+        except FileNotFoundError:
+            raise StoreError(f"tree {digest} is not in {self.root}") from None
+
+    def materialize(self, digest: str, into: str | Path) -> dict[str, int]:
+        """Create the skill folder ``into`` from tree ``digest``; counts of links, reflinks and copies made."""
+        tree = self.tree(digest)
+        into = Path(into)
+        into.mkdir()
+        made = {LINK: 0, REFLINK: 0, COPY: 0}
+        for rel, file_digest, executable in tree.files:
+            dst = into / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                made[link_file(self.object_path(file_digest, executable), dst)] += 1
+            except FileNotFoundError:
+                raise StoreError(f"object {file_digest} of tree {digest} is missing") from None
+        for rel, target in tree.links:
+            dst = into / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            os.symlink(target, dst)
+        return made
+
+    def _ref_path(self, path: str) -> Path:
+        return self.refs / f"{path}.ref"
+
+    def ref(self, path: str) -> tuple[str, str] | None:
+        """``(tree, source)`` recorded for the skill folder ``path`` (``skills/<author>/<slug>``)."""
+        try:
+            tree, _, source = self._ref_path(path).read_text(encoding="utf-8").strip().partition(" ")
+        except FileNotFoundError:
+            return None
+        return tree, source
+
+    def set_ref(self, path: str, tree: str, source: str) -> None:
+        ref = self._ref_path(path)
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        tmp = ref.with_name(f"{ref.name}.{os.getpid()}-{next(_counter)}.tmp")
+        tmp.write_text(f"{tree} {source}\n", encoding="utf-8")
+        os.replace(tmp, ref)
+
+    def _walk_refs(self):
+        for base, _, names in os.walk(self.refs):
+            for name in names:
+                if name.endswith(".ref"):
+                    yield os.path.join(base, name)
+
+    def stats(self) -> dict[str, int]:
+        objects = size = shared = 0
+        for base, _, names in os.walk(self.objects):
+            for name in names:
+                st = os.stat(os.path.join(base, name))
+                objects += 1
+                size += st.st_size
+                # hardlinks beyond the store's own: installed copies that cost no space
+                shared += st.st_nlink - 1
+        trees = sum(1 for _ in self.trees.glob("*.json")) if self.trees.is_dir() else 0
+        refs = sum(1 for _ in self._walk_refs())
+        return {"refs": refs, "trees": trees, "objects": objects, "bytes": size, "linked": shared}
+
+    def gc(self) -> tuple[int, int]:
+        """Delete trees and objects no ref reaches; return ``(trees, objects)`` removed."""
+        live_trees = set()
+        for path in self._walk_refs():
+            with open(path, encoding="utf-8") as fh:
+                live_trees.add(fh.read().split(" ", 1)[0].strip())
+        live_objects = set()
+        removed_trees = 0
+        for path in self.trees.glob("*.json") if self.trees.is_dir() else ():
+            digest = path.name[: -len(".json")]
+            if digest in live_trees:
+                for _, file_digest, executable in self.tree(digest).files:
+                    live_objects.add(self.object_path(file_digest, executable))
+            else:
+                path.unlink()
+                removed_trees += 1
+        removed_objects = 0
+        for path in self.objects.glob("*/*") if self.objects.is_dir() else ():
+            if path not in live_objects:
+                path.unlink()
+                removed_objects += 1
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        return removed_trees, removed_objects
+
+
+class StoreSource:
+    """Wraps an install source so that skills are fetched into the store once and linked from there.
+
+    A stored skill is reused while the ref was recorded from the same source
+    ``ident`` (the mirror's path and commit, or the registry URL); a source
+    without an ident (a mirror that is not a git checkout) is fetched every
+    time, which still stores each file only once.
+    """
+
+    def __init__(self, store: Store, source, refresh: bool = False) -> None:
+        self.store = store
+        self.source = source
+        self.refresh = refresh
+        self.fetched = 0
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    def _fetch(self, target) -> str:
+        stage = self.store.stage()
+        try:
+            self.source.fetch(target, stage)
+            tree = self.store.ingest(stage)
+        finally:
+            shutil.rmtree(stage, ignore_errors=True)
+        self.store.set_ref(target.path, tree, self.source.ident or "")
+        with self._lock:
+            self.fetched += 1
+        return tree
+
+    def fetch(self, target, into: Path) -> int:
+        ident = self.source.ident
+        ref = None if self.refresh or not ident else self.store.ref(target.path)
+        if ref is not None and ref[1] == ident:
+            try:
+                made = self.store.materialize(ref[0], into)
+                with self._lock:
+                    self.reused += 1
+                return sum(made.values())
+            except StoreError:
+                shutil.rmtree(into, ignore_errors=True)
+        return sum(self.store.materialize(self._fetch(target), into).values())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog store", description="Inspect or garbage-collect the content-addressed skill store."
+    )
+    parser.add_argument("--store", default=str(DEFAULT_STORE))
+    parser.add_argument("action", choices=("stats", "gc"))
+    args = parser.parse_args(argv)
+
+    store = Store(args.store)
+    t0 = time.perf_counter()
+    if args.action == "gc":
+        trees, objects = store.gc()
+        print(f"removed {trees} trees and {objects} objects ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+        return 0
+    stats = store.stats()
+    print(
+        f"{store.root}: {stats['refs']} skills, {stats['trees']} trees, {stats['objects']} objects"
+        f" ({stats['bytes'] / 1024:.1f} KiB), {stats['linked']} installed links"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
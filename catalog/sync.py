@@ -0,0 +1,192 @@
+"""Carry entry additions and removals from README.md into README_zh.md.
+
+The two files share their structure: the same ``<details>`` categories in the
+same order (titles translated) holding the same entries. Both are parsed
+once, categories are paired by position and entries are keyed by URL, and
+each Chinese category is rebuilt in English order in one linear pass:
+
+* an entry only in README.md is inserted with its English line,
+* an entry only in README_zh.md is dropped,
+* an entry in both keeps its Chinese line when its description contains
+  Chinese text, and otherwise takes the English line (so name and
+  description fixes flow through).
+
+Only the entry lines of each category are replaced; headings, intro and all
+other translated prose stay byte-for-byte as they were. Non-entry lines
+between two entries (a blank line, a comment, a sub-heading, a translator's
+note) stay in front of the entry that followed them; if that entry is
+removed they go in front of the next kept entry, or to the end of the
+category. The file keeps its own line ending. The header, badge and
+Table of Contents counts are then fixed with :mod:`catalog.reconcile`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+from catalog import reconcile
+from catalog.parser import DEFAULT_README, Catalog, load, parse
+from catalog.source import DEFAULT_ZH_README
+
+_CJK = re.compile(r"[぀-ヿ㐀-䶿一-鿿豈-﫿]")
+
+
+class SyncError(ValueError):
+    """The files do not share a structure that can be synced."""
+
+
+class SectionChange:
+    __slots__ = ("title", "added", "removed", "updated", "reordered")
+
+    def __init__(
+        self, title: str, added: list[str], removed: list[str], updated: list[str], reordered: bool = False
+    ) -> None:
+        self.title = title
+        self.added = added
+        self.removed = removed
+        self.updated = updated
+        # the entries are the same but their order follows README.md now
+        self.reordered = reordered
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated or self.reordered)
+
+
+def _line(catalog: Catalog, index: int) -> bytes:
+    start, end = catalog.span_of(index)
+    return catalog.buffer[start:end]
+
+
+def _newline(buffer: bytes) -> bytes:
+    eol = buffer.find(b"\n")
+    return b"\r\n" if eol > 0 and buffer[eol - 1 : eol] == b"\r" else b"\n"
+
+
+def _entries_region(catalog: Catalog, section_index: int) -> tuple[int, int]:
+    """Byte range holding the entry lines of a section (empty range after the summary if none)."""
+    section = catalog.sections[section_index]
+    if section.stop > section.first:
+        return catalog.span_of(section.first)[0], catalog.span_of(section.stop - 1)[1]
+    buffer = catalog.buffer
+    pos = buffer.index(b"</summary>", section.start, section.end)
+    pos = buffer.index(b"\n", pos) + 1
+    if buffer.startswith(b"\n", pos):
+        pos += 1
+    return pos, pos
+
+
+def merge(english: Catalog, chinese: Catalog) -> tuple[bytes, list[SectionChange]]:
+    """The Chinese buffer with every category's entries brought in line with ``english``."""
+    if len(english.sections) != len(chinese.sections):
+        raise SyncError(
+            f"README.md has {len(english.sections)} categories but README_zh.md has {len(chinese.sections)};"
+            " add the translated <details> block by hand first"
+        )
+    newline = _newline(chinese.buffer)
+    chunks = []
+    pos = 0
+    changes = []
+    for k, (en, zh) in enumerate(zip(english.sections, chinese.sections)):
+        by_url: dict[str, deque[int]] = {}
+        for j in range(zh.first, zh.stop):
+            by_url.setdefault(chinese.url_of(j), deque()).append(j)
+        # (index of the Chinese entry kept, or None for an added one, line)
+        picked: list[tuple[int | None, bytes]] = []
+        added, updated = [], []
+        for i in range(en.first, en.stop):
+            candidates = by_url.get(english.url_of(i))
+            if not candidates:
+                picked.append((None, _line(english, i)))
+                added.append(english.name_of(i))
+                continue
+            j = candidates.popleft()
+            if _CJK.search(chinese.description_of(j)):
+                picked.append((j, _line(chinese, j)))
+            else:
+                line = _line(english, i)
+                if line != _line(chinese, j):
+                    updated.append(english.name_of(i))
+                picked.append((j, line))
+        removed = [chinese.name_of(j) for rest in by_url.values() for j in rest]
+        kept = [j for j, _ in picked if j is not None]
+        change = SectionChange(zh.title, added, removed, updated, kept != sorted(kept))
+        changes.append(change)
+        if not change:
+            continue
+
+        # the non-entry lines in front of each kept entry; those of a removed entry move to the next kept one
+        leading: dict[int, bytes] = {}
+        carried = b""
+        survivors = set(kept)
+        for j in range(zh.first, zh.stop):
+            if j > zh.first:
+                gap = chinese.buffer[chinese.span_of(j - 1)[1] : chinese.span_of(j)[0]]
+                carried += gap[gap.index(b"\n") + 1 :]
+            if j in survivors:
+                leading[j], carried = carried, b""
+        items = [(b"" if j is None else leading[j]) + line for j, line in picked]
+        if carried:
+            items.append(carried[:-2] if carried.endswith(b"\r\n") else carried[:-1])
+        block = newline.join(items)
+        start, end = _entries_region(chinese, k)
+        if start == end and block:
+            block += newline
+        chunks.append(chinese.buffer[pos:start])
+        chunks.append(block)
+        pos = end
+    chunks.append(chinese.buffer[pos:])
+    return b"".join(chunks), changes
+
+
+def sync(
+    readme: str | Path = DEFAULT_README, readme_zh: str | Path = DEFAULT_ZH_README, check: bool = False
+) -> list[SectionChange]:
+    """Sync ``readme_zh`` from ``readme``; with ``check`` only report what would change."""
+    chinese = load(readme_zh)
+    buffer, changes = merge(load(readme), chinese)
+    if buffer != chinese.buffer:
+        if check:
+            return changes
+        counts = reconcile.plan(parse(buffer))
+        with open(readme_zh, "wb") as fh:
+            fh.write(buffer)
+        reconcile.apply(readme_zh, buffer, counts)
+    return changes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m catalog sync", description="Apply README.md entry additions/removals to README_zh.md."
+    )
+    parser.add_argument("--readme", default=str(DEFAULT_README))
+    parser.add_argument("--readme-zh", default=str(DEFAULT_ZH_README))
+    parser.add_argument("--check", action="store_true", help="exit 1 if README_zh.md is out of sync; write nothing")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        changes = sync(args.readme, args.readme_zh, args.check)
+    except SyncError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    elapsed = (time.perf_counter() - t0) * 1000
+    dirty = [change for change in changes if change]
+    for change in dirty:
+        print(f"{change.title}:")
+        for label, names in (("+", change.added), ("-", change.removed), ("~", change.updated)):
+            for name in names:
+                print(f"  {label} {name}")
+        if change.reordered:
+            print("  reordered")
+    verb = "out of sync in" if args.check else "synced"
+    print(f"{verb} {len(dirty)} of {len(changes)} categories ({elapsed:.1f} ms)", file=sys.stderr)
+    return 1 if args.check and dirty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Shared fixtures: a small rendered catalog and a fake openclaw/skills clone of its skills."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from catalog import render, source
+from catalog.source import CatalogData, Category, Skill
+
+SKILLS = "https://github.com/openclaw/skills/tree/main/skills"
+TEMPLATE = (
+    "# Test\n\n![Skills](https://img.shields.io/badge/skills-{{count}}-blue)\n\nDiscover {{count}} skills.\n\n"
+    "This list has **{{count_grouped}} skills**.\n\n## Table of Contents\n\n{{toc}}\n{{sections}}\n## Footer\n"
+)
+
+
+def sample_data() -> CatalogData:
+    categories = [Category("Git & GitHub", "Git 与 GitHub", True), Category("Notes", "笔记")]
+    skills = {
+        "Git & GitHub": [
+            Skill("Git & GitHub", "github", f"{SKILLS}/a/github/SKILL.md", "Use gh."),
+            Skill("Git & GitHub", "gitlab", f"{SKILLS}/a/gitlab/SKILL.md", "Use glab."),
+        ],
+        "Notes": [Skill("Notes", "obsidian", f"{SKILLS}/b/obsidian/SKILL.md", "Vaults.", "笔记库。")],
+    }
+    return CatalogData(categories, skills)
+
+
+class Repo:
+    """Paths of a rendered sample catalog under ``tmp_path``."""
+
+    def __init__(self, root) -> None:
+        self.root = root
+        self.data_dir = root / "data"
+        self.manifest = self.data_dir / ".render-manifest.json"
+        self.readme = root / "README.md"
+        self.readme_zh = root / "README_zh.md"
+        templates = self.data_dir / "templates"
+        self.outputs = (
+            (self.readme, "en", templates / "README.md.tmpl"),
+            (self.readme_zh, "zh", templates / "README_zh.md.tmpl"),
+        )
+
+    def render(self, data: CatalogData | None = None, **kwargs) -> list[render.RenderResult]:
+        data = source.read(self.data_dir) if data is None else data
+        return render.render(data, self.outputs, self.manifest, **kwargs)
+
+
+@pytest.fixture
+def repo(tmp_path) -> Repo:
+    repo = Repo(tmp_path)
+    source.write(sample_data(), repo.data_dir)
+    for _, language, template in repo.outputs:
+        template.parent.mkdir(parents=True, exist_ok=True)
+        template.write_text(TEMPLATE if language == "en" else TEMPLATE.replace("Discover", "发现"), encoding="utf-8")
+    repo.render()
+    return repo
+
+
+def write_skill(folder, name: str, description: str = "A skill.", body: str = "Do the thing.\n"):
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n{body}", encoding="utf-8")
+    return folder
+
+
+def set_commit(mirror, commit: str) -> None:
+    """Make ``mirror`` look like a git checkout at ``commit``."""
+    (mirror / ".git").mkdir(exist_ok=True)
+    (mirror / ".git" / "HEAD").write_text(commit + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """A clone of openclaw/skills with the sample catalog's skills; gitlab has a script and a symlink."""
+    root = tmp_path / "mirror"
+    for skill in sample_data():
+        write_skill(root / skill.url.split("/tree/main/")[1].rsplit("/", 1)[0], skill.name, skill.description)
+    scripts = root / "skills" / "a" / "gitlab" / "scripts"
+    scripts.mkdir()
+    (scripts / "run.sh").write_text("#!/bin/sh\nglab \"$@\"\n", encoding="utf-8")
+    os.chmod(scripts / "run.sh", 0o755)
+    os.symlink("scripts/run.sh", root / "skills" / "a" / "gitlab" / "run")
+    set_commit(root, "1" * 40)
+    return root
@@ -0,0 +1,68 @@
+"""The HTTP JSON API on an ephemeral port."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from catalog import api
+from catalog.parser import DEFAULT_README
+
+
+@pytest.fixture
+def served(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "RELOAD_INTERVAL", 0.0)
+    readme = tmp_path / "README.md"
+    shutil.copy(DEFAULT_README, readme)
+    server = api.make_server(api.Api(readme), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield readme, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url, **headers):
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        with exc:
+            return exc.code, exc.headers, exc.read()
+
+
+def test_etag_is_checked_after_routing(served):
+    _, base = served
+    status, headers, body = _get(f"{base}/categories")
+    assert status == 200
+    assert json.loads(body)
+    etag = headers["ETag"]
+    assert _get(f"{base}/categories", **{"If-None-Match": etag})[0] == 304
+    assert _get(f"{base}/nonexistent", **{"If-None-Match": etag})[0] == 404
+
+
+def test_unreadable_readme_is_503_until_it_returns(served):
+    readme, base = served
+    saved = readme.read_bytes()
+    readme.unlink()
+    status, _, body = _get(f"{base}/categories")
+    assert status == 503
+    assert "README.md" in json.loads(body)["error"]
+    readme.write_bytes(saved)
+    assert _get(f"{base}/categories")[0] == 200
+
+
+def test_reload_reindexes_search(served):
+    readme, base = served
+    status, _, body = _get(f"{base}/search?q=github&limit=1")
+    assert status == 200
+    (hit,) = json.loads(body)["items"]
+    text = readme.read_text(encoding="utf-8").replace(f"[{hit['name']}](", "[renamed-by-test](", 1)
+    readme.write_text(text, encoding="utf-8")
+    _, _, body = _get(f"{base}/search?q=renamed-by-test&limit=1")
+    assert [item["name"] for item in json.loads(body)["items"]] == ["renamed-by-test"]
@@ -0,0 +1,28 @@
+"""Frontmatter harvesting of ``catalog.harvest`` against a local mirror."""
+
+from __future__ import annotations
+
+from catalog.harvest import harvest
+from catalog.parser import parse
+
+from conftest import SKILLS, write_skill
+
+README = f"""<details>
+<summary><h3 style="display:inline">Git</h3></summary>
+
+- [github]({SKILLS}/a/github/SKILL.md) - Use gh.
+- [seo-audit]({SKILLS}/a/github/references/seo/SKILL.md) - Audit.
+- [secret]({SKILLS}/../../secret/SKILL.md) - Escapes the mirror.
+- [nested]({SKILLS}/a/./gitlab/SKILL.md) - Dot segment.
+
+</details>
+"""
+
+
+def test_harvest_reads_only_paths_inside_the_mirror(mirror, tmp_path):
+    write_skill(mirror / "skills" / "a" / "github" / "references" / "seo", "seo-audit", "Audits SEO.")
+    write_skill(tmp_path / "secret", "secret", "Outside the mirror.")
+    catalog = parse(README.encode())
+    found, linked = harvest(catalog, mirror, workers=2)
+    assert linked == 2
+    assert sorted(fields["name"] for fields in found.values()) == ["github", "seo-audit"]
@@ -0,0 +1,107 @@
+"""Spec resolution, concurrent installs and lockfile pins of ``catalog.install``."""
+
+from __future__ import annotations
+
+import pytest
+
+from catalog.install import (
+    FAILED,
+    INSTALLED,
+    SKIPPED,
+    MirrorSource,
+    Result,
+    Target,
+    install,
+    pins,
+    resolve,
+)
+from catalog.parser import parse
+
+from conftest import SKILLS, sample_data
+
+README = f"""<details>
+<summary><h3 style="display:inline">Git</h3></summary>
+
+- [github]({SKILLS}/a/github/SKILL.md) - Use gh.
+- [GitHub CLI]({SKILLS}/z/github/SKILL.md) - Also gh.
+- [gitlab]({SKILLS}/a/gitlab/SKILL.md) - Use glab.
+- [Obsidian Notes]({SKILLS}/b/obsidian/SKILL.md) - Vaults.
+
+</details>
+"""
+
+
+def _resolve(*specs):
+    targets, errors = resolve(parse(README.encode()), specs)
+    return [t.path for t in targets], [spec for spec, _ in errors]
+
+
+def test_specs_resolve_by_slug_path_name_and_link():
+    assert _resolve("gitlab", "z/github", "obsidian notes") == (
+        ["skills/a/gitlab", "skills/z/github", "skills/b/obsidian"],
+        [],
+    )
+    assert _resolve(f"{SKILLS}/a/github/SKILL.md") == (["skills/a/github"], [])
+
+
+def test_ambiguous_unknown_and_colliding_specs_are_errors():
+    assert _resolve("github", "nope", "a/github", "z/github") == (["skills/a/github"], ["github", "nope", "z/github"])
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "../a/github",
+        "a/../../etc",
+        f"{SKILLS}/../../../etc/SKILL.md",
+        f"{SKILLS}/a/../github/SKILL.md",
+        "https://example.com/skills/a/github/SKILL.md",
+    ],
+)
+def test_traversal_and_foreign_links_are_rejected(spec):
+    assert _resolve(spec) == ([], [spec])
+
+
+def _targets() -> list[Target]:
+    targets = []
+    for skill in sample_data():
+        author = skill.url.split("/")[-3]
+        targets.append(Target(skill.name, author, skill.name, f"skills/{author}/{skill.name}"))
+    return targets
+
+
+def test_install_skip_and_force(mirror, tmp_path):
+    dest = tmp_path / "skills"
+    source = MirrorSource(mirror)
+    results = install(_targets(), source, dest, jobs=4)
+    assert [r.status for r in results] == [INSTALLED] * 3
+    assert (dest / "gitlab" / "scripts" / "run.sh").is_file()
+    assert (dest / "gitlab" / "run").is_symlink()
+
+    (mirror / "skills" / "a" / "github" / "SKILL.md").write_text("---\nname: github\n---\nv2\n", encoding="utf-8")
+    (dest / "github" / "local-notes.txt").write_text("mine", encoding="utf-8")
+    assert [r.status for r in install(_targets(), source, dest)] == [SKIPPED] * 3
+    assert (dest / "github" / "local-notes.txt").exists()
+
+    assert [r.status for r in install(_targets()[:1], source, dest, force=True)] == [INSTALLED]
+    assert (dest / "github" / "SKILL.md").read_text(encoding="utf-8").endswith("v2\n")
+    assert not (dest / "github" / "local-notes.txt").exists()
+    assert sorted(p.name for p in dest.iterdir()) == ["github", "gitlab", "obsidian"]
+
+
+def test_failed_fetch_leaves_nothing_behind(mirror, tmp_path):
+    dest = tmp_path / "skills"
+    (mirror / "skills" / "b" / "obsidian" / "SKILL.md").unlink()
+    results = install(_targets(), MirrorSource(mirror), dest)
+    assert [r.status for r in results] == [INSTALLED, INSTALLED, FAILED]
+    assert "no SKILL.md" in results[2].error
+    assert sorted(p.name for p in dest.iterdir()) == ["github", "gitlab"]
+
+
+def _result(slug: str, status: str) -> Result:
+    return Result(Target(slug, "someone", slug, f"skills/someone/{slug}"), status)
+
+
+def test_only_installed_skills_are_pinned():
+    results = [_result("new", INSTALLED), _result("present", SKIPPED), _result("broken", FAILED)]
+    assert pins(results) == {"new": "skills/someone/new"}
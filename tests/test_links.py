@@ -0,0 +1,102 @@
+"""The link checker against a local stub HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from catalog.links import LinkChecker, check_urls
+
+
+class _Stub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self, body: bool) -> None:
+        if self.path.startswith("/redirect"):
+            self.send_response(301)
+            self.send_header("Location", "/ok/redirected")
+        elif self.path.startswith("/ok"):
+            self.send_response(200)
+        elif self.path.startswith("/head-not-allowed"):
+            self.send_response(405 if self.command == "HEAD" else 200)
+        else:
+            self.send_response(404)
+        payload = b"stub" if body else b""
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_HEAD(self) -> None:
+        self._respond(False)
+
+    def do_GET(self) -> None:
+        self._respond(True)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    server.daemon_threads = True
+    server.connections = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keep_alive_reuses_one_connection(stub):
+    server, base = stub
+
+    async def run():
+        async with LinkChecker(per_host=1) as checker:
+            results = await checker.check_all(f"{base}/ok/{i}" for i in range(20))
+            return results, checker.connections_opened
+
+    results, opened = asyncio.run(run())
+    assert [r.status for r in results] == [200] * 20
+    assert opened == 1
+    assert server.connections == 1
+
+
+def test_redirect_is_followed(stub):
+    _, base = stub
+    (result,) = asyncio.run(check_urls([f"{base}/redirect"]))
+    assert result.ok
+    assert result.status == 200
+    assert result.final_url == f"{base}/ok/redirected"
+
+
+def test_broken_links_are_reported(stub):
+    _, base = stub
+    missing, ok = asyncio.run(check_urls([f"{base}/missing", f"{base}/ok"]))
+    assert missing.status == 404
+    assert not missing.ok
+    assert ok.ok
+
+
+def test_head_405_falls_back_to_get(stub):
+    _, base = stub
+    (result,) = asyncio.run(check_urls([f"{base}/head-not-allowed"]))
+    assert result.status == 200
+
+
+def test_refused_connection_is_an_error():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    port = server.server_address[1]
+    server.server_close()
+    (result,) = asyncio.run(check_urls([f"http://127.0.0.1:{port}/ok"], timeout=5))
+    assert not result.ok
+    assert result.error
@@ -0,0 +1,48 @@
+"""Linting only the README lines a git diff reports."""
+
+from __future__ import annotations
+
+import subprocess
+
+import pytest
+
+from catalog.lint import changed_lines, main
+
+from conftest import SKILLS
+
+GIT = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+BAD = f"- [leaky]({SKILLS}/c/leaky/SKILL.md) - one two three four five six seven eight nine ten eleven twelve"
+
+
+@pytest.fixture
+def checkout(repo):
+    """The fixture catalog committed, then a bad entry added to README.md."""
+    subprocess.run(["git", "init", "-q"], cwd=repo.root, check=True)
+    subprocess.run(GIT + ["add", "."], cwd=repo.root, check=True)
+    subprocess.run(GIT + ["commit", "-q", "-m", "catalog"], cwd=repo.root, check=True)
+    (repo.root / "sub").mkdir()
+    lines = repo.readme.read_text(encoding="utf-8").split("\n")
+    number = next(i for i, line in enumerate(lines) if line.startswith("- [obsidian]")) + 1
+    lines.insert(number, BAD)
+    repo.readme.write_text("\n".join(lines), encoding="utf-8")
+    return repo, number + 1
+
+
+def test_relative_path_from_a_subdirectory(checkout, monkeypatch):
+    repo, line = checkout
+    monkeypatch.chdir(repo.root / "sub")
+    assert changed_lines("HEAD", "../README.md") == {line}
+    assert main(["../README.md", "--diff", "HEAD"]) == 1
+
+
+def test_absolute_path_in_another_checkout(checkout, monkeypatch, tmp_path_factory):
+    repo, line = checkout
+    monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+    assert changed_lines("HEAD", repo.readme) == {line}
+
+
+def test_file_outside_any_checkout_is_an_error(tmp_path, capsys):
+    readme = tmp_path / "README.md"
+    readme.write_text("# nothing\n", encoding="utf-8")
+    assert main([str(readme), "--diff", "HEAD"]) == 2
+    assert "git diff failed" in capsys.readouterr().err
@@ -0,0 +1,53 @@
+"""Frontmatter-only loading of installed skills and its persisted index."""
+
+from __future__ import annotations
+
+import json
+import os
+
+from catalog.loader import load_skills
+from catalog.resolve import LOCAL, WORKSPACE, Resolver
+
+from conftest import write_skill
+
+
+def _load(tmp_path):
+    locations = [(WORKSPACE, tmp_path / "workspace"), (LOCAL, tmp_path / "local")]
+    with Resolver(locations, watch=False) as resolver:
+        return load_skills(resolver, tmp_path / "index.json")
+
+
+def test_index_is_reused_until_a_file_changes(tmp_path):
+    write_skill(tmp_path / "local" / "github", "github", "Use gh.")
+    skill_md = write_skill(tmp_path / "local" / "notes", "notes", "Vaults.", "Open the vault.\n") / "SKILL.md"
+
+    cold = _load(tmp_path)
+    assert (len(cold), cold.read, cold.reused) == (2, 2, 0)
+    assert cold["notes"].description == "Vaults."
+    assert cold["notes"].read_body() == "Open the vault.\n"
+
+    warm = _load(tmp_path)
+    assert (warm.read, warm.reused, warm.header_bytes) == (0, 2, 0)
+    assert warm["notes"].read_body() == "Open the vault.\n"
+
+    mtime = skill_md.stat().st_mtime_ns
+    write_skill(skill_md.parent, "notes", "Markdown vaults.", "Open it.\n")
+    os.utime(skill_md, ns=(mtime + 10**9, mtime + 10**9))
+    changed = _load(tmp_path)
+    assert (changed.read, changed.reused) == (1, 1)
+    assert changed["notes"].description == "Markdown vaults."
+    assert changed["notes"].read_body() == "Open it.\n"
+
+
+def test_workspace_copy_wins_and_removed_skills_leave_the_index(tmp_path):
+    write_skill(tmp_path / "local" / "github", "github", "Local.")
+    write_skill(tmp_path / "workspace" / "github", "github", "Workspace.")
+    skills = _load(tmp_path)
+    assert (skills["github"].location, skills["github"].description) == (WORKSPACE, "Workspace.")
+
+    (tmp_path / "workspace" / "github" / "SKILL.md").unlink()
+    skills = _load(tmp_path)
+    # the shadowed local copy was never indexed
+    assert (skills["github"].location, skills.read, skills.reused) == (LOCAL, 1, 0)
+    indexed = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))["skills"]
+    assert list(indexed) == [str(tmp_path / "local" / "github" / "SKILL.md")]
@@ -0,0 +1,65 @@
+"""Pinning installs in skills.lock and verifying them through the stat cache."""
+
+from __future__ import annotations
+
+import os
+import shutil
+
+import pytest
+
+from catalog import lock
+from catalog.install import MirrorSource, Target, install
+from catalog.lock import MISSING, MODIFIED, OK, update, verify
+from catalog.store import Store, StoreSource
+
+GITLAB = Target("gitlab", "a", "gitlab", "skills/a/gitlab")
+GITHUB = Target("github", "a", "github", "skills/a/github")
+
+
+@pytest.fixture
+def pinned(mirror, tmp_path, monkeypatch):
+    cache = tmp_path / "verify-cache.json"
+    monkeypatch.setattr(lock, "DEFAULT_CACHE", cache)
+    dest = tmp_path / "project" / "skills"
+    install([GITHUB, GITLAB], StoreSource(Store(tmp_path / "store"), MirrorSource(mirror)), dest)
+    lockfile = lock.lock_path(dest)
+    update(lockfile, dest, {"github": GITHUB.path, "gitlab": GITLAB.path}, cache)
+    return lockfile, dest, cache
+
+
+def _statuses(pinned):
+    lockfile, dest, cache = pinned
+    return {check.slug: check.status for check in verify(lockfile, dest, cache)}
+
+
+def test_unchanged_install_is_verified_from_the_cache(pinned):
+    lockfile, dest, cache = pinned
+    checks = verify(lockfile, dest, cache)
+    assert [(c.slug, c.status, c.hashed) for c in checks] == [("github", OK, 0), ("gitlab", OK, 0)]
+
+
+def test_in_place_edit_with_the_old_mtime_is_caught(pinned):
+    _, dest, _ = pinned
+    path = dest / "gitlab" / "scripts" / "run.sh"
+    st = os.stat(path)
+    data = path.read_bytes()
+    # same size, same inode (the file is shared with the store), mtime put back
+    os.chmod(path, 0o755)
+    with open(path, "r+b") as fh:
+        fh.write(data.replace(b"glab", b"evil"))
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    after = os.stat(path)
+    assert (after.st_size, after.st_mtime_ns, after.st_ino) == (st.st_size, st.st_mtime_ns, st.st_ino)
+    assert _statuses(pinned) == {"github": OK, "gitlab": MODIFIED}
+    assert lock.main(["verify", "--dest", str(dest)]) == 1
+
+
+def test_missing_and_added_files(pinned):
+    _, dest, _ = pinned
+    (dest / "github" / "extra.md").write_text("new", encoding="utf-8")
+    os.unlink(dest / "gitlab" / "run")
+    assert _statuses(pinned) == {"github": MODIFIED, "gitlab": MODIFIED}
+    for name in ("github", "gitlab"):
+        shutil.rmtree(dest / name)
+    assert _statuses(pinned) == {"github": MISSING, "gitlab": MISSING}
+    assert lock.main(["verify", "--dest", str(dest)]) == 1
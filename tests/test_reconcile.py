@@ -0,0 +1,43 @@
+"""Fixing the hand-maintained counts in a README."""
+
+from __future__ import annotations
+
+from catalog.reconcile import reconcile
+
+from conftest import SKILLS
+
+GITLAB = f"- [gitlab]({SKILLS}/a/gitlab/SKILL.md) - Use glab."
+GITEA = f"- [gitea]({SKILLS}/c/gitea/SKILL.md) - Use tea."
+
+
+def test_rendered_readme_needs_no_edits(repo):
+    assert reconcile(repo.readme) == []
+    assert reconcile(repo.readme_zh) == []
+
+
+def test_added_entry_updates_every_count_in_place(repo):
+    text = repo.readme.read_text(encoding="utf-8").replace(GITLAB, f"{GITLAB}\n{GITEA}")
+    repo.readme.write_text(text, encoding="utf-8")
+    inode = repo.readme.stat().st_ino
+    edits = reconcile(repo.readme)
+    assert [(e.what, e.old, e.new) for e in edits] == [
+        ("total (count)", b"3", b"4"),
+        ("total (count)", b"3", b"4"),
+        ("total (count_grouped)", b"3", b"4"),
+        ("ToC Git & GitHub", b"2", b"3"),
+    ]
+    fixed = repo.readme.read_text(encoding="utf-8")
+    assert fixed == text.replace("-3-", "-4-").replace(" 3 ", " 4 ").replace("**3 ", "**4 ").replace(
+        "(#git--github) (2)", "(#git--github) (3)"
+    )
+    assert repo.readme.stat().st_ino == inode
+    assert reconcile(repo.readme) == []
+
+
+def test_count_of_another_length_rewrites_the_tail(repo):
+    rendered = repo.readme.read_text(encoding="utf-8")
+    repo.readme.write_text(rendered.replace("Discover 3", "Discover 1,234").replace("(1)", "(10)"), encoding="utf-8")
+    assert len(reconcile(repo.readme, check=True)) == 2
+    assert "1,234" in repo.readme.read_text(encoding="utf-8")
+    assert [e.line for e in reconcile(repo.readme)] == [5, 13]
+    assert repo.readme.read_text(encoding="utf-8") == rendered
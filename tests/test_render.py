@@ -0,0 +1,97 @@
+"""Rendering the READMEs from data/ and importing hand edits back."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from catalog import render, source
+from catalog.parser import load
+
+
+def _edit_skills(repo, old: str, new: str) -> None:
+    path = repo.data_dir / "skills.jsonl"
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+def test_second_render_writes_nothing(repo):
+    assert [r.written for r in repo.render()] == [False, False]
+
+
+def test_data_edit_is_rendered(repo):
+    _edit_skills(repo, "Use gh.", "Use the gh CLI.")
+    results = repo.render()
+    assert [r.changed_sections for r in results] == [["Git & GitHub"], ["Git & GitHub"]]
+    assert "Use the gh CLI." in repo.readme.read_text(encoding="utf-8")
+
+
+def test_hand_edit_is_not_overwritten(repo):
+    edited = repo.readme.read_text(encoding="utf-8").replace("Vaults.", "Markdown vaults.")
+    repo.readme.write_text(edited, encoding="utf-8")
+    _edit_skills(repo, "Use gh.", "Use the gh CLI.")
+    with pytest.raises(render.RenderConflict) as exc:
+        repo.render()
+    assert exc.value.paths == [repo.readme]
+    assert repo.readme.read_text(encoding="utf-8") == edited
+    repo.render(force=True)
+    assert "Markdown vaults." not in repo.readme.read_text(encoding="utf-8")
+
+
+def test_manifest_survives_moving_the_checkout(repo, tmp_path):
+    assert set(json.loads(repo.manifest.read_text(encoding="utf-8"))) == {"../README.md", "../README_zh.md"}
+    moved = type(repo)(tmp_path.parent / (tmp_path.name + "-moved"))
+    shutil.copytree(repo.root, moved.root)
+    _edit_skills(moved, "Use gh.", "Use the gh CLI.")
+    assert [r.written for r in moved.render()] == [True, True]
+
+
+def _commit(root) -> None:
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    subprocess.run(git + ["add", "."], cwd=root, check=True)
+    subprocess.run(git + ["commit", "-q", "-m", "catalog"], cwd=root, check=True)
+
+
+def test_fresh_clone_renders_data_edits(repo):
+    repo.manifest.unlink()
+    _commit(repo.root)
+    _edit_skills(repo, "Use gh.", "Use the gh CLI.")
+    assert [r.written for r in repo.render()] == [True, True]
+    assert "Use the gh CLI." in repo.readme.read_text(encoding="utf-8")
+
+
+def test_fresh_clone_without_git_needs_matching_data(repo):
+    repo.manifest.unlink()
+    assert [r.written for r in repo.render()] == [False, False]
+    repo.manifest.unlink()
+    _edit_skills(repo, "Use gh.", "Use the gh CLI.")
+    # nothing says which entries the README was rendered from
+    with pytest.raises(render.RenderConflict):
+        repo.render()
+
+
+def test_fresh_clone_keeps_chrome_edits(repo):
+    repo.manifest.unlink()
+    _commit(repo.root)
+    repo.readme.write_text(repo.readme.read_text(encoding="utf-8").replace("## Footer", "## Thanks"), "utf-8")
+    _edit_skills(repo, "Use gh.", "Use the gh CLI.")
+    with pytest.raises(render.RenderConflict):
+        repo.render()
+
+
+def test_import_round_trip(repo):
+    readme = repo.readme.read_text(encoding="utf-8")
+    repo.readme.write_text(readme.replace("Vaults.", "Markdown vaults."), encoding="utf-8")
+    data = source.import_readmes(repo.readme, repo.readme_zh)
+    assert [s.description for s in data.skills["Notes"]] == ["Markdown vaults."]
+    assert data.skills["Notes"][0].description_zh == "笔记库。"
+    source.write(data, repo.data_dir)
+    for path, _, template in repo.outputs:
+        assert render.extract_template(path) == template.read_text(encoding="utf-8")
+    before = {path: path.read_bytes() for path, _, _ in repo.outputs}
+    repo.render(force=True)
+    assert {path: path.read_bytes() for path, _, _ in repo.outputs} == before
+    assert len(load(repo.readme)) == 3
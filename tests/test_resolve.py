@@ -0,0 +1,66 @@
+"""Resolver invalidation when skill folders and their SKILL.md change."""
+
+from __future__ import annotations
+
+import pytest
+
+from catalog import resolve
+from catalog.resolve import LOCAL, WORKSPACE, Resolver
+
+
+def _skill(directory, name):
+    folder = directory / name
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "SKILL.md").write_text(f"---\nname: {name}\n---\n", encoding="utf-8")
+    return folder
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "polling"])
+def skills(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(resolve, "POLL_INTERVAL", 0.0)
+    workspace, local = tmp_path / "workspace", tmp_path / "local"
+    workspace.mkdir()
+    local.mkdir()
+    with Resolver([(WORKSPACE, workspace), (LOCAL, local)], watch=request.param) as resolver:
+        if request.param and not resolver.watching:
+            pytest.skip("inotify is not available")
+        yield resolver, workspace, local
+
+
+def _where(resolver, name):
+    resolution = resolver.resolve(name)
+    return resolution and resolution.location
+
+
+def test_workspace_shadows_local(skills):
+    resolver, workspace, local = skills
+    _skill(local, "github")
+    assert _where(resolver, "github") == LOCAL
+    _skill(workspace, "github")
+    assert _where(resolver, "github") == WORKSPACE
+    assert [r.location for r in resolver.shadowed("github")] == [LOCAL]
+
+
+def test_removed_skill_md_unresolves(skills):
+    resolver, workspace, local = skills
+    folder = _skill(workspace, "notes")
+    _skill(local, "notes")
+    assert _where(resolver, "notes") == WORKSPACE
+    (folder / "SKILL.md").unlink()
+    assert _where(resolver, "notes") == LOCAL
+    (local / "notes" / "SKILL.md").unlink()
+    assert resolver.resolve("notes") is None
+    (folder / "SKILL.md").write_text("---\nname: notes\n---\n", encoding="utf-8")
+    assert _where(resolver, "notes") == WORKSPACE
+
+
+def test_renamed_and_deleted_folders(skills):
+    resolver, workspace, _ = skills
+    folder = _skill(workspace, "draft")
+    assert "draft" in resolver
+    folder.rename(workspace / "final")
+    assert "draft" not in resolver
+    assert _where(resolver, "final") == WORKSPACE
+    (workspace / "final" / "SKILL.md").rename(workspace / "final" / "README.md")
+    assert "final" not in resolver
+    assert [r.name for r in resolver] == []
@@ -0,0 +1,70 @@
+"""Socket handling of the catalog query server."""
+
+from __future__ import annotations
+
+import asyncio
+import errno
+import shutil
+import socket
+
+import pytest
+
+from catalog import server
+from catalog.parser import DEFAULT_README
+
+
+def _ping(path):
+    with server.Client(path) as client:
+        return client.ping()
+
+
+async def _started(path, readme):
+    task = asyncio.create_task(server.serve(path, readme))
+    # a dead socket file may already be there: wait until the server answers on it
+    while not server._listening(path):
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    return task
+
+
+def test_server_replaces_stale_socket_and_refuses_live_one(tmp_path):
+    path, readme = tmp_path / "catalog.sock", tmp_path / "README.md"
+    shutil.copy(DEFAULT_README, readme)
+    # a socket file nobody listens on, as left by a killed server
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as dead:
+        dead.bind(str(path))
+
+    async def run():
+        task = await _started(path, readme)
+        second = asyncio.create_task(server.serve(path, readme))
+        try:
+            with pytest.raises(OSError) as exc:
+                await asyncio.wait_for(second, 5)
+            assert exc.value.errno == errno.EADDRINUSE
+            return await asyncio.to_thread(_ping, path)
+        finally:
+            for t in (task, second):
+                t.cancel()
+            await asyncio.gather(task, second, return_exceptions=True)
+
+    assert asyncio.run(run())["entries"] > 0
+    assert not path.exists()
+
+
+def test_deleted_readme_is_an_error_response(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "RELOAD_INTERVAL", 0.0)
+    path, readme = tmp_path / "catalog.sock", tmp_path / "README.md"
+    shutil.copy(DEFAULT_README, readme)
+
+    async def run():
+        task = await _started(path, readme)
+        try:
+            readme.unlink()
+            with pytest.raises(server.ServerError):
+                await asyncio.to_thread(_ping, path)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
@@ -0,0 +1,22 @@
+"""Lookups through ``python -m catalog snapshot`` against a stale snapshot."""
+
+from __future__ import annotations
+
+import shutil
+
+from catalog.parser import DEFAULT_README
+from catalog.snapshot import main
+
+
+def test_lookup_refuses_a_stale_snapshot(tmp_path, capsys):
+    readme, snapshot = tmp_path / "README.md", str(tmp_path / "catalog.bin")
+    shutil.copy(DEFAULT_README, readme)
+    common = ["--readme", str(readme), "--snapshot", snapshot]
+    assert main(common + ["build"]) == 0
+    assert main(common + ["get", "github"]) == 0
+
+    readme.write_text(readme.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    capsys.readouterr()
+    assert main(common + ["get", "github"]) == 1
+    assert main(common + ["category", "Git & GitHub"]) == 1
+    assert "snapshot build" in capsys.readouterr().err
@@ -0,0 +1,33 @@
+"""FTS5 search over the SQLite export."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from catalog.parser import load
+from catalog.sqlite import export, fts_query, search
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    path = export(load(), tmp_path_factory.mktemp("sqlite") / "catalog.sqlite")
+    db = sqlite3.connect(path)
+    yield db
+    db.close()
+
+
+def test_plain_terms_are_quoted():
+    assert fts_query('foo-bar  say "hi"') == '"foo-bar" "say" """hi"""'
+
+
+def test_punctuation_is_searched_literally(db):
+    assert search(db, "foo-bar") == []
+    assert search(db, "c++")
+
+
+def test_raw_query_uses_fts5_syntax(db):
+    assert search(db, "name:pdf", raw=True)
+    with pytest.raises(sqlite3.OperationalError):
+        search(db, "foo-bar", raw=True)
@@ -0,0 +1,63 @@
+"""The content-addressed store behind installs."""
+
+from __future__ import annotations
+
+import os
+import stat
+
+from catalog.install import INSTALLED, MirrorSource, Target, install
+from catalog.store import Store, StoreSource
+
+from conftest import set_commit
+
+GITLAB = Target("gitlab", "a", "gitlab", "skills/a/gitlab")
+GITHUB = Target("github", "a", "github", "skills/a/github")
+
+
+def test_two_installs_share_the_stored_objects(mirror, tmp_path):
+    store = Store(tmp_path / "store")
+    source = StoreSource(store, MirrorSource(mirror))
+    first, second = tmp_path / "one" / "skills", tmp_path / "two" / "skills"
+    assert [r.status for r in install([GITLAB], source, first)] == [INSTALLED]
+    assert [r.status for r in install([GITLAB], source, second)] == [INSTALLED]
+    assert (source.fetched, source.reused) == (1, 1)
+
+    tree = store.tree(store.ref(GITLAB.path)[0])
+    for rel, digest, executable in tree.files:
+        stored = os.stat(store.object_path(digest, executable))
+        assert os.stat(first / "gitlab" / rel).st_ino == os.stat(second / "gitlab" / rel).st_ino == stored.st_ino
+        assert stored.st_nlink == 3
+        assert not stored.st_mode & stat.S_IWUSR
+    assert os.access(first / "gitlab" / "scripts" / "run.sh", os.X_OK)
+    assert os.readlink(second / "gitlab" / "run") == "scripts/run.sh"
+    assert store.stats()["linked"] == 2 * len(tree.files)
+
+
+def test_new_commit_is_fetched_again_and_identical_files_are_stored_once(mirror, tmp_path):
+    store = Store(tmp_path / "store")
+    dest = tmp_path / "skills"
+    install([GITHUB, GITLAB], StoreSource(store, MirrorSource(mirror)), dest)
+    objects = store.stats()["objects"]
+
+    set_commit(mirror, "2" * 40)
+    (mirror / "skills" / "a" / "github" / "SKILL.md").write_text("---\nname: github\n---\nv2\n", encoding="utf-8")
+    source = StoreSource(store, MirrorSource(mirror))
+    assert [r.status for r in install([GITHUB, GITLAB], source, dest, force=True)] == [INSTALLED] * 2
+    assert (source.fetched, source.reused) == (2, 0)
+    assert (dest / "github" / "SKILL.md").read_text(encoding="utf-8").endswith("v2\n")
+    # only the changed SKILL.md is a new object; gitlab's files were already stored
+    assert store.stats()["objects"] == objects + 1
+
+
+def test_gc_keeps_what_refs_reach(mirror, tmp_path):
+    store = Store(tmp_path / "store")
+    source = StoreSource(store, MirrorSource(mirror))
+    install([GITHUB, GITLAB], source, tmp_path / "skills")
+    (mirror / "skills" / "a" / "github" / "SKILL.md").write_text("---\nname: github\n---\nv2\n", encoding="utf-8")
+    set_commit(mirror, "2" * 40)
+    install([GITHUB], StoreSource(store, MirrorSource(mirror)), tmp_path / "skills", force=True)
+
+    assert store.gc() == (1, 1)
+    for target in (GITHUB, GITLAB):
+        tree = store.tree(store.ref(target.path)[0])
+        assert all(store.object_path(d, x).exists() for _, d, x in tree.files)
@@ -0,0 +1,75 @@
+"""Syncing README_zh.md entries from README.md."""
+
+from __future__ import annotations
+
+from catalog.parser import load
+from catalog.sync import sync
+
+from conftest import SKILLS
+
+GITHUB = f"- [github]({SKILLS}/a/github/SKILL.md) - Use gh."
+GITLAB = f"- [gitlab]({SKILLS}/a/gitlab/SKILL.md) - Use glab."
+GITEA = f"- [gitea]({SKILLS}/c/gitea/SKILL.md) - Use tea."
+
+
+def _replace(path, old: str, new: str) -> None:
+    text = path.read_bytes().decode()
+    assert old in text
+    path.write_bytes(text.replace(old, new).encode())
+
+
+def _names(path, category: int) -> list[str]:
+    catalog = load(path)
+    section = catalog.sections[category]
+    return [catalog.name_of(i) for i in range(section.first, section.stop)]
+
+
+def test_added_and_removed_entries(repo):
+    _replace(repo.readme, GITLAB, GITEA)
+    [git, notes] = sync(repo.readme, repo.readme_zh)
+    assert (git.added, git.removed, git.reordered) == (["gitea"], ["gitlab"], False)
+    assert not notes
+    assert _names(repo.readme_zh, 0) == ["github", "gitea"]
+    assert "发现 3 skills" in repo.readme_zh.read_text(encoding="utf-8")
+    assert not any(sync(repo.readme, repo.readme_zh))
+
+
+def test_translated_line_is_kept(repo):
+    _replace(repo.readme, "Vaults.", "Obsidian vaults.")
+    assert not any(sync(repo.readme, repo.readme_zh))
+    assert "笔记库。" in repo.readme_zh.read_text(encoding="utf-8")
+
+
+def test_reorder_is_written(repo):
+    _replace(repo.readme, f"{GITHUB}\n{GITLAB}", f"{GITLAB}\n{GITHUB}")
+    [git, _] = sync(repo.readme, repo.readme_zh)
+    assert git.reordered
+    assert _names(repo.readme_zh, 0) == ["gitlab", "github"]
+    assert not any(sync(repo.readme, repo.readme_zh))
+
+
+NOTE = "<!-- 译注：gitlab 需要 glab -->\n\n### 托管\n"
+
+
+def test_non_entry_lines_move_with_their_entry(repo):
+    _replace(repo.readme_zh, f"{GITHUB}\n{GITLAB}", f"{GITHUB}\n{NOTE}{GITLAB}")
+    _replace(repo.readme, f"{GITHUB}\n{GITLAB}", f"{GITLAB}\n{GITHUB}\n{GITEA}")
+    sync(repo.readme, repo.readme_zh)
+    assert f"{NOTE}{GITLAB}\n{GITHUB}\n{GITEA}\n" in repo.readme_zh.read_text(encoding="utf-8")
+
+
+def test_non_entry_lines_of_a_removed_entry_are_kept(repo):
+    _replace(repo.readme_zh, f"{GITHUB}\n{GITLAB}", f"{GITHUB}\n{NOTE}{GITLAB}")
+    _replace(repo.readme, f"\n{GITLAB}", "")
+    [git, _] = sync(repo.readme, repo.readme_zh)
+    assert git.removed == ["gitlab"]
+    assert f"{GITHUB}\n{NOTE}\n</details>" in repo.readme_zh.read_text(encoding="utf-8")
+
+
+def test_crlf_file_keeps_crlf(repo):
+    repo.readme_zh.write_bytes(repo.readme_zh.read_bytes().replace(b"\n", b"\r\n"))
+    _replace(repo.readme, GITLAB, f"{GITLAB}\n{GITEA}")
+    sync(repo.readme, repo.readme_zh)
+    buffer = repo.readme_zh.read_bytes()
+    assert buffer.count(b"\n") == buffer.count(b"\r\n")
+    assert _names(repo.readme_zh, 0) == ["github", "gitlab", "gitea"]